@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark: database cost of one scan cycle with N signals.
+
+Compares the old connect-per-call pattern (a fresh aiosqlite connection for
+every save/check) against the pooled connection owned by ``Database`` and the
+batched ``save_signals`` path (one transaction per cycle).
+
+Usage:
+    python scripts/benchmarks/bench_db_cycle.py --signals 10000
+"""
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from loguru import logger
+
+from src.core.database import Database
+from src.models.schemas import Signal, SignalType
+
+TICKERS = [f"T{i:03d}" for i in range(200)]
+SOURCES = [f"source_{i}" for i in range(50)]
+
+
+def make_signals(n: int) -> list:
+    rng = random.Random(42)
+    return [
+        Signal(
+            ticker=rng.choice(TICKERS),
+            signal_type=rng.choice(list(SignalType)),
+            source_name=rng.choice(SOURCES),
+            raw_text="benchmark signal text " * 5,
+            url="https://example.com/post",
+            confidence=0.7,
+        )
+        for _ in range(n)
+    ]
+
+
+async def cycle_connect_per_call(db_path: str, signals: list) -> None:
+    """Old behaviour: every call opens and closes its own connection."""
+    async def call(method, *args):
+        db = Database(db_path)
+        try:
+            return await getattr(db, method)(*args)
+        finally:
+            await db.close()
+
+    await call("init_tables")
+    for sig in signals:
+        await call("save_signal", sig)
+    recent = await call("get_recent_signals", 24)
+    for ticker in {s.ticker for s in recent}:
+        await call("is_alerted_recently", ticker)
+
+
+async def cycle_pooled(db_path: str, signals: list) -> None:
+    """New behaviour: one connection for the whole cycle."""
+    db = Database(db_path)
+    try:
+        await db.init_tables()
+        for sig in signals:
+            await db.save_signal(sig)
+        recent = await db.get_recent_signals(hours=24)
+        for ticker in {s.ticker for s in recent}:
+            await db.is_alerted_recently(ticker)
+    finally:
+        await db.close()
+
+
+async def cycle_batched(db_path: str, signals: list) -> None:
+    """Pooled connection plus one transaction for the whole batch."""
+    db = Database(db_path)
+    try:
+        await db.init_tables()
+        await db.save_signals(signals)
+        recent = await db.get_recent_signals(hours=24)
+        for ticker in {s.ticker for s in recent}:
+            await db.is_alerted_recently(ticker)
+    finally:
+        await db.close()
+
+
+async def run(n: int) -> None:
+    signals = make_signals(n)
+    for label, cycle in (("connect-per-call", cycle_connect_per_call), ("pooled", cycle_pooled),
+                         ("batched", cycle_batched)):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            db_path = os.path.join(tmp_dir, "bench.db")
+            start = time.perf_counter()
+            await cycle(db_path, signals)
+            elapsed = time.perf_counter() - start
+            print(f"{label:>18}: {elapsed:8.2f}s for {n} signals ({n / elapsed:,.0f} signals/s)")
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Database cycle cost")
+    parser.add_argument("--signals", type=int, default=10000, help="Signals per cycle")
+    args = parser.parse_args()
+
+    logger.remove()
+    asyncio.run(run(args.signals))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark: hot query latency on a large signals table.
+
+Seeds a database with N signals spread over the last 30 days (schema v1, no
+indexes), times the hot queries, applies the pending migrations via
+``Database.init_tables()`` and times them again.
+
+Usage:
+    python scripts/benchmarks/bench_db_queries.py --signals 1000000
+"""
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from loguru import logger
+
+from src.core.database import MIGRATIONS, Database
+
+TICKERS = [f"T{i:04d}" for i in range(2000)]
+SOURCES = [f"source_{i}" for i in range(100)]
+
+QUERIES = {
+    "dedupe lookup (ticker/source/time)": (
+        "SELECT ticker, source_name, MAX(timestamp) FROM signals "
+        "WHERE ticker IN (?) AND timestamp > ? GROUP BY ticker, source_name"
+    ),
+    "recent window (24h, count)": "SELECT COUNT(*) FROM signals WHERE timestamp > ?",
+    "alert check (ticker/time)": "SELECT id FROM alerts WHERE ticker = ? AND timestamp > ?",
+}
+
+
+def seed(db_path: str, n: int) -> None:
+    """Create a v1 (unindexed) database with n signals and n/100 alerts."""
+    rng = random.Random(7)
+    now = datetime.now()
+    conn = sqlite3.connect(db_path)
+    for statement in MIGRATIONS[0][2]:
+        conn.execute(statement)
+    conn.execute(f"PRAGMA user_version = {MIGRATIONS[0][0]}")
+
+    def rows(count):
+        for _ in range(count):
+            ts = now - timedelta(seconds=rng.randint(0, 30 * 86400))
+            yield (rng.choice(TICKERS), "BULLISH", rng.choice(SOURCES), "text",
+                   "https://example.com", ts.isoformat(sep=" "), 0.7)
+
+    conn.executemany(
+        "INSERT INTO signals (ticker, signal_type, source_name, raw_text, url, timestamp, confidence) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)", rows(n))
+    conn.executemany(
+        "INSERT INTO alerts (ticker, timestamp) VALUES (?, ?)",
+        ((rng.choice(TICKERS), (now - timedelta(seconds=rng.randint(0, 30 * 86400))).isoformat(sep=" "))
+         for _ in range(max(1, n // 100))))
+    conn.commit()
+    conn.close()
+
+
+async def time_queries(db: Database, repeats: int) -> dict:
+    conn = await db._get_conn()
+    now = datetime.now()
+    params = {
+        "dedupe lookup (ticker/source/time)": lambda: (random.choice(TICKERS), now - timedelta(hours=1)),
+        "recent window (24h, count)": lambda: (now - timedelta(hours=24),),
+        "alert check (ticker/time)": lambda: (random.choice(TICKERS), now - timedelta(hours=24)),
+    }
+    results = {}
+    for label, sql in QUERIES.items():
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            cursor = await conn.execute(sql, params[label]())
+            await cursor.fetchall()
+            samples.append((time.perf_counter() - start) * 1000)
+        results[label] = statistics.median(samples)
+    return results
+
+
+async def run(n: int, repeats: int) -> None:
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(tmp_dir, "bench.db")
+        print(f"Seeding {n:,} signals...")
+        seed(db_path, n)
+
+        db = Database(db_path)
+        before = await time_queries(db, repeats)
+        start = time.perf_counter()
+        await db.init_tables()
+        migrate_s = time.perf_counter() - start
+        after = await time_queries(db, repeats)
+        await db.close()
+
+        print(f"Migration to v{MIGRATIONS[-1][0]} took {migrate_s:.1f}s")
+        print(f"{'query':<38}{'before (ms)':>14}{'after (ms)':>14}")
+        for label in QUERIES:
+            print(f"{label:<38}{before[label]:>14.2f}{after[label]:>14.2f}")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hot query latency")
+    parser.add_argument("--signals", type=int, default=1_000_000, help="Rows to seed")
+    parser.add_argument("--repeats", type=int, default=20, help="Samples per query (median reported)")
+    args = parser.parse_args()
+
+    logger.remove()
+    asyncio.run(run(args.signals, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: signal extraction for many large fetch results.
+
+Runs extraction for N sources concurrently, the way ``Engine.run_cycle``
+does, and reports wall time plus the worst event-loop stall observed by a
+10 ms heartbeat task. "inline" is the old behaviour (regex work on the loop).
+
+Usage:
+    python scripts/benchmarks/bench_extraction.py --sources 200 --items 100
+    python scripts/benchmarks/bench_extraction.py --executor thread --workers 4
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from loguru import logger
+
+from src.core.extraction import ExtractionPool
+from src.models.schemas import Source, PlatformType
+
+WORDS = (
+    "NVDA AAPL TSLA $BTC 600519 the market buy sell breakout dump earnings guidance "
+    "看多 看空 突破 止损 today strong weak chips demand"
+).split()
+
+
+def make_raw(n_items: int, rng: random.Random) -> list:
+    return [
+        {"full_text": " ".join(rng.choice(WORDS) for _ in range(80)), "url": f"https://example.com/{i}"}
+        for i in range(n_items)
+    ]
+
+
+async def heartbeat(stop: asyncio.Event, stalls: list):
+    interval = 0.01
+    while not stop.is_set():
+        before = time.perf_counter()
+        await asyncio.sleep(interval)
+        stalls.append(time.perf_counter() - before - interval)
+
+
+async def run(pool: ExtractionPool, work: list) -> tuple:
+    stop, stalls = asyncio.Event(), []
+    beat = asyncio.create_task(heartbeat(stop, stalls))
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(pool.process(source, raw) for source, raw in work))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await beat
+    return elapsed, max(stalls, default=0.0), sum(len(r) for r in results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark off-loop signal extraction")
+    parser.add_argument("--sources", type=int, default=200, help="Concurrent sources")
+    parser.add_argument("--items", type=int, default=100, help="Items per source")
+    parser.add_argument("--executor", default="process", choices=["process", "thread"])
+    parser.add_argument("--workers", type=int, default=None, help="Pool size (default: CPU count)")
+    args = parser.parse_args()
+
+    logger.remove()
+    rng = random.Random(1)
+    work = [
+        (Source(name=f"S{i}", url=f"https://example.com/s{i}", platform=PlatformType.GENERIC),
+         make_raw(args.items, rng))
+        for i in range(args.sources)
+    ]
+
+    for label, pool in (
+        ("inline", ExtractionPool(executor="inline")),
+        (args.executor, ExtractionPool(executor=args.executor, max_workers=args.workers)),
+    ):
+        try:
+            elapsed, stall, signals = asyncio.run(run(pool, work))
+        finally:
+            pool.shutdown()
+        print(f"{label:8s} wall {elapsed:6.2f}s  max loop stall {stall * 1000:8.1f} ms  signals {signals}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark: fetching many pages from one host through GenericAdapter.
+
+Starts a local threaded HTTP server and compares a new AsyncClient per
+fetch (old behaviour) with one shared pooled client from
+``create_http_client``.
+
+Usage:
+    python scripts/benchmarks/bench_http_client.py --pages 500 --concurrency 20
+"""
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from loguru import logger
+
+from src.core.adapter_web import GenericAdapter
+from src.core.http_client import create_http_client
+from src.models.schemas import Source, PlatformType
+
+PAGE = ("<html><body>" + "<p>Buy $NVDA ahead of earnings, breakout expected soon</p>" * 20
+        + "</body></html>").encode()
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+async def fetch_all(sources, concurrency: int, client=None) -> float:
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(source):
+        async with sem:
+            return await GenericAdapter(source, client=client).fetch()
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one(s) for s in sources))
+    elapsed = time.perf_counter() - start
+    assert all(results), "some fetches failed"
+    return elapsed
+
+
+async def run(port: int, pages: int, concurrency: int):
+    sources = [
+        Source(name=f"P{i}", url=f"http://127.0.0.1:{port}/page/{i}", platform=PlatformType.GENERIC)
+        for i in range(pages)
+    ]
+    per_fetch = await fetch_all(sources, concurrency)
+
+    client = create_http_client({"http_timeout": 10})
+    try:
+        shared = await fetch_all(sources, concurrency, client=client)
+    finally:
+        await client.aclose()
+
+    print(f"client per fetch: {per_fetch:6.2f}s  ({pages / per_fetch:7.1f} pages/s)")
+    print(f"shared client:    {shared:6.2f}s  ({pages / shared:7.1f} pages/s, {per_fetch / shared:.1f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark shared vs per-fetch HTTP clients")
+    parser.add_argument("--pages", type=int, default=500, help="Pages to fetch")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent fetches")
+    args = parser.parse_args()
+
+    logger.remove()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        asyncio.run(run(server.server_address[1], args.pages, args.concurrency))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
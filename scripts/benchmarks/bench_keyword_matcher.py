@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sentiment keyword scoring over a synthetic tweet corpus.
+
+Compares the old approach (one ``re.search`` per keyword, 24 scans per text)
+with the single-pass ``KeywordMatcher`` used by ``SignalProcessor``.
+
+Usage:
+    python scripts/benchmarks/bench_keyword_matcher.py --tweets 100000
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from loguru import logger
+
+from src.core.processor import SignalProcessor
+
+FILLER = (
+    "the market today earnings guidance chips demand strong price going to be interesting "
+    "some people think this quarter is different 看好 财报 公司 今天 行情 市场 资金 机构"
+).split()
+
+
+def make_corpus(n: int) -> list:
+    rng = random.Random(1)
+    keywords = SignalProcessor.KEYWORDS_BULLISH + SignalProcessor.KEYWORDS_BEARISH
+    corpus = []
+    for _ in range(n):
+        words = [rng.choice(FILLER) for _ in range(rng.randint(10, 60))]
+        for _ in range(rng.randint(0, 3)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(keywords))
+        corpus.append(" ".join(words))
+    return corpus
+
+
+def legacy_score(text: str) -> int:
+    score = 0
+    text_lower = text.lower()
+    for kw in SignalProcessor.KEYWORDS_BULLISH:
+        if re.search(kw, text_lower):
+            score += 1
+    for kw in SignalProcessor.KEYWORDS_BEARISH:
+        if re.search(kw, text_lower):
+            score -= 1
+    return score
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sentiment keyword scoring")
+    parser.add_argument("--tweets", type=int, default=100_000, help="Corpus size")
+    args = parser.parse_args()
+
+    logger.remove()
+    corpus = make_corpus(args.tweets)
+    SignalProcessor._get_sentiment_matcher()  # Exclude one-time compile cost
+
+    start = time.perf_counter()
+    legacy = [legacy_score(t) for t in corpus]
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = [SignalProcessor._calculate_sentiment(t) for t in corpus]
+    compiled_s = time.perf_counter() - start
+
+    mismatches = sum(a != b for a, b in zip(legacy, compiled))
+    print(f"per-keyword re.search: {legacy_s:6.2f}s")
+    print(f"single-pass matcher:   {compiled_s:6.2f}s  ({legacy_s / compiled_s:.1f}x)")
+    print(f"score mismatches:      {mismatches} / {len(corpus)}")
+
+
+if __name__ == "__main__":
+    main()
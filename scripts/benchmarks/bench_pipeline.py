@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: time-to-first-alert and total cycle time of a scan cycle.
+
+Runs the engine against synthetic sources with skewed fetch latencies (most
+sources answer quickly, a few are very slow). Every source mentions a "HOT"
+ticker bullishly, so the fast sources alone already trigger a critical
+extreme-consensus alert. Compares the old barrier cycle (fetch everything,
+then save, then analyze) with the pipelined run_cycle stages.
+
+Usage:
+    python scripts/benchmarks/bench_pipeline.py --sources 40 --slow 4 --slow-seconds 5
+"""
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from loguru import logger
+
+import src.core.database as database
+from src.core.database import Database
+from src.core.diversity_analyzer import DiversityAnalyzer
+from src.core.engine import Engine
+from src.models.schemas import PlatformType, Signal, SignalType, Source
+
+TICKERS = [f"T{i:03d}" for i in range(100)]
+
+
+def make_engine(n_sources: int, n_slow: int, slow_seconds: float, per_source: int) -> Engine:
+    rng = random.Random(7)
+    engine = Engine()
+    engine.sources = [
+        Source(name=f"source_{i}", url=f"https://example.com/feed/{i}", platform=PlatformType.GENERIC)
+        for i in range(n_sources)
+    ]
+    engine.diversity_analyzer = DiversityAnalyzer(engine.sources)
+    latency = {
+        source.name: slow_seconds * rng.uniform(0.8, 1.0) if i < n_slow else rng.uniform(0.05, 0.3)
+        for i, source in enumerate(engine.sources)
+    }
+
+    async def fake_process(source: Source, db=None) -> tuple:
+        await asyncio.sleep(latency[source.name])
+        signals = [Signal(ticker="HOT", signal_type=SignalType.BULLISH, source_name=source.name,
+                          raw_text="HOT is going up", url="https://example.com/post")]
+        signals += [
+            Signal(ticker=rng.choice(TICKERS), signal_type=rng.choice(list(SignalType)),
+                   source_name=source.name, raw_text="benchmark signal", url="https://example.com/post")
+            for _ in range(per_source - 1)
+        ]
+        return signals, None
+
+    engine._process_source = fake_process
+    return engine
+
+
+def record_alert_times(engine: Engine, started: list, alert_times: list, alerted: set) -> None:
+    """Replace outbox delivery with a timestamp of each alert batch."""
+    async def emit(db, tickers, messages):
+        alert_times.append(time.perf_counter() - started[0])
+        alerted.update(tickers)
+        await db.record_alerts(tickers)
+
+    engine._emit_alerts = emit
+
+
+async def barrier_cycle(engine: Engine, db: Database) -> None:
+    """Old run_cycle: wait for every source, then save, then analyze."""
+    results = await asyncio.gather(*(engine._process_source(s, db) for s in engine.sources))
+    batch = [signal for signals, _ in results for signal in signals]
+    saved = await db.save_signals(batch)
+    new_signals = [sig for sig, is_new in zip(batch, saved) if is_new]
+    await engine._analyze_with_diversity(db, new_signals)
+
+
+async def pipelined_cycle(engine: Engine, db: Database) -> None:
+    await engine._run_pipeline(db)
+
+
+async def run(args: argparse.Namespace) -> None:
+    for label, cycle in (("barrier", barrier_cycle), ("pipeline", pipelined_cycle)):
+        tmp_dir = tempfile.mkdtemp()
+        database.DB_PATH = os.path.join(tmp_dir, "bench.db")
+        engine = make_engine(args.sources, args.slow, args.slow_seconds, args.per_source)
+        started, alert_times, alerted = [0.0], [], set()
+        record_alert_times(engine, started, alert_times, alerted)
+        db = Database()
+        try:
+            await db.init_tables()
+            started[0] = time.perf_counter()
+            await cycle(engine, db)
+            total = time.perf_counter() - started[0]
+            first = f"{alert_times[0]:6.2f}s" if alert_times else "  none"
+            print(f"{label:>9}: first alert {first}, cycle {total:6.2f}s, "
+                  f"{len(alerted)} tickers alerted in {len(alert_times)} batches")
+        finally:
+            await db.close()
+            await engine.close()
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark time-to-first-alert of a scan cycle")
+    parser.add_argument("--sources", type=int, default=40, help="Number of synthetic sources")
+    parser.add_argument("--slow", type=int, default=4, help="How many of them are slow")
+    parser.add_argument("--slow-seconds", type=float, default=5.0, help="Latency of a slow source")
+    parser.add_argument("--per-source", type=int, default=20, help="Signals per source")
+    args = parser.parse_args()
+
+    logger.remove()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
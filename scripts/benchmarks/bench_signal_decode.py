@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: decoding stored signal rows into ``Signal`` objects.
+
+Compares full pydantic validation against the trusted ``SignalRecord`` path
+used by ``Database.get_recent_signals``, both on raw row dicts and end to end
+through the database.
+
+Usage:
+    python scripts/benchmarks/bench_signal_decode.py --rows 100000
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from loguru import logger
+
+from src.core.database import Database
+
+
+def make_rows(n: int) -> list:
+    now = datetime.now()
+    return [
+        {
+            "ticker": f"T{i % 500:03d}",
+            "signal_type": ("BULLISH", "BEARISH", "NEUTRAL")[i % 3],
+            "source_name": f"source_{i % 50}",
+            "raw_text": "benchmark signal text " * 8,
+            "url": f"https://x.com/user/status/{i}",
+            "timestamp": (now - timedelta(seconds=i)).isoformat(sep=" "),
+            "confidence": 0.7,
+        }
+        for i in range(n)
+    ]
+
+
+def time_decode(rows: list, validate: bool) -> float:
+    start = time.perf_counter()
+    for row in rows:
+        Database._row_to_signal(row, validate)
+    return time.perf_counter() - start
+
+
+async def time_end_to_end(rows: list) -> dict:
+    tmp_dir = tempfile.mkdtemp()
+    db = Database(os.path.join(tmp_dir, "bench.db"))
+    try:
+        await db.init_tables()
+        conn = await db._get_conn()
+        await conn.executemany(
+            "INSERT INTO signals (ticker, signal_type, source_name, raw_text, url, timestamp, confidence) "
+            "VALUES (:ticker, :signal_type, :source_name, :raw_text, :url, :timestamp, :confidence)", rows)
+        await conn.commit()
+
+        results = {}
+        for label, validate in (("validated", True), ("fast", False)):
+            start = time.perf_counter()
+            signals = await db.get_recent_signals(hours=48, validate=validate)
+            results[label] = (time.perf_counter() - start, len(signals))
+        return results
+    finally:
+        await db.close()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark signal row decoding")
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows to decode")
+    args = parser.parse_args()
+
+    logger.remove()
+    rows = make_rows(args.rows)
+
+    full = time_decode(rows, validate=True)
+    fast = time_decode(rows, validate=False)
+    print(f"decode only  validated: {full:6.2f}s   fast: {fast:6.2f}s   ({full / fast:.1f}x)")
+
+    results = asyncio.run(time_end_to_end(rows))
+    (full_s, n), (fast_s, _) = results["validated"], results["fast"]
+    print(f"end to end   validated: {full_s:6.2f}s   fast: {fast_s:6.2f}s   ({full_s / fast_s:.1f}x, {n} rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,10 @@
 import logging
 import os
 import asyncio
-from datetime import datetime
 from telegram import Update
 from telegram.ext import ApplicationBuilder, ContextTypes, CommandHandler, MessageHandler, filters
 from loguru import logger
-from src.core.engine import Engine
+from src.core.engine_service import EngineService
 from src.models.schemas import PlatformType
 from src.core.database import Database
 from src.core.summarizer import Summarizer
@@ -17,10 +16,14 @@ log_file = config.logging.get('file', 'logs/bot.log')
 logger.add(log_file, rotation=config.logging.get('max_size', '10 MB'), retention=config.logging.get('backup_count', 7))
 
 # Global instances
-engine = Engine()
+service = EngineService()
 summarizer = Summarizer()
-last_scan_time = None
-is_scanning = False
+
+def _escape_md(text: str) -> str:
+    """Escape legacy Markdown control characters in user-provided names."""
+    for char in ('_', '*', '`', '['):
+        text = text.replace(char, f'\\{char}')
+    return text
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await help_command(update, context)
@@ -45,12 +48,12 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await context.bot.send_message(chat_id=update.effective_chat.id, text=help_text, parse_mode='Markdown')
 
 async def status(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    global last_scan_time
-    
     db = Database()
+    stats = None
     try:
-        recent_signals = await db.get_recent_signals(hours=24)
-        signal_count = len(recent_signals)
+        await db.init_tables()
+        stats = await db.get_signal_stats(hours=24)
+        signal_count = stats['total']
     except Exception as e:
         signal_count = f"Error: {e}"
     finally:
@@ -58,10 +61,21 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     msg = f"📊 *System Status*\n"
     msg += f"------------------\n"
-    msg += f"🕒 Last Scan: {last_scan_time.strftime('%H:%M:%S') if last_scan_time else 'Never'}\n"
-    msg += f"📡 Sources: {len(engine.sources) if engine.sources else 'Not loaded'}\n"
+    msg += f"🕒 Last Scan: {service.last_scan_time.strftime('%H:%M:%S') if service.last_scan_time else 'Never'}\n"
+    msg += f"📡 Sources: {len(service.sources) if service.sources else 'Not loaded'}\n"
+    next_due = service.source_scheduler.next_due_in()
+    if next_due is not None:
+        msg += f"⏭ Next Fetch: in {next_due:.0f}s\n"
     msg += f"📈 Signals (24h): {signal_count}\n"
-    msg += f"🏃 Status: {'Scanning...' if is_scanning else 'Idle'}"
+    if stats and stats['total']:
+        by_type = stats['by_type']
+        msg += f"   🟢 {by_type['BULLISH']}  🔴 {by_type['BEARISH']}  ⚪️ {by_type['NEUTRAL']}\n"
+        msg += f"   {stats['tickers']} tickers from {stats['sources']} sources\n"
+        top_tickers = ", ".join(f"{_escape_md(t)} ({n})" for t, n in stats['top_tickers'])
+        top_sources = ", ".join(f"{_escape_md(s)} ({n})" for s, n in stats['top_sources'])
+        msg += f"🔥 Top Tickers: {top_tickers}\n"
+        msg += f"🗣 Top Sources: {top_sources}\n"
+    msg += f"🏃 Status: {'Scanning...' if service.is_scanning else 'Idle'}"
     
     await context.bot.send_message(chat_id=update.effective_chat.id, text=msg, parse_mode='Markdown')
 
@@ -96,31 +110,32 @@ async def digest_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await db.close()
 
 async def scan_job(context: ContextTypes.DEFAULT_TYPE):
-    global last_scan_time, is_scanning
-    
     chat_id = context.job.chat_id if context.job and context.job.chat_id else os.getenv("TELEGRAM_CHAT_ID")
     
-    if is_scanning:
+    if service.is_scanning:
         if chat_id:
             await context.bot.send_message(chat_id=chat_id, text="⚠️ Scan already in progress.")
         return
 
-    is_scanning = True
     if chat_id:
         await context.bot.send_message(chat_id=chat_id, text="🚀 Starting Scan...")
     
     try:
-        engine.load_sources_from_memory()
-        await engine.run_cycle()
-        last_scan_time = datetime.now()
+        stats = await service.scan_all()
         if chat_id:
-            await context.bot.send_message(chat_id=chat_id, text="✅ Scan Complete.")
+            text = "✅ Scan Complete." if stats is not None else "⚠️ Scan already in progress."
+            await context.bot.send_message(chat_id=chat_id, text=text)
     except Exception as e:
         logger.exception("Scan failed")
         if chat_id:
             await context.bot.send_message(chat_id=chat_id, text=f"❌ Scan Failed: {str(e)}")
-    finally:
-        is_scanning = False
+
+async def tick_job(context: ContextTypes.DEFAULT_TYPE):
+    """Fetch the sources that are due; runs silently every tick."""
+    try:
+        await service.run_due()
+    except Exception:
+        logger.exception("Scheduled fetch failed")
 
 async def manual_scan(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await context.bot.send_message(chat_id=update.effective_chat.id, text="⏳ Queuing manual scan...")
@@ -147,10 +162,14 @@ async def add_source(update: Update, context: ContextTypes.DEFAULT_TYPE):
             f.write(f"| {name} | {url} | {platform} | 1.0 |\n")
         
         await context.bot.send_message(chat_id=update.effective_chat.id, text=f"✅ Added source: {name}")
-        engine.load_sources_from_memory()
+        service.reload_sources()
     except Exception as e:
         await context.bot.send_message(chat_id=update.effective_chat.id, text=f"❌ Failed to add: {e}")
 
+async def shutdown_service(application):
+    """Flush queued alerts and close the engine's connections on shutdown."""
+    await service.close()
+
 async def debug_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Sniffer function to find Chat IDs"""
     chat = update.effective_chat
@@ -171,7 +190,7 @@ if __name__ == '__main__':
         logger.error("No TELEGRAM_BOT_TOKEN found in env.")
         exit(1)
 
-    application = ApplicationBuilder().token(token).build()
+    application = ApplicationBuilder().token(token).post_shutdown(shutdown_service).build()
 
     application.add_handler(CommandHandler('start', start))
     application.add_handler(CommandHandler('help', help_command))
@@ -186,9 +205,13 @@ if __name__ == '__main__':
     # 从配置读取调度设置
     interval_minutes = config.scheduler.get('interval_minutes', 60)
     first_delay = config.scheduler.get('first_run_delay_seconds', 10)
+    adaptive = config.scheduler.get('adaptive') or {}
     target_chat_id = config.telegram.get('channel_id') or config.telegram.get('admin_chat_id')
     
-    if target_chat_id:
+    if adaptive.get('enabled', True):
+        # 按信源自适应调度：每个 tick 只抓取到期的信源
+        application.job_queue.run_repeating(tick_job, interval=adaptive.get('tick_seconds', 60), first=first_delay)
+    elif target_chat_id:
         application.job_queue.run_repeating(scan_job, interval=interval_minutes*60, first=first_delay, chat_id=target_chat_id)
     
     logger.info("🤖 Bot Runner Starting Polling...")
@@ -1,15 +1,31 @@
 import httpx
 from bs4 import BeautifulSoup
 from loguru import logger
-from typing import List
+from typing import List, Optional, Tuple
 from src.models.schemas import Source
 from src.core.fetcher import BaseAdapter
+from src.core.validator_cache import ValidatorCache
 
 class GenericAdapter(BaseAdapter):
     """
     Generic Web Scraper using HTTPX + BeautifulSoup.
     Target: Standard HTML pages (blogs, news sites).
+
+    Uses the shared pooled client when one is given; otherwise a throwaway
+    client is opened for the single request (e.g. the test-bird CLI).
+
+    With a ValidatorCache, requests are conditional and unchanged pages
+    return [] before parsing (same bytes) or before extraction (same text).
+    A changed page's validators are stored by commit(), after its signals
+    are saved.
     """
+    def __init__(self, source: Source, client: Optional[httpx.AsyncClient] = None,
+                 cache: Optional[ValidatorCache] = None):
+        super().__init__(source)
+        self.client = client
+        self.cache = cache
+        self._pending: Optional[Tuple] = None
+
     async def fetch(self) -> List[dict]:
         logger.info(f"🌐 Fetching generic web: {self.source.url}")
         
@@ -25,41 +41,75 @@ class GenericAdapter(BaseAdapter):
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             }
         
+        url = str(self.source.url)
+        if self.cache is not None:
+            headers.update(self.cache.conditional_headers(url))
+
         try:
-            async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-                resp = await client.get(str(self.source.url), headers=headers)
-                resp.raise_for_status()
-                
-                # Zero-Token Parsing: BeautifulSoup
-                soup = BeautifulSoup(resp.text, "lxml")
-                
-                # Heuristic: Extract all paragraph text. 
-                # In the future, we can use specific selectors from Source config.
-                # If specific selectors are provided in source, use them.
-                if self.source.selector_content:
-                    elements = soup.select(self.source.selector_content)
-                    texts = [e.get_text(strip=True) for e in elements]
-                else:
-                    # Fallback: Get all <p> text that is long enough
-                    texts = [p.get_text(strip=True) for p in soup.find_all("p") if len(p.get_text(strip=True)) > 20]
-                
-                combined_text = "\n".join(texts)
-                
-                if not combined_text:
-                    logger.warning(f"⚠️ No content extracted from {self.source.url}")
+            if self.client is not None:
+                resp = await self.client.get(url, headers=headers)
+            else:
+                async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
+                    resp = await client.get(url, headers=headers)
+
+            if resp.status_code == 304 and self.cache is not None:
+                self.cache.record_not_modified()
+                logger.debug(f"♻️ Not modified: {url}")
+                return []
+            resp.raise_for_status()
+
+            etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+            if self.cache is not None and self.cache.body_unchanged(url, etag, last_modified, resp.content):
+                logger.debug(f"♻️ Unchanged body: {url}")
+                return []
+
+            # Zero-Token Parsing: BeautifulSoup
+            soup = BeautifulSoup(resp.text, "lxml")
+            
+            # Heuristic: Extract all paragraph text. 
+            # In the future, we can use specific selectors from Source config.
+            # If specific selectors are provided in source, use them.
+            if self.source.selector_content:
+                elements = soup.select(self.source.selector_content)
+                texts = [e.get_text(strip=True) for e in elements]
+            else:
+                # Fallback: Get all <p> text that is long enough
+                texts = [p.get_text(strip=True) for p in soup.find_all("p") if len(p.get_text(strip=True)) > 20]
+            
+            combined_text = "\n".join(texts)
+            
+            if not combined_text:
+                logger.warning(f"⚠️ No content extracted from {self.source.url}")
+                if self.cache is not None:
+                    self.cache.store(url, etag, last_modified, resp.content)
+                return []
+
+            if self.cache is not None:
+                if self.cache.text_unchanged(url, combined_text):
+                    logger.debug(f"♻️ Unchanged content: {url}")
+                    self.cache.store(url, etag, last_modified, resp.content, combined_text)
                     return []
-                
-                # Wrap in a dict structure similar to Bird's output for consistency
-                return [{
-                    "full_text": combined_text,
-                    "url": str(self.source.url),
-                    "created_at": None # Generic web usually hard to parse date without specific selectors
-                }]
+                self._pending = (url, etag, last_modified, resp.content, combined_text)
+            
+            # Wrap in a dict structure similar to Bird's output for consistency
+            return [{
+                "full_text": combined_text,
+                "url": str(self.source.url),
+                "created_at": None # Generic web usually hard to parse date without specific selectors
+            }]
 
         except httpx.HTTPError as e:
             logger.error(f"❌ HTTP Error for {self.source.url}: {e}")
             # TODO: Trigger Playwright Fallback here
+            self.failed = True
             return []
         except Exception as e:
             logger.exception(f"❌ Unexpected error fetching {self.source.url}: {e}")
+            self.failed = True
             return []
+
+    async def commit(self) -> None:
+        """Store the validators of the page returned by the last fetch()."""
+        pending, self._pending = self._pending, None
+        if pending is not None and self.cache is not None:
+            self.cache.store(*pending)
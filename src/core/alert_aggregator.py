@@ -0,0 +1,149 @@
+"""
+Alert Aggregator - Per-Cycle Alert Digests
+
+Sending one Telegram message per flagged ticker means dozens of round trips
+on a noisy cycle and quickly runs into Telegram's flood limits. The
+AlertAggregator collects a cycle's MarketAlerts instead and packs them into
+as few digest messages as possible:
+
+- Alerts are grouped by severity (most severe first), then by alert type.
+- Groups are packed greedily into messages of at most `max_length`
+  characters; a group that does not fit continues in the next message
+  under a repeated "(cont.)" header.
+- A single alert longer than a message is cut with
+  ReportFormatter.truncate_text.
+
+Alerts whose severity is in `immediate_severities` (CRITICAL by default)
+are not held back; the engine sends them on their own straight away.
+The aggregator keeps one alert per ticker: a later alert for the same
+ticker (re-analyzed with more signals) replaces the earlier one.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+from loguru import logger
+
+from src.models.schemas import MarketAlert
+from src.utils.reporter import ReportBuilder, ReportFormatter
+
+SEVERITY_ORDER = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+SEVERITY_ICONS = {"CRITICAL": "🚨", "HIGH": "🔴", "MEDIUM": "🟠", "LOW": "🟢"}
+
+# Telegram rejects messages over 4096 characters; leave room for the
+# code block the Teleporter wraps every message in.
+MAX_MESSAGE_LENGTH = 4000
+
+DIGEST_FOOTER = "#OpenClaw #MarketSignal"
+
+
+def render_alert(alert: MarketAlert) -> str:
+    """One alert as a standalone Market Signal message."""
+    reason = f"{alert.description}\nTime: {alert.timestamp.strftime('%Y-%m-%d %H:%M')}"
+    return ReportBuilder.build_market_signal(signal=alert.headline, reason=reason, audit=alert.audit)
+
+
+def _render_entry(alert: MarketAlert) -> str:
+    lines = [f"• {alert.headline}"]
+    lines += [f"  {line}" for line in alert.description.splitlines() if line.strip()]
+    if alert.audit:
+        lines += [f"  {line}" for line in alert.audit.splitlines() if line.strip()]
+    return "\n".join(lines)
+
+
+def _severity_rank(severity: str) -> int:
+    try:
+        return SEVERITY_ORDER.index(severity.upper())
+    except ValueError:
+        return len(SEVERITY_ORDER)
+
+
+class AlertAggregator:
+    """Collects a cycle's alerts and packs them into digest messages."""
+
+    def __init__(
+        self,
+        max_length: int = MAX_MESSAGE_LENGTH,
+        immediate_severities: Iterable[str] = ("CRITICAL",),
+    ):
+        """
+        Args:
+            max_length: Maximum characters per digest message
+            immediate_severities: Severities sent individually, without waiting for the digest
+        """
+        self.max_length = max_length
+        self.immediate_severities = {s.upper() for s in immediate_severities}
+        self._alerts: Dict[str, MarketAlert] = {}
+
+    @classmethod
+    def from_config(cls, settings: Optional[Dict[str, Any]]) -> "AlertAggregator":
+        settings = settings or {}
+        return cls(
+            max_length=settings.get('max_length', MAX_MESSAGE_LENGTH),
+            immediate_severities=settings.get('immediate_severities', ("CRITICAL",)),
+        )
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def is_immediate(self, alert: MarketAlert) -> bool:
+        return alert.severity.upper() in self.immediate_severities
+
+    def add(self, alert: MarketAlert) -> None:
+        """Collect `alert`, replacing any earlier alert for the same ticker."""
+        self._alerts[alert.ticker] = alert
+
+    def tickers(self) -> List[str]:
+        """Tickers of the alerts collected so far."""
+        return list(self._alerts)
+
+    def flush(self, now: Optional[datetime] = None) -> List[str]:
+        """Digest messages for everything collected so far; clears the aggregator."""
+        alerts, self._alerts = list(self._alerts.values()), {}
+        if not alerts:
+            return []
+
+        groups: Dict[tuple, List[MarketAlert]] = defaultdict(list)
+        for alert in alerts:
+            groups[(_severity_rank(alert.severity), alert.severity.upper(), alert.alert_type)].append(alert)
+
+        stamp = (now or datetime.now()).strftime('%Y-%m-%d %H:%M')
+        # Longest possible header, so packing never overflows once parts are numbered
+        header_budget = len(self._header(len(alerts), stamp, 999, 999)) + len(DIGEST_FOOTER) + 4
+        body_limit = max(1, self.max_length - header_budget)
+
+        bodies: List[List[str]] = [[]]
+        used = 0
+        for key in sorted(groups):
+            _, severity, alert_type = key
+            members = groups[key]
+            title = f"{SEVERITY_ICONS.get(severity, '⚪️')} {severity} · {alert_type.replace('_', ' ')} ({len(members)})"
+            title_in_body = False
+            for alert in members:
+                entry = ReportFormatter.truncate_text(_render_entry(alert), max(1, body_limit - len(title) - 4))
+                block = entry if title_in_body else f"{title}\n{entry}"
+                if bodies[-1] and used + len(block) + 2 > body_limit:
+                    bodies.append([])
+                    used = 0
+                    title_in_body = False
+                    block = f"{title} (cont.)\n{entry}"
+                if not title_in_body and bodies[-1]:
+                    block = "\n" + block  # blank line between groups
+                bodies[-1].append(block)
+                used += len(block) + 1
+                title_in_body = True
+
+        total = len(bodies)
+        messages = []
+        for part, body in enumerate(bodies, start=1):
+            text = f"{self._header(len(alerts), stamp, part, total)}\n\n" + "\n".join(body) + f"\n\n{DIGEST_FOOTER}"
+            messages.append(ReportFormatter.truncate_text(text, self.max_length))
+        logger.info(f"📦 Packed {len(alerts)} alerts into {len(messages)} digest message(s)")
+        return messages
+
+    @staticmethod
+    def _header(count: int, stamp: str, part: int, total: int) -> str:
+        header = f"📊 **Signal Digest:** {count} alert{'s' if count != 1 else ''} · {stamp}"
+        if total > 1:
+            header += f" ({part}/{total})"
+        return header
@@ -0,0 +1,291 @@
+"""
+Bird - Persistent bird CLI Workers
+
+Every `bird` invocation pays Node startup and re-authentication. When a
+worker command is configured, BirdWorkerPool keeps that many long-lived
+worker processes and multiplexes requests over their stdin/stdout with a
+JSON-lines protocol:
+
+    request   {"id": 7, "args": ["user-tweets", "@vista8", "-n", "5", "--json"]}
+    record    {"id": 7, "item": {...tweet...}}      (zero or more)
+    end       {"id": 7, "done": true}  or  {"id": 7, "error": "message"}
+
+Responses for different ids may interleave. A worker that dies or stops
+answering is killed and restarted on the next request. A failed call
+raises BirdError after the records received so far, so callers can tell
+it from an empty timeline.
+
+The pool is opt-in: the bird CLI itself has no worker mode, and no worker
+ships with this repo. Set `advanced.bird.worker_command` to a program that
+keeps bird's client (Node runtime, auth session) loaded and speaks the
+protocol above on stdin/stdout; it runs with the same environment as bird
+(AUTH_TOKEN/CT0). Without a worker command (the default) the pool spawns
+`bird <args>` per call and streams its JSON output, which is the previous
+behaviour.
+"""
+
+import asyncio
+import itertools
+import json
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+from loguru import logger
+
+from src.core.json_stream import MAX_RECORD_BYTES, JSONStreamError, iter_json_records
+
+BIRD_BIN = "/opt/homebrew/bin/bird"
+
+_END = object()
+
+
+class BirdError(RuntimeError):
+    """A bird call failed (error reply, worker gone, bad output or non-zero exit)."""
+
+
+def bird_env() -> Dict[str, str]:
+    """Environment for bird, mapping BIRD_AUTH_TOKEN/BIRD_CT0 to what it expects."""
+    env = os.environ.copy()
+    if os.getenv("BIRD_AUTH_TOKEN"):
+        env["AUTH_TOKEN"] = os.getenv("BIRD_AUTH_TOKEN")
+    if os.getenv("BIRD_CT0"):
+        env["CT0"] = os.getenv("BIRD_CT0")
+    return env
+
+
+async def spawn_bird(bin_path: str, args: Sequence[str]) -> AsyncIterator[dict]:
+    """Run `bird <args>` once and yield JSON records as it prints them; raises BirdError on failure."""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            bin_path, *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=bird_env()
+        )
+    except Exception as e:
+        raise BirdError(f"could not run bird: {e}")
+
+    # Drain stderr concurrently so a chatty bird never blocks on a full pipe
+    stderr_task = asyncio.create_task(process.stderr.read())
+    completed = False
+    try:
+        # Bird outputs a JSON array or JSON lines depending on version/flags;
+        # records are passed on as soon as each one is complete.
+        async for record in iter_json_records(process.stdout):
+            if isinstance(record, dict):
+                yield record
+        completed = True
+    except JSONStreamError as e:
+        raise BirdError(f"unparseable output: {e}")
+    finally:
+        if not completed and process.returncode is None:
+            # Consumer stopped early or output was bad: don't leave bird running
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        stderr = await stderr_task
+        await process.wait()
+
+    if process.returncode != 0:
+        raise BirdError(f"exit status {process.returncode}: {stderr.decode(errors='replace').strip()}")
+
+
+class BirdWorker:
+    """One long-lived worker process with id-multiplexed requests."""
+
+    def __init__(self, command: Sequence[str]):
+        self.command = list(command)
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.pending: Dict[int, asyncio.Queue] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+
+    @property
+    def alive(self) -> bool:
+        return (
+            self.process is not None
+            and self.process.returncode is None
+            and self._loop is asyncio.get_running_loop()
+            # stdout EOF is seen before the exit status is reaped
+            and self._reader is not None
+            and not self._reader.done()
+        )
+
+    async def start(self) -> None:
+        self.kill()  # a previous process left behind by another event loop
+        self.pending.clear()
+        self.process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=bird_env(),
+            limit=MAX_RECORD_BYTES,
+        )
+        self._loop = asyncio.get_running_loop()
+        self._write_lock = asyncio.Lock()
+        self._reader = asyncio.create_task(self._read_loop())
+        logger.info(f"🐦 Started bird worker (pid {self.process.pid})")
+
+    async def _read_loop(self) -> None:
+        try:
+            while True:
+                line = await self.process.stdout.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring non-JSON line from bird worker: {line[:80]!r}")
+                    continue
+                queue = self.pending.get(message.get("id"))
+                if queue is not None:  # Unknown ids belong to abandoned requests
+                    queue.put_nowait(message)
+        except Exception as e:
+            logger.error(f"Bird worker reader failed: {e}")
+        finally:
+            # Worker is gone: fail whatever is still waiting on it
+            for queue in self.pending.values():
+                queue.put_nowait(_END)
+
+    async def request(self, request_id: int, args: Sequence[str], timeout: float) -> AsyncIterator[dict]:
+        queue: asyncio.Queue = asyncio.Queue()
+        self.pending[request_id] = queue
+        try:
+            if self._reader is None or self._reader.done():
+                raise BirdError("bird worker has exited")
+            payload = json.dumps({"id": request_id, "args": list(args)}) + "\n"
+            try:
+                async with self._write_lock:
+                    self.process.stdin.write(payload.encode())
+                    await self.process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError) as e:
+                raise BirdError(f"bird worker is not accepting requests: {e}")
+
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    self.kill()
+                    raise BirdError(f"bird worker did not answer within {timeout:.0f}s")
+                if message is _END:
+                    raise BirdError("bird worker exited mid-request")
+                if "item" in message:
+                    if isinstance(message["item"], dict):
+                        yield message["item"]
+                elif message.get("error"):
+                    raise BirdError(str(message["error"]))
+                elif message.get("done"):
+                    return
+        finally:
+            self.pending.pop(request_id, None)
+
+    def kill(self) -> None:
+        if self.process is not None and self.process.returncode is None:
+            try:
+                self.process.kill()
+            except ProcessLookupError:
+                pass
+
+    async def close(self) -> None:
+        process, self.process = self.process, None
+        if process is None:
+            return
+        if self._loop is not asyncio.get_running_loop():
+            process.kill()
+            return
+        if process.returncode is None:
+            try:
+                process.stdin.close()
+                await asyncio.wait_for(process.wait(), timeout=2)
+            except (asyncio.TimeoutError, RuntimeError):
+                process.kill()
+                await process.wait()
+        if self._reader is not None:
+            await self._reader
+
+
+class BirdWorkerPool:
+    """Routes bird calls to persistent workers, or spawns bird per call."""
+
+    def __init__(
+        self,
+        worker_command: Optional[Sequence[str]] = None,
+        workers: int = 1,
+        bin_path: str = BIRD_BIN,
+        request_timeout: float = 60.0,
+    ):
+        """
+        Args:
+            worker_command: argv of a worker speaking the JSON-lines protocol;
+                None means spawn `bin_path <args>` per call
+            workers: Number of worker processes
+            bin_path: bird executable for the per-call fallback
+            request_timeout: Max seconds between messages of one request
+        """
+        self.worker_command = list(worker_command) if worker_command else None
+        self.bin_path = bin_path
+        self.request_timeout = request_timeout
+        self._workers: List[BirdWorker] = (
+            [BirdWorker(self.worker_command) for _ in range(max(1, workers))] if self.worker_command else []
+        )
+        self._ids = itertools.count(1)
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._start_failed = False
+
+    @classmethod
+    def from_config(cls, settings: Optional[Dict[str, Any]], bin_path: str = BIRD_BIN) -> "BirdWorkerPool":
+        settings = settings or {}
+        command = settings.get('worker_command')
+        if isinstance(command, str):
+            command = command.split()
+        return cls(
+            worker_command=command,
+            workers=settings.get('workers', 1),
+            bin_path=settings.get('bin_path', bin_path),
+            request_timeout=settings.get('request_timeout', 60.0),
+        )
+
+    @property
+    def persistent(self) -> bool:
+        return bool(self._workers) and not self._start_failed
+
+    async def _pick_worker(self) -> Optional[BirdWorker]:
+        """Least-busy live worker, (re)starting dead ones; None if workers can't start."""
+        loop = asyncio.get_running_loop()
+        if self._lock_loop is not loop:
+            self._start_lock, self._lock_loop = asyncio.Lock(), loop
+        async with self._start_lock:
+            for worker in self._workers:
+                if not worker.alive:
+                    try:
+                        await worker.start()
+                    except Exception as e:
+                        logger.warning(f"⚠️ Could not start bird worker ({e}), spawning bird per call")
+                        self._start_failed = True
+                        return None
+        return min(self._workers, key=lambda w: len(w.pending))
+
+    async def run(self, args: Sequence[str]) -> AsyncIterator[dict]:
+        """
+        Yield JSON records for one bird call (`args` as on the bird command line).
+
+        Raises BirdError if the call fails, after any records already yielded.
+        """
+        worker = await self._pick_worker() if self.persistent else None
+        try:
+            if worker is None:
+                async for record in spawn_bird(self.bin_path, args):
+                    yield record
+            else:
+                async for record in worker.request(next(self._ids), args, self.request_timeout):
+                    yield record
+        except BirdError as e:
+            logger.error(f"Bird call {' '.join(args)} failed: {e}")
+            raise
+
+    async def close(self) -> None:
+        for worker in self._workers:
+            await worker.close()
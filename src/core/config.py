@@ -34,7 +34,16 @@ class Config:
             },
             'scheduler': {
                 'interval_minutes': 60,
-                'first_run_delay_seconds': 10
+                'first_run_delay_seconds': 10,
+                'adaptive': {
+                    'enabled': True,
+                    'tick_seconds': 60,
+                    'min_interval_minutes': 5,
+                    'max_interval_minutes': 360,
+                    'target_new_signals': 1.0,
+                    'ewma_alpha': 0.3,
+                    'jitter': 0.1
+                }
             },
             'sources': {
                 'list': [
@@ -46,9 +55,10 @@ class Config:
             },
             'signal_processing': {
                 'blacklist': ['API', 'GUI', 'CLI', 'GPT', 'LLM', 'SDK', 'HTTP', 'WWW'],
+                'ticker_universe': 'config/tickers.txt',
                 'keywords': {
-                    'bullish': ['买入', '看多', '加仓', '突破', '目标价', '起飞', 'buy', 'long', 'moon'],
-                    'bearish': ['卖出', '看空', '减仓', '跌破', '止损', '崩盘', 'sell', 'short', 'dump']
+                    'bullish': ['买入', '看多', '加仓', '突破', '目标价', '起飞', 'buy', 'long', 'call', 'breakout', 'moon', 'bull'],
+                    'bearish': ['卖出', '看空', '减仓', '跌破', '止损', '崩盘', 'sell', 'short', 'put', 'breakdown', 'dump', 'bear']
                 }
             },
             'ai_summary': {
@@ -71,8 +81,59 @@ class Config:
             },
             'advanced': {
                 'http_timeout': 10,
+                'http_max_connections': 100,
+                'http_max_keepalive': 20,
+                'http2': True,
                 'database_path': 'memory/signals.db',
-                'graceful_shutdown_timeout': 5
+                'graceful_shutdown_timeout': 5,
+                'twitter_fetch_depth': {'min': 5, 'max': 100},
+                'bird': {
+                    'bin_path': '/opt/homebrew/bin/bird',
+                    'worker_command': None,
+                    'workers': 2,
+                    'request_timeout': 60
+                },
+                'fetch': {
+                    'max_concurrency': 16,
+                    'platform_limits': {'twitter': 4, 'generic': 8, 'substack': 4, 'wechat': 1},
+                    'host_rate': 2.0,
+                    'host_burst': 2,
+                    'host_rates': {'weixin.sogou.com': 0.2}
+                },
+                'extraction': {
+                    'executor': 'process',
+                    'max_workers': None,
+                    'batch_size': 50,
+                    'inline_max_chars': 20000
+                },
+                'telegram_queue': {
+                    'workers': 2,
+                    'max_size': 1000,
+                    'global_rate': 25.0,
+                    'chat_rate': 0.33,
+                    'chat_burst': 3,
+                    'max_attempts': 5,
+                    'max_backoff': 60,
+                    'timeout': 30,
+                    'drain_timeout': 30
+                },
+                'alerts': {
+                    'digest': True,
+                    'immediate_severities': ['CRITICAL'],
+                    'max_length': 4000
+                },
+                'outbox': {
+                    'poll_interval': 30,
+                    'batch_size': 50,
+                    'max_attempts': 10,
+                    'retry_base': 60,
+                    'retry_max': 3600,
+                    'keep_days': 7
+                },
+                'pipeline': {
+                    'queue_size': 64,
+                    'early_analysis': True
+                }
             }
         }
     
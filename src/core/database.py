@@ -1,136 +1,494 @@
+import asyncio
+import os
 import aiosqlite
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 from loguru import logger
-from src.models.schemas import Signal, SignalType
+from src.models.schemas import OutboxMessage, Signal, SignalRecord, SignalType, SourceCursor
 
 DB_PATH = "memory/signals.db"
 
+# Applied once per connection. WAL lets readers (e.g. /status) run while a
+# scan cycle is writing; NORMAL sync is durable across app crashes in WAL mode.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",      # ~16 MB page cache
+    "PRAGMA mmap_size=134217728",    # 128 MB memory-mapped I/O
+    "PRAGMA busy_timeout=5000",
+)
+
+_SIGNAL_TYPES = {t.value: t for t in SignalType}
+
+# Keep IN (...) lists well below SQLite's bound-parameter limit.
+SQL_IN_CHUNK = 500
+
+# Schema migrations as (version, description, statements), applied in order by
+# init_tables() and tracked with PRAGMA user_version. Append new entries only;
+# never edit a migration that has shipped.
+MIGRATIONS = [
+    (1, "create signals and alerts tables", [
+        '''
+        CREATE TABLE IF NOT EXISTS signals (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ticker TEXT NOT NULL,
+            signal_type TEXT NOT NULL,
+            source_name TEXT NOT NULL,
+            raw_text TEXT,
+            url TEXT,
+            timestamp DATETIME,
+            confidence REAL
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS alerts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ticker TEXT NOT NULL,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+    ]),
+    (2, "index hot signal and alert lookups", [
+        # Covers the ticker/source duplicate lookup in save_signals
+        "CREATE INDEX IF NOT EXISTS idx_signals_ticker_source_ts ON signals (ticker, source_name, timestamp)",
+        # Time-window scans (get_recent_signals)
+        "CREATE INDEX IF NOT EXISTS idx_signals_timestamp ON signals (timestamp)",
+        # Covers is_alerted_recently
+        "CREATE INDEX IF NOT EXISTS idx_alerts_ticker_ts ON alerts (ticker, timestamp)",
+    ]),
+    (3, "add per-source fetch cursors", [
+        '''
+        CREATE TABLE IF NOT EXISTS source_cursors (
+            source_name TEXT PRIMARY KEY,
+            last_seen_id TEXT,
+            fetch_depth INTEGER,
+            updated_at DATETIME
+        )
+        ''',
+    ]),
+    (4, "add durable alert outbox", [
+        '''
+        CREATE TABLE IF NOT EXISTS outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            idempotency_key TEXT NOT NULL UNIQUE,
+            chat_id TEXT NOT NULL,
+            message TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at DATETIME,
+            created_at DATETIME,
+            sent_at DATETIME
+        )
+        ''',
+        # Covers get_pending_outbox
+        "CREATE INDEX IF NOT EXISTS idx_outbox_status_next ON outbox (status, next_attempt_at)",
+    ]),
+]
+
 class Database:
-    """Async SQLite database manager using aiosqlite."""
-    
+    """Async SQLite database manager using aiosqlite.
+
+    Owns a single long-lived connection (one aiosqlite worker thread) that is
+    opened lazily on first use and released by ``close()``.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or DB_PATH
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._connect_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+
+    async def _get_conn(self) -> aiosqlite.Connection:
+        """Return the shared connection, opening it on first use."""
+        if self._conn is not None:
+            return self._conn
+        async with self._connect_lock:
+            if self._conn is None:
+                db_dir = os.path.dirname(self.db_path)
+                if db_dir:
+                    os.makedirs(db_dir, exist_ok=True)
+                conn = await aiosqlite.connect(self.db_path)
+                conn.row_factory = aiosqlite.Row
+                for pragma in PRAGMAS:
+                    await conn.execute(pragma)
+                self._conn = conn
+                logger.debug(f"Opened database connection: {self.db_path}")
+        return self._conn
+
     async def init_tables(self):
-        """Initialize database tables."""
-        async with aiosqlite.connect(DB_PATH) as conn:
-            conn.row_factory = aiosqlite.Row
-            # Signals Table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS signals (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    ticker TEXT NOT NULL,
-                    signal_type TEXT NOT NULL,
-                    source_name TEXT NOT NULL,
-                    raw_text TEXT,
-                    url TEXT,
-                    timestamp DATETIME,
-                    confidence REAL
-                )
-            ''')
-            # Alerts Table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS alerts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    ticker TEXT NOT NULL,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            await conn.commit()
-            logger.debug("Database tables initialized")
-    
+        """Initialize database tables, applying any pending schema migrations."""
+        conn = await self._get_conn()
+        async with self._write_lock:
+            cursor = await conn.execute("PRAGMA user_version")
+            current = (await cursor.fetchone())[0]
+            for version, description, statements in MIGRATIONS:
+                if version <= current:
+                    continue
+                logger.info(f"🗄️ Migrating database to v{version}: {description}")
+                try:
+                    await conn.execute("BEGIN")
+                    for statement in statements:
+                        await conn.execute(statement)
+                    # PRAGMA does not accept bound parameters; version is an int literal
+                    await conn.execute(f"PRAGMA user_version = {int(version)}")
+                    await conn.commit()
+                except Exception:
+                    await conn.rollback()
+                    raise
+        logger.debug("Database tables initialized")
+
     async def save_signal(self, signal: Signal) -> bool:
         """Save signal to database. Returns True if saved, False if duplicate."""
+        return (await self.save_signals([signal]))[0]
+
+    async def save_signals(self, signals: List[Signal], strict: bool = False) -> List[bool]:
+        """
+        Save a batch of signals in a single transaction.
+
+        A signal is a duplicate if the same ticker/source already has a signal
+        within the hour before it (in the database or earlier in the batch).
+
+        Returns:
+            One flag per input signal: True if saved, False if duplicate.
+            If the save fails the error is logged and every flag is False,
+            unless `strict` is set, in which case the error is raised.
+        """
+        if not signals:
+            return []
+
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                conn.row_factory = aiosqlite.Row
-                # Check for duplicates
-                cursor = await conn.execute('''
-                    SELECT id FROM signals 
-                    WHERE ticker = ? AND source_name = ? 
-                    AND timestamp > datetime(?, '-1 hour')
-                ''', (signal.ticker, signal.source_name, signal.timestamp))
-                
-                if await cursor.fetchone():
-                    return False  # Skip duplicate
-                
-                # Insert signal
-                await conn.execute('''
-                    INSERT INTO signals (ticker, signal_type, source_name, raw_text, url, timestamp, confidence)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    signal.ticker,
-                    signal.signal_type.value,
-                    signal.source_name,
-                    signal.raw_text,
-                    str(signal.url),
-                    signal.timestamp,
-                    signal.confidence
-                ))
-                await conn.commit()
-                logger.debug(f"Saved signal: {signal.ticker} from {signal.source_name}")
-                return True
-                
+            conn = await self._get_conn()
+            async with self._write_lock:
+                # Fetch the latest stored timestamp per ticker/source for the
+                # whole batch up front; the rest of the dedupe is in memory.
+                window_start = min(s.timestamp for s in signals) - timedelta(hours=1)
+                tickers = sorted({s.ticker for s in signals})
+                latest = {}
+                for i in range(0, len(tickers), SQL_IN_CHUNK):
+                    chunk = tickers[i:i + SQL_IN_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor = await conn.execute(f'''
+                        SELECT ticker, source_name, MAX(timestamp) AS latest FROM signals
+                        WHERE ticker IN ({placeholders}) AND timestamp > ?
+                        GROUP BY ticker, source_name
+                    ''', (*chunk, window_start))
+                    for row in await cursor.fetchall():
+                        ts = row['latest']
+                        latest[(row['ticker'], row['source_name'])] = (
+                            datetime.fromisoformat(ts) if isinstance(ts, str) else ts
+                        )
+
+                saved = []
+                rows = []
+                for signal in signals:
+                    key = (signal.ticker, signal.source_name)
+                    last = latest.get(key)
+                    if last is not None and last > signal.timestamp - timedelta(hours=1):
+                        saved.append(False)  # Skip duplicate
+                        continue
+                    latest[key] = signal.timestamp if last is None else max(last, signal.timestamp)
+                    saved.append(True)
+                    rows.append((
+                        signal.ticker,
+                        signal.signal_type.value,
+                        signal.source_name,
+                        signal.raw_text,
+                        str(signal.url),
+                        signal.timestamp,
+                        signal.confidence
+                    ))
+
+                if rows:
+                    try:
+                        await conn.executemany('''
+                            INSERT INTO signals (ticker, signal_type, source_name, raw_text, url, timestamp, confidence)
+                            VALUES (?, ?, ?, ?, ?, ?, ?)
+                        ''', rows)
+                        await conn.commit()
+                    except Exception:
+                        await conn.rollback()
+                        raise
+            logger.debug(f"Saved {len(rows)}/{len(signals)} signals ({len(signals) - len(rows)} duplicates)")
+            return saved
+
         except Exception as e:
-            logger.error(f"Error saving signal: {e}")
-            return False
-    
-    async def get_recent_signals(self, hours: int = 24) -> List[Signal]:
-        """Get signals from last N hours."""
+            logger.error(f"Error saving signals: {e}")
+            if strict:
+                raise
+            return [False] * len(signals)
+
+    @staticmethod
+    def _row_to_signal(row, validate: bool = False) -> Union[Signal, SignalRecord]:
+        """
+        Decode a signals row.
+
+        Rows were validated when they were written, so by default they are
+        returned as slotted SignalRecord objects without re-validating
+        HttpUrl/enum/range constraints. Pass ``validate=True`` for Signal models.
+        """
+        timestamp = row['timestamp']
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        if validate:
+            return Signal(
+                ticker=row['ticker'],
+                signal_type=SignalType(row['signal_type']),
+                source_name=row['source_name'],
+                raw_text=row['raw_text'],
+                url=row['url'],
+                timestamp=timestamp,
+                confidence=row['confidence']
+            )
+        return SignalRecord(
+            row['ticker'],
+            _SIGNAL_TYPES[row['signal_type']],
+            row['source_name'],
+            row['raw_text'],
+            row['url'],
+            timestamp,
+            row['confidence']
+        )
+
+    async def get_recent_signals(self, hours: int = 24, validate: bool = False) -> List[Union[Signal, SignalRecord]]:
+        """Get signals from last N hours (SignalRecord rows unless validate=True)."""
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                conn.row_factory = aiosqlite.Row
-                time_threshold = datetime.now() - timedelta(hours=hours)
-                
-                cursor = await conn.execute('''
-                    SELECT * FROM signals 
-                    WHERE timestamp > ? 
-                    ORDER BY timestamp DESC
-                ''', (time_threshold,))
-                
-                rows = await cursor.fetchall()
-                signals = []
-                for row in rows:
-                    signals.append(Signal(
-                        ticker=row['ticker'],
-                        signal_type=SignalType(row['signal_type']),
-                        source_name=row['source_name'],
-                        raw_text=row['raw_text'],
-                        url=row['url'],
-                        timestamp=datetime.fromisoformat(row['timestamp']) if isinstance(row['timestamp'], str) else row['timestamp'],
-                        confidence=row['confidence']
-                    ))
-                return signals
-                
+            conn = await self._get_conn()
+            time_threshold = datetime.now() - timedelta(hours=hours)
+
+            cursor = await conn.execute('''
+                SELECT ticker, signal_type, source_name, raw_text, url, timestamp, confidence
+                FROM signals
+                WHERE timestamp > ?
+                ORDER BY timestamp DESC
+            ''', (time_threshold,))
+
+            rows = await cursor.fetchall()
+            return [self._row_to_signal(row, validate) for row in rows]
+
         except Exception as e:
             logger.error(f"Error getting signals: {e}")
             return []
-    
+
+    async def get_signal_stats(self, hours: int = 24, top_n: int = 5) -> Dict[str, Any]:
+        """
+        Aggregate signal stats for the last N hours, computed entirely in SQL.
+
+        Returns:
+            Dict with ``total``, ``tickers``/``sources`` (distinct counts),
+            ``by_type`` ({signal_type: count}) and ``top_tickers``/``top_sources``
+            (lists of (name, count), at most ``top_n`` each); all zero/empty
+            if the query fails.
+        """
+        try:
+            conn = await self._get_conn()
+            time_threshold = datetime.now() - timedelta(hours=hours)
+
+            cursor = await conn.execute('''
+                SELECT COUNT(*) AS total,
+                       COUNT(DISTINCT ticker) AS tickers,
+                       COUNT(DISTINCT source_name) AS sources
+                FROM signals WHERE timestamp > ?
+            ''', (time_threshold,))
+            row = await cursor.fetchone()
+            stats: Dict[str, Any] = {
+                'total': row['total'],
+                'tickers': row['tickers'],
+                'sources': row['sources'],
+            }
+
+            cursor = await conn.execute('''
+                SELECT signal_type, COUNT(*) AS n FROM signals
+                WHERE timestamp > ? GROUP BY signal_type
+            ''', (time_threshold,))
+            by_type = {t.value: 0 for t in SignalType}
+            by_type.update({r['signal_type']: r['n'] for r in await cursor.fetchall()})
+            stats['by_type'] = by_type
+
+            for key, column in (('top_tickers', 'ticker'), ('top_sources', 'source_name')):
+                cursor = await conn.execute(f'''
+                    SELECT {column} AS name, COUNT(*) AS n FROM signals
+                    WHERE timestamp > ? GROUP BY {column}
+                    ORDER BY n DESC, name LIMIT ?
+                ''', (time_threshold, top_n))
+                stats[key] = [(r['name'], r['n']) for r in await cursor.fetchall()]
+
+            return stats
+
+        except Exception as e:
+            logger.error(f"Error getting signal stats: {e}")
+            return {
+                'total': 0, 'tickers': 0, 'sources': 0,
+                'by_type': {t.value: 0 for t in SignalType},
+                'top_tickers': [], 'top_sources': [],
+            }
+
     async def is_alerted_recently(self, ticker: str, hours: int = 24) -> bool:
         """Check if ticker was alerted recently."""
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                conn.row_factory = aiosqlite.Row
-                time_threshold = datetime.now() - timedelta(hours=hours)
-                cursor = await conn.execute('''
-                    SELECT id FROM alerts 
-                    WHERE ticker = ? AND timestamp > ?
-                ''', (ticker, time_threshold))
-                return await cursor.fetchone() is not None
+            conn = await self._get_conn()
+            time_threshold = datetime.now() - timedelta(hours=hours)
+            cursor = await conn.execute('''
+                SELECT id FROM alerts
+                WHERE ticker = ? AND timestamp > ?
+            ''', (ticker, time_threshold))
+            return await cursor.fetchone() is not None
         except Exception as e:
             logger.error(f"Error checking alert status: {e}")
             return False
-    
+
+    async def get_recently_alerted(self, tickers: Iterable[str], hours: int = 24) -> Set[str]:
+        """Return the subset of tickers that were alerted within the last N hours."""
+        tickers = sorted(set(tickers))
+        if not tickers:
+            return set()
+        try:
+            conn = await self._get_conn()
+            time_threshold = datetime.now() - timedelta(hours=hours)
+            alerted = set()
+            for i in range(0, len(tickers), SQL_IN_CHUNK):
+                chunk = tickers[i:i + SQL_IN_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = await conn.execute(f'''
+                    SELECT DISTINCT ticker FROM alerts
+                    WHERE ticker IN ({placeholders}) AND timestamp > ?
+                ''', (*chunk, time_threshold))
+                alerted.update(row['ticker'] for row in await cursor.fetchall())
+            return alerted
+        except Exception as e:
+            logger.error(f"Error checking alert status: {e}")
+            return set()
+
     async def record_alert(self, ticker: str) -> None:
         """Record that alert was sent for ticker."""
+        await self.record_alerts([ticker])
+
+    async def record_alerts(self, tickers: Iterable[str], outbox: Iterable[OutboxMessage] = ()) -> bool:
+        """
+        Record alerts for tickers and queue their messages in the outbox.
+
+        Both are written in one transaction, so an alert is never marked as
+        sent without its message being durably queued (and vice versa).
+        Outbox rows whose idempotency key already exists are ignored.
+        Returns False if nothing was written.
+        """
+        now = datetime.now()
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                await conn.execute(
-                    'INSERT INTO alerts (ticker, timestamp) VALUES (?, ?)',
-                    (ticker, datetime.now())
-                )
-                await conn.commit()
+            conn = await self._get_conn()
+            async with self._write_lock:
+                try:
+                    await conn.executemany(
+                        'INSERT INTO alerts (ticker, timestamp) VALUES (?, ?)',
+                        [(ticker, now) for ticker in tickers]
+                    )
+                    await conn.executemany('''
+                        INSERT OR IGNORE INTO outbox
+                            (idempotency_key, chat_id, message, status, attempts, next_attempt_at, created_at)
+                        VALUES (?, ?, ?, 'pending', 0, ?, ?)
+                    ''', [(m.idempotency_key, m.chat_id, m.message, now, now) for m in outbox])
+                    await conn.commit()
+                except Exception:
+                    await conn.rollback()
+                    raise
+            return True
         except Exception as e:
             logger.error(f"Error recording alert: {e}")
-    
+            return False
+
+    async def get_pending_outbox(self, limit: int = 50, now: Optional[datetime] = None) -> List[OutboxMessage]:
+        """Outbox messages due for a (re)send, oldest first."""
+        try:
+            conn = await self._get_conn()
+            cursor = await conn.execute('''
+                SELECT id, idempotency_key, chat_id, message, attempts FROM outbox
+                WHERE status = 'pending' AND next_attempt_at <= ?
+                ORDER BY id LIMIT ?
+            ''', (now or datetime.now(), limit))
+            rows = await cursor.fetchall()
+        except Exception as e:
+            logger.error(f"Error reading outbox: {e}")
+            return []
+        return [
+            OutboxMessage(row['idempotency_key'], row['chat_id'], row['message'], row['attempts'], row['id'])
+            for row in rows
+        ]
+
+    async def mark_outbox_sent(self, idempotency_key: str) -> None:
+        """Mark an outbox message as delivered."""
+        await self._update_outbox(
+            "UPDATE outbox SET status = 'sent', attempts = attempts + 1, sent_at = ? WHERE idempotency_key = ?",
+            (datetime.now(), idempotency_key),
+        )
+
+    async def mark_outbox_failed(self, idempotency_key: str, retry_at: Optional[datetime] = None) -> None:
+        """Count a failed delivery; retry at `retry_at`, or give up if it is None."""
+        if retry_at is None:
+            await self._update_outbox(
+                "UPDATE outbox SET status = 'failed', attempts = attempts + 1 WHERE idempotency_key = ?",
+                (idempotency_key,),
+            )
+        else:
+            await self._update_outbox(
+                "UPDATE outbox SET attempts = attempts + 1, next_attempt_at = ? WHERE idempotency_key = ?",
+                (retry_at, idempotency_key),
+            )
+
+    async def prune_outbox(self, days: int = 7) -> None:
+        """Delete delivered outbox messages older than N days."""
+        await self._update_outbox(
+            "DELETE FROM outbox WHERE status = 'sent' AND sent_at < ?",
+            (datetime.now() - timedelta(days=days),),
+        )
+
+    async def _update_outbox(self, sql: str, params: tuple) -> None:
+        try:
+            conn = await self._get_conn()
+            async with self._write_lock:
+                await conn.execute(sql, params)
+                await conn.commit()
+        except Exception as e:
+            logger.error(f"Error updating outbox: {e}")
+
+    async def get_source_cursor(self, source_name: str) -> Optional[SourceCursor]:
+        """Load the incremental fetch cursor for a source (None if never fetched)."""
+        try:
+            conn = await self._get_conn()
+            cursor = await conn.execute('''
+                SELECT source_name, last_seen_id, fetch_depth, updated_at
+                FROM source_cursors WHERE source_name = ?
+            ''', (source_name,))
+            row = await cursor.fetchone()
+        except Exception as e:
+            logger.error(f"Error loading cursor for {source_name}: {e}")
+            return None
+        if row is None:
+            return None
+        updated_at = row['updated_at']
+        if isinstance(updated_at, str):
+            updated_at = datetime.fromisoformat(updated_at)
+        return SourceCursor(row['source_name'], row['last_seen_id'], row['fetch_depth'], updated_at)
+
+    async def save_source_cursor(self, cursor: SourceCursor) -> None:
+        """Insert or update a source's fetch cursor."""
+        try:
+            conn = await self._get_conn()
+            async with self._write_lock:
+                await conn.execute('''
+                    INSERT INTO source_cursors (source_name, last_seen_id, fetch_depth, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(source_name) DO UPDATE SET
+                        last_seen_id = excluded.last_seen_id,
+                        fetch_depth = excluded.fetch_depth,
+                        updated_at = excluded.updated_at
+                ''', (cursor.source_name, cursor.last_seen_id, cursor.fetch_depth,
+                      cursor.updated_at or datetime.now()))
+                await conn.commit()
+        except Exception as e:
+            logger.error(f"Error saving cursor for {cursor.source_name}: {e}")
+
     async def close(self):
-        """Cleanup (no-op for aiosqlite - connections auto-close)."""
-        pass
+        """Close the shared connection (safe to call more than once)."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            await conn.close()
+            logger.debug("Database connection closed")
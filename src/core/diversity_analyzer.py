@@ -14,6 +14,7 @@ from collections import defaultdict
 from loguru import logger
 
 from src.models.schemas import Signal, SignalType, DiversityMetrics, Source, SourceCategory
+from src.core.signal_window import TickerAggregate
 
 
 class DiversityAnalyzer:
@@ -41,11 +42,24 @@ class DiversityAnalyzer:
         if not signals:
             return self._empty_metrics(ticker)
         
+        return self.analyze_aggregate(TickerAggregate.from_signals(ticker, signals))
+    
+    def analyze_aggregate(self, agg: TickerAggregate) -> DiversityMetrics:
+        """
+        Analyze diversity metrics from pre-computed window tallies.
+        
+        Cost depends on the number of distinct sources for the ticker,
+        not on the number of signals in the window.
+        """
+        ticker = agg.ticker
+        if agg.total == 0:
+            return self._empty_metrics(ticker)
+        
         # Count sentiments
-        total = len(signals)
-        bullish = sum(1 for s in signals if s.signal_type == SignalType.BULLISH)
-        bearish = sum(1 for s in signals if s.signal_type == SignalType.BEARISH)
-        neutral = sum(1 for s in signals if s.signal_type == SignalType.NEUTRAL)
+        total = agg.total
+        bullish = agg.counts[SignalType.BULLISH]
+        bearish = agg.counts[SignalType.BEARISH]
+        neutral = agg.counts[SignalType.NEUTRAL]
         
         # Calculate diversity score (Shannon entropy normalized)
         diversity_score = self._calculate_diversity_score(bullish, bearish, neutral, total)
@@ -55,7 +69,7 @@ class DiversityAnalyzer:
         consensus_ratio = max_sentiment / total if total > 0 else 0
         
         # Calculate contrarian index (weighted minority view)
-        contrarian_index = self._calculate_contrarian_index(signals, bullish, bearish, total)
+        contrarian_index = self._calculate_contrarian_index(agg, bullish, bearish, total)
         
         # Determine risk flags
         is_echo_chamber = diversity_score < self.ECHO_CHAMBER_THRESHOLD
@@ -66,11 +80,11 @@ class DiversityAnalyzer:
         )
         
         # Analyze by source category
-        mainstream_sentiment = self._get_category_sentiment(signals, SourceCategory.MAINSTREAM)
-        contrarian_sentiment = self._get_category_sentiment(signals, SourceCategory.CONTRARIAN)
+        mainstream_sentiment = self._get_category_sentiment(agg, SourceCategory.MAINSTREAM)
+        contrarian_sentiment = self._get_category_sentiment(agg, SourceCategory.CONTRARIAN)
         
         # Check cross-platform divergence
-        cross_platform_divergence = self._detect_platform_divergence(signals)
+        cross_platform_divergence = self._detect_platform_divergence(agg)
         
         return DiversityMetrics(
             ticker=ticker,
@@ -104,7 +118,7 @@ class DiversityAnalyzer:
         
         return entropy / max_entropy if max_entropy > 0 else 0.0
     
-    def _calculate_contrarian_index(self, signals: List[Signal], bullish: int, bearish: int, total: int) -> float:
+    def _calculate_contrarian_index(self, agg: TickerAggregate, bullish: int, bearish: int, total: int) -> float:
         """
         Calculate contrarian index: weighted sentiment of minority view.
         Negative = contrarian bearish (opportunity to buy)
@@ -115,23 +129,23 @@ class DiversityAnalyzer:
         
         # Identify minority view
         if bullish > bearish:
-            minority_signals = [s for s in signals if s.signal_type == SignalType.BEARISH]
+            minority_type = SignalType.BEARISH
             direction = -1  # Bearish minority = potential buy opportunity
         else:
-            minority_signals = [s for s in signals if s.signal_type == SignalType.BULLISH]
+            minority_type = SignalType.BULLISH
             direction = 1  # Bullish minority = potential sell opportunity
         
-        if not minority_signals:
+        if agg.counts[minority_type] == 0:
             return 0.0
         
         # Weight by confidence and source category
         weighted_sum = 0.0
         weight_total = 0.0
         
-        for signal in minority_signals:
-            source = self.sources.get(signal.source_name)
+        for source_name, confidence in agg.source_confidence.items():
+            source = self.sources.get(source_name)
             category_weight = 1.5 if source and source.category == SourceCategory.CONTRARIAN else 1.0
-            combined_weight = signal.confidence * category_weight
+            combined_weight = confidence[minority_type] * category_weight
             
             weighted_sum += combined_weight
             weight_total += combined_weight
@@ -139,20 +153,19 @@ class DiversityAnalyzer:
         avg_confidence = weighted_sum / weight_total if weight_total > 0 else 0.0
         return direction * avg_confidence
     
-    def _get_category_sentiment(self, signals: List[Signal], category: SourceCategory) -> Optional[SignalType]:
+    def _get_category_sentiment(self, agg: TickerAggregate, category: SourceCategory) -> Optional[SignalType]:
         """Get dominant sentiment for a specific source category."""
-        category_signals = [
-            s for s in signals 
-            if self.sources.get(s.source_name) and self.sources[s.source_name].category == category
-        ]
-        
-        if not category_signals:
+        bullish = bearish = neutral = 0
+        for source_name, counts in agg.source_counts.items():
+            source = self.sources.get(source_name)
+            if source and source.category == category:
+                bullish += counts[SignalType.BULLISH]
+                bearish += counts[SignalType.BEARISH]
+                neutral += counts[SignalType.NEUTRAL]
+        
+        if bullish + bearish + neutral == 0:
             return None
         
-        bullish = sum(1 for s in category_signals if s.signal_type == SignalType.BULLISH)
-        bearish = sum(1 for s in category_signals if s.signal_type == SignalType.BEARISH)
-        neutral = sum(1 for s in category_signals if s.signal_type == SignalType.NEUTRAL)
-        
         max_count = max(bullish, bearish, neutral)
         if bullish == max_count:
             return SignalType.BULLISH
@@ -161,23 +174,23 @@ class DiversityAnalyzer:
         else:
             return SignalType.NEUTRAL
     
-    def _detect_platform_divergence(self, signals: List[Signal]) -> bool:
+    def _detect_platform_divergence(self, agg: TickerAggregate) -> bool:
         """Detect if different platforms have different sentiments."""
-        platform_sentiments = defaultdict(list)
+        platform_counts = defaultdict(lambda: [0, 0])  # [bullish, bearish]
         
-        for signal in signals:
-            source = self.sources.get(signal.source_name)
+        for source_name, counts in agg.source_counts.items():
+            source = self.sources.get(source_name)
             if source:
-                platform_sentiments[source.platform].append(signal.signal_type)
+                tally = platform_counts[source.platform]
+                tally[0] += counts[SignalType.BULLISH]
+                tally[1] += counts[SignalType.BEARISH]
         
-        if len(platform_sentiments) < 2:
+        if len(platform_counts) < 2:
             return False
         
         # Check if dominant sentiment differs across platforms
         platform_dominant = {}
-        for platform, sentiments in platform_sentiments.items():
-            bullish = sentiments.count(SignalType.BULLISH)
-            bearish = sentiments.count(SignalType.BEARISH)
+        for platform, (bullish, bearish) in platform_counts.items():
             if bullish > bearish:
                 platform_dominant[platform] = SignalType.BULLISH
             elif bearish > bullish:
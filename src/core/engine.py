@@ -1,30 +1,131 @@
 import asyncio
-from typing import List, Dict, Optional
-from datetime import datetime
+import os
+import time
+import httpx
+from dataclasses import dataclass, field
+from typing import AsyncIterator, List, Dict, Optional, Set, Tuple
 from loguru import logger
 from src.models.schemas import Source, PlatformType, Signal, MarketAlert, DiversityMetrics
-from src.core.fetcher import FetcherFactory
-from src.core.processor import SignalProcessor
+from src.core.fetcher import BaseAdapter, FetcherFactory
+from src.core.config import config
+from src.core.extraction import ExtractionPool
+from src.core.fetch_scheduler import FetchScheduler
+from src.core.bird import BirdWorkerPool
+from src.core.http_client import create_http_client
+from src.core.validator_cache import ValidatorCache
 from src.core.database import Database
 from src.core.diversity_analyzer import DiversityAnalyzer
-from src.utils.notifier import send_telegram_alert
-from src.utils.reporter import ReportBuilder
+from src.core.signal_window import SignalWindow
+from src.core.outbox import OutboxDrainer, outbox_message
+from src.utils.notifier import alert_chat_id
+from src.utils.telegram_queue import TelegramQueue
+from src.core.alert_aggregator import AlertAggregator, render_alert
+
+# Lookback used for diversity analysis and the in-memory signal window
+SIGNAL_WINDOW_HOURS = 24
+
+# Markdown table of monitored sources (Name | URL | Platform | [Category |] Weight)
+SOURCES_FILE = "memory/bloggers.md"
+
+
+@dataclass(slots=True)
+class CycleStats:
+    """Counters and timings of one run_cycle (seconds are relative to `started`)."""
+    sources: int = 0
+    started: float = 0.0
+    signals: int = 0
+    new_signals: int = 0
+    alerts: int = 0
+    first_alert_s: Optional[float] = None
+    duration_s: float = 0.0
+    new_by_source: Dict[str, int] = field(default_factory=dict)
+    failed_sources: Set[str] = field(default_factory=set)
+
+
+async def _drain_batches(queue: asyncio.Queue) -> AsyncIterator[list]:
+    """Yield lists from `queue` until a None sentinel, merging lists that are already waiting."""
+    done = False
+    while not done:
+        merged: list = []
+        item = await queue.get()
+        while True:
+            if item is None:
+                done = True
+                break
+            merged.extend(item)
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+        if merged:
+            yield merged
 
 class Engine:
+    # Severity of each diversity alert type
+    ALERT_SEVERITY = {
+        "EXTREME_CONSENSUS": "CRITICAL",
+        "ECHO_CHAMBER": "HIGH",
+        "CONTRARIAN_OPPORTUNITY": "HIGH",
+        "CROSS_PLATFORM_DIVERGENCE": "MEDIUM",
+        "HEALTHY_RESONANCE": "LOW",
+    }
+
     def __init__(self):
         self.sources: List[Source] = []
-        self.current_batch_signals: List[Signal] = []
+        self.sources_path = SOURCES_FILE
+        self._sources_stamp: Optional[tuple] = None
         self.diversity_analyzer: Optional[DiversityAnalyzer] = None
+        self.signal_window = SignalWindow(hours=SIGNAL_WINDOW_HOURS)
+        self.extraction_pool = ExtractionPool.from_config(config.advanced.get('extraction'))
+        self.fetch_scheduler = FetchScheduler.from_config(config.advanced.get('fetch'))
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
+        # One migrated connection, kept open across cycles
+        self._db: Optional[Database] = None
+        self._db_loop: Optional[asyncio.AbstractEventLoop] = None
+        # ETag/Last-Modified and content hashes survive across cycles
+        self.validator_cache = ValidatorCache()
+        # Persistent bird workers when advanced.bird.worker_command is set
+        self.bird_pool = BirdWorkerPool.from_config(config.advanced.get('bird'))
+        # Alerts are queued and delivered by background workers
+        telegram_settings = config.advanced.get('telegram_queue') or {}
+        self.telegram_queue = TelegramQueue.from_config(telegram_settings)
+        self.telegram_drain_timeout = telegram_settings.get('drain_timeout', 30)
+        # Alert messages go through the durable outbox table to that queue
+        self.outbox = OutboxDrainer.from_config(self.telegram_queue, config.advanced.get('outbox'))
+        # Bounded queues between the fetch, persist and analyze stages of a cycle
+        pipeline_settings = config.advanced.get('pipeline') or {}
+        self.pipeline_queue_size = pipeline_settings.get('queue_size', 64)
+        self.pipeline_early_analysis = pipeline_settings.get('early_analysis', True)
+        self.last_cycle: Optional[CycleStats] = None
+        # Non-critical alerts of a cycle are packed into digest messages
+        alert_settings = config.advanced.get('alerts') or {}
+        self.alert_aggregator = (
+            AlertAggregator.from_config(alert_settings) if alert_settings.get('digest', True) else None
+        )
 
-    def load_sources_from_memory(self):
+    def load_sources_from_memory(self, force: bool = False) -> bool:
         """
         Parses memory/bloggers.md to load sources.
         Format expected: Name | URL | Platform | Weight
+        
+        The file is only re-read when its mtime or size changed (or with
+        `force`). Rows are de-duplicated by name; a later row replaces an
+        earlier one. A file that fails to parse keeps the last good source
+        list and is not re-read until it changes again. Returns True if the
+        source list was reloaded.
         """
         try:
-            with open("memory/bloggers.md", "r") as f:
+            st = os.stat(self.sources_path)
+            stamp = (st.st_mtime_ns, st.st_size)
+            if not force and stamp == self._sources_stamp:
+                return False
+            # Recorded before parsing, so a malformed file is reported once, not every tick
+            self._sources_stamp = stamp
+            with open(self.sources_path, "r") as f:
                 lines = f.readlines()
             
+            loaded: Dict[str, Source] = {}
             for line in lines:
                 if "|" not in line or line.strip().startswith("| Name") or "---" in line: # Skip header and separator
                     continue
@@ -62,71 +163,195 @@ class Engine:
                     category = SourceCategory.MAINSTREAM
                 
                 source = Source(name=name, url=url, platform=platform, category=category, weight=weight)
-                self.sources.append(source)
+                loaded[name] = source
             
+            self.sources = list(loaded.values())
             # Initialize diversity analyzer with loaded sources
             self.diversity_analyzer = DiversityAnalyzer(self.sources)
             
             logger.info(f"📚 Loaded {len(self.sources)} sources from memory.")
             logger.info(f"🎯 Diversity analysis enabled with {len(self.sources)} sources.")
+            return True
                 
         except Exception as e:
             logger.error(f"❌ Failed to load sources: {e}")
+            return False
 
-    async def run_cycle(self):
+    async def run_cycle(self, sources: Optional[List[Source]] = None) -> CycleStats:
+        """Fetch and analyze `sources` (default: all loaded sources) once."""
         logger.info("🚀 Starting Signal Hunter Cycle...")
-        logger.debug("Creating Database instance...")
-        
-        # Initialize async database
-        db = Database()
-        logger.debug("Initializing database tables...")
-        await db.init_tables()
-        logger.debug("Database initialized successfully")
+        db = await self._get_db()
+        # Deliver anything a previous run left in the outbox
+        self.outbox.start(db)
         
         try:
-            # 1. Fetch & Process
-            tasks = []
-            for source in self.sources:
-                tasks.append(self._process_source(source))
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Flatten results and save to DB (async)
-            logger.debug(f"Processing {len(results)} fetch results...")
-            for res in results:
-                if isinstance(res, list):
-                    for sig in res:
-                        self.current_batch_signals.append(sig)
-                        logger.debug(f"Saving signal: {sig.ticker} from {sig.source_name}")
-                        saved = await db.save_signal(sig)
-                        logger.debug(f"Signal saved: {saved}")
-                elif isinstance(res, Exception):
-                    logger.error(f"Fetch error: {res}")
-            
-            # 2. Diversity-Aware Signal Analysis (Anti-Echo Chamber)
-            alert_count = await self._analyze_with_diversity(db)
+            stats = await self._run_pipeline(db, sources)
             
-            if alert_count == 0:
+            if stats.alerts == 0:
                 logger.info("✅ No significant signals found (diversity analysis complete).")
             
-            logger.info("🏁 Cycle complete.")
+            first_alert = f", first alert after {stats.first_alert_s:.1f}s" if stats.first_alert_s is not None else ""
+            logger.info(
+                f"🏁 Cycle complete in {stats.duration_s:.1f}s: {stats.new_signals}/{stats.signals} new signals, "
+                f"{stats.alerts} alerts{first_alert}."
+            )
+            return stats
         except Exception as e:
             logger.exception(f"Cycle failed: {e}")
             raise
-        finally:
+
+    async def _run_pipeline(self, db, sources: Optional[List[Source]] = None) -> CycleStats:
+        """
+        Run one cycle as a streaming pipeline over bounded queues.
+
+            fetch+extract (per source) → persist → analyze
+
+        Each source's signals are saved as soon as that source finishes, and
+        newly saved signals are analyzed right away. Immediate (critical)
+        alerts go out as soon as the saved signals support them, so a slow
+        source does not delay them; the ticker is then suppressed for the
+        rest of the cycle. Other alerts are not built until the final pass,
+        when every source is in, and go out in the digest. Full queues make
+        faster stages wait (backpressure) instead of buffering without bound. A source's fetch progress
+        (cursor, validators) is committed only after its signals are saved.
+        """
+        sources = self.sources if sources is None else sources
+        stats = self.last_cycle = CycleStats(sources=len(sources), started=time.monotonic())
+        extracted: asyncio.Queue = asyncio.Queue(maxsize=self.pipeline_queue_size)
+        persisted: asyncio.Queue = asyncio.Queue(maxsize=self.pipeline_queue_size)
+        # Only the diversity path analyzes incrementally; legacy resonance rescans the DB
+        early_analysis = self.pipeline_early_analysis and self.diversity_analyzer is not None
+        if early_analysis:
+            await self._seed_signal_window(db)
+
+        async def fetch_stage():
+            async def fetch(source: Source):
+                signals, adapter = await self._process_source(source, db)
+                if signals or adapter is not None:
+                    await extracted.put([(signals, adapter)])
+
+            async with asyncio.TaskGroup() as tg:
+                for source in sources:
+                    tg.create_task(fetch(source))
+            await extracted.put(None)
+
+        async def persist_stage():
+            async for fetched in _drain_batches(extracted):
+                batch = [sig for signals, _ in fetched for sig in signals]
+                try:
+                    saved = await db.save_signals(batch, strict=True)
+                except Exception as e:
+                    # Fetch progress stays uncommitted, so the next cycle refetches these items
+                    logger.error(f"❌ Failed to save {len(batch)} signals: {e}")
+                    continue
+                await self._commit_fetches([adapter for _, adapter in fetched if adapter is not None])
+                new_signals = [sig for sig, is_new in zip(batch, saved) if is_new]
+                stats.signals += len(batch)
+                stats.new_signals += len(new_signals)
+                for sig in new_signals:
+                    stats.new_by_source[sig.source_name] = stats.new_by_source.get(sig.source_name, 0) + 1
+                logger.debug(f"Saved {len(new_signals)}/{len(batch)} new signals")
+                if new_signals:
+                    await persisted.put(new_signals)
+            await persisted.put(None)
+
+        async def analyze_stage():
+            # 2. Diversity-Aware Signal Analysis (Anti-Echo Chamber)
+            pending: List[Signal] = []
+            async for new_signals in _drain_batches(persisted):
+                if early_analysis:
+                    stats.alerts += await self._analyze_with_diversity(db, new_signals, flush=False)
+                else:
+                    pending.extend(new_signals)
+            # Final pass: expiries, anything held back, and the digest
+            stats.alerts += await self._analyze_with_diversity(db, pending, flush=True)
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(fetch_stage())
+            tg.create_task(persist_stage())
+            tg.create_task(analyze_stage())
+        stats.duration_s = time.monotonic() - stats.started
+        return stats
+
+    async def _seed_signal_window(self, db):
+        """Load the 24h window from the DB once, before this cycle saves anything."""
+        window = self.signal_window
+        if not window.seeded:
+            window.add_many(await db.get_recent_signals(hours=SIGNAL_WINDOW_HOURS))
+            window.seeded = True
+
+    async def _get_db(self) -> Database:
+        """Shared database connection, opened and migrated once per event loop."""
+        loop = asyncio.get_running_loop()
+        if self._db is None or self._db_loop is not loop:
+            db = Database()
+            await db.init_tables()
+            self._db, self._db_loop = db, loop
+        return self._db
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Shared pooled client, rebuilt if the engine moves to a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_loop is not loop:
+            self._http_client = create_http_client(config.advanced)
+            self._http_loop = loop
+        return self._http_client
+
+    async def close(self):
+        """Release long-lived resources (queued alerts, database, HTTP connections, bird and extraction workers)."""
+        await self.outbox.stop(timeout=self.telegram_drain_timeout)
+        await self.telegram_queue.drain(timeout=self.telegram_drain_timeout)
+        loop = asyncio.get_running_loop()
+        db, self._db = self._db, None
+        if db is not None and self._db_loop is loop:
             await db.close()
+        client, self._http_client = self._http_client, None
+        if client is not None and self._http_loop is loop:
+            await client.aclose()
+        await self.bird_pool.close()
+        # Joining worker processes blocks, so keep it off the event loop
+        await asyncio.to_thread(self.extraction_pool.shutdown)
 
-    async def _process_source(self, source: Source) -> List[Signal]:
+    async def _commit_fetches(self, adapters: List[BaseAdapter]):
+        """Record fetch progress of sources whose signals were saved."""
+        for adapter in adapters:
+            try:
+                await adapter.commit()
+            except Exception as e:
+                logger.error(f"❌ Failed to commit fetch progress for {adapter.source.name}: {e}")
+
+    async def _process_source(self, source: Source,
+                              db: Optional[Database] = None) -> Tuple[List[Signal], Optional[BaseAdapter]]:
+        """
+        Fetch and extract one source.
+
+        Returns its signals and the adapter, whose commit() must run once
+        the signals are saved (no adapter if the fetch failed).
+        """
         try:
-            adapter = FetcherFactory.get_adapter(source)
-            raw_data = await adapter.fetch()
-            signals = SignalProcessor.process(source, raw_data)
-            return signals
+            adapter = FetcherFactory.get_adapter(
+                source,
+                http_client=self._get_http_client(),
+                validator_cache=self.validator_cache,
+                cursor_store=db,
+                bird=self.bird_pool,
+            )
+            # Items are extracted in batches while the adapter is still
+            # streaming; extraction runs off the event loop.
+            async with self.fetch_scheduler.slot(source):
+                signals = await self.extraction_pool.process_stream(source, adapter.stream())
+            if adapter.failed and self.last_cycle is not None:
+                # The adapter logged and swallowed the error; still back off the source
+                self.last_cycle.failed_sources.add(source.name)
+            return signals, adapter
         except Exception as e:
             logger.error(f"💥 Error processing {source.name}: {e}")
-            return []
+            if self.last_cycle is not None:
+                self.last_cycle.failed_sources.add(source.name)
+            return [], None
 
-    async def _analyze_with_diversity(self, db) -> int:
+    async def _analyze_with_diversity(self, db, new_signals: Optional[List[Signal]] = None,
+                                      flush: bool = True) -> int:
         """
         Analyze signals with diversity metrics to prevent echo chamber amplification.
         
@@ -136,174 +361,208 @@ class Engine:
         - Extreme Consensus: >80% agreement (REVERSAL WARNING)
         - Traditional Resonance: Only alert if diversity > 0.3
         
+        Only tickers whose window tallies changed (new or expired signals)
+        are re-analyzed. `new_signals` are the signals saved since the last
+        call. With `flush=False` (an early pass on partial data) only
+        immediate alerts are sent; tickers heading for the digest stay dirty
+        for a later call, without building their alert.
+        
         Returns number of alerts sent.
         """
         if not self.diversity_analyzer:
             logger.warning("Diversity analyzer not initialized, falling back to basic resonance.")
-            return await self._legacy_resonance_check(db)
+            return await self._legacy_resonance_check(db, flush=flush)
         
-        # Load signals from DB (24h window)
-        recent_signals = await db.get_recent_signals(hours=24)
-        
-        # Group by ticker
-        ticker_signals: Dict[str, List[Signal]] = {}
-        for sig in recent_signals:
-            if sig.ticker not in ticker_signals:
-                ticker_signals[sig.ticker] = []
-            ticker_signals[sig.ticker].append(sig)
+        window = self.signal_window
+        if not window.seeded:
+            # First pass: load the 24h window from DB once (includes new_signals)
+            window.add_many(await db.get_recent_signals(hours=SIGNAL_WINDOW_HOURS))
+            window.seeded = True
+        elif new_signals:
+            window.add_many(new_signals)
+        window.expire()
         
+        dirty = sorted(window.pop_dirty())
         alerts_sent = 0
+        # One query for every ticker's suppression state
+        suppressed = await db.get_recently_alerted(dirty)
         
-        for ticker, signals in ticker_signals.items():
+        for ticker in dirty:
+            agg = window.get(ticker)
             # Check if already alerted
-            is_alerted = await db.is_alerted_recently(ticker)
-            if is_alerted:
+            if ticker in suppressed:
                 logger.debug(f"🤫 Suppressing alert for {ticker} (already sent)")
+                # Re-check next cycle in case the suppression lapses
+                window.mark_dirty(ticker)
                 continue
             
             # Analyze diversity metrics
-            metrics = self.diversity_analyzer.analyze(ticker, signals)
+            metrics = self.diversity_analyzer.analyze_aggregate(agg)
             
             # Route to appropriate alert type based on diversity context
             if metrics.is_extreme_consensus:
                 # EXTREME RISK: Everyone agrees - reversal likely
-                await self._send_extreme_consensus_alert(ticker, signals, metrics)
-                await db.record_alert(ticker)
-                alerts_sent += 1
+                alert_type, build_alert = "EXTREME_CONSENSUS", self._build_extreme_consensus_alert
                 
             elif metrics.is_echo_chamber:
                 # ECHO CHAMBER: Low diversity, herd mentality
-                await self._send_echo_chamber_alert(ticker, signals, metrics)
-                await db.record_alert(ticker)
-                alerts_sent += 1
+                alert_type, build_alert = "ECHO_CHAMBER", self._build_echo_chamber_alert
                 
             elif metrics.contrarian_opportunity:
                 # CONTRARIAN OPPORTUNITY: Strong minority view
-                await self._send_contrarian_alert(ticker, signals, metrics)
-                await db.record_alert(ticker)
-                alerts_sent += 1
+                alert_type, build_alert = "CONTRARIAN_OPPORTUNITY", self._build_contrarian_alert
                 
             elif metrics.cross_platform_divergence:
                 # PLATFORM DIVERGENCE: Different platforms disagree
-                await self._send_divergence_alert(ticker, signals, metrics)
-                await db.record_alert(ticker)
-                alerts_sent += 1
+                alert_type, build_alert = "CROSS_PLATFORM_DIVERGENCE", self._build_divergence_alert
                 
-            elif metrics.diversity_score >= 0.3 and len(set(s.source_name for s in signals)) >= 2:
+            elif metrics.diversity_score >= 0.3 and len(agg.source_counts) >= 2:
                 # HEALTHY RESONANCE: Diverse sources agreeing (old logic, but stricter)
-                await self._send_healthy_resonance_alert(ticker, signals, metrics)
-                await db.record_alert(ticker)
-                alerts_sent += 1
+                alert_type, build_alert = "HEALTHY_RESONANCE", self._build_healthy_resonance_alert
             else:
                 logger.debug(f"ℹ️ {ticker}: No significant pattern (diversity: {metrics.diversity_score:.2f})")
+                continue
+            if not flush and not self._sends_early(self.ALERT_SEVERITY[alert_type]):
+                # Digest alert: decide once every source is in
+                window.mark_dirty(ticker)
+                continue
+            
+            # Materialize the signal list only for tickers that alert
+            await self._dispatch_alert(db, build_alert(ticker, agg.recent_signals(), metrics))
+            alerts_sent += 1
         
+        if flush:
+            await self._flush_alert_digest(db)
         return alerts_sent
+
+    def _sends_early(self, severity: str) -> bool:
+        """Whether an early pass may send an alert of `severity` (immediate ones only)."""
+        immediate = self.alert_aggregator.immediate_severities if self.alert_aggregator is not None else {"CRITICAL"}
+        return severity.upper() in immediate
+
+    async def _dispatch_alert(self, db, alert: MarketAlert):
+        """Send critical alerts now; hold the rest for this cycle's digest."""
+        if self.alert_aggregator is None or self.alert_aggregator.is_immediate(alert):
+            await self._emit_alerts(db, [alert.ticker], [render_alert(alert)])
+            logger.warning(f"🚨 {alert.severity} alert sent for {alert.ticker}: {alert.headline}")
+        else:
+            self.alert_aggregator.add(alert)
+            logger.info(f"📥 {alert.severity} alert for {alert.ticker} added to digest: {alert.headline}")
+
+    async def _flush_alert_digest(self, db):
+        """Send the alerts collected this cycle as packed digest messages."""
+        if self.alert_aggregator is None or not len(self.alert_aggregator):
+            return
+        tickers = self.alert_aggregator.tickers()
+        await self._emit_alerts(db, tickers, self.alert_aggregator.flush())
+
+    async def _emit_alerts(self, db, tickers: List[str], messages: List[str]):
+        """
+        Record alerts and queue their messages in the outbox in one transaction.
+
+        Delivery happens in the background (OutboxDrainer), so the scan never
+        waits on Telegram and a crash cannot lose a recorded alert.
+        """
+        if self.last_cycle is not None and self.last_cycle.first_alert_s is None:
+            self.last_cycle.first_alert_s = time.monotonic() - self.last_cycle.started
+        chat_id = alert_chat_id()
+        outbox = [outbox_message(chat_id, msg) for msg in messages] if chat_id else []
+        if await db.record_alerts(tickers, outbox) and outbox:
+            self.outbox.notify()
+
+    @staticmethod
+    def _majority(metrics: DiversityMetrics) -> str:
+        return "BULLISH" if metrics.bullish_count > metrics.bearish_count else "BEARISH"
     
-    async def _send_extreme_consensus_alert(self, ticker: str, signals: List[Signal], metrics: DiversityMetrics):
+    def _build_extreme_consensus_alert(self, ticker: str, signals: List[Signal], metrics: DiversityMetrics) -> MarketAlert:
         """Alert when >80% consensus - reversal warning."""
-        majority = "BULLISH" if metrics.bullish_count > metrics.bearish_count else "BEARISH"
-
-        reason_lines = [
+        majority = self._majority(metrics)
+        description = "\n".join([
             f"{metrics.consensus_ratio*100:.0f}% {majority} - Reversal Likely!",
             f"Diversity Score: {metrics.diversity_score:.2f} (Extreme)",
             f"Signals: {metrics.total_signals} total (Bullish {metrics.bullish_count}, Bearish {metrics.bearish_count})",
             "Insight: When everyone agrees, everyone is wrong.",
-            f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-        ]
-        msg = ReportBuilder.build_market_signal(
-            signal=f"EXTREME CONSENSUS RISK: {ticker}",
-            reason="\n".join(reason_lines),
+        ])
+        return MarketAlert(
+            alert_type="EXTREME_CONSENSUS", ticker=ticker, severity=self.ALERT_SEVERITY["EXTREME_CONSENSUS"],
+            headline=f"EXTREME CONSENSUS RISK: {ticker}", description=description,
+            diversity_metrics=metrics, related_signals=signals,
         )
-
-        await send_telegram_alert(msg)
-        logger.warning(f"🚨 Extreme consensus alert sent for {ticker}")
     
-    async def _send_echo_chamber_alert(self, ticker: str, signals: List[Signal], metrics: DiversityMetrics):
+    def _build_echo_chamber_alert(self, ticker: str, signals: List[Signal], metrics: DiversityMetrics) -> MarketAlert:
         """Alert for echo chamber detection."""
-        majority = "BULLISH" if metrics.bullish_count > metrics.bearish_count else "BEARISH"
-
-        reason_lines = [
+        majority = self._majority(metrics)
+        description = "\n".join([
             f"Herd mentality detected ({metrics.consensus_ratio*100:.0f}% {majority})",
             f"Diversity Score: {metrics.diversity_score:.2f} (Low)",
             "Sources agree too much - limited perspective",
             "Insight: Diversify your information diet.",
-            f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-        ]
-        msg = ReportBuilder.build_market_signal(
-            signal=f"ECHO CHAMBER WARNING: {ticker}",
-            reason="\n".join(reason_lines),
+        ])
+        return MarketAlert(
+            alert_type="ECHO_CHAMBER", ticker=ticker, severity=self.ALERT_SEVERITY["ECHO_CHAMBER"],
+            headline=f"ECHO CHAMBER WARNING: {ticker}", description=description,
+            diversity_metrics=metrics, related_signals=signals,
         )
-
-        await send_telegram_alert(msg)
-        logger.warning(f"📢 Echo chamber alert sent for {ticker}")
     
-    async def _send_contrarian_alert(self, ticker: str, signals: List[Signal], metrics: DiversityMetrics):
+    def _build_contrarian_alert(self, ticker: str, signals: List[Signal], metrics: DiversityMetrics) -> MarketAlert:
         """Alert for contrarian opportunity."""
         # Find minority signals
         if metrics.bullish_count < metrics.bearish_count:
             minority_type = "BULLISH"
-            minority_signals = [s for s in signals if s.signal_type.value == "BULLISH"]
         else:
             minority_type = "BEARISH"
-            minority_signals = [s for s in signals if s.signal_type.value == "BEARISH"]
+        minority_signals = [s for s in signals if s.signal_type.value == minority_type]
         
-        reason_lines = [
+        description = "\n".join([
             f"Strong {minority_type} view in {metrics.consensus_ratio*100:.0f}% opposite market",
             f"Contrarian Index: {metrics.contrarian_index:.2f}",
             "Insight: The crowd is wrong at extremes.",
-            f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-        ]
+        ])
         audit_lines = [f"• {s.source_name}: {s.raw_text[:60]}..." for s in minority_signals[:2]]
-        audit = "\n".join(audit_lines) if audit_lines else None
-        msg = ReportBuilder.build_market_signal(
-            signal=f"CONTRARIAN OPPORTUNITY: {ticker}",
-            reason="\n".join(reason_lines),
-            audit=audit,
+        return MarketAlert(
+            alert_type="CONTRARIAN_OPPORTUNITY", ticker=ticker, severity=self.ALERT_SEVERITY["CONTRARIAN_OPPORTUNITY"],
+            headline=f"CONTRARIAN OPPORTUNITY: {ticker}", description=description,
+            diversity_metrics=metrics, related_signals=signals,
+            audit="\n".join(audit_lines) if audit_lines else None,
         )
-
-        await send_telegram_alert(msg)
-        logger.info(f"🎯 Contrarian alert sent for {ticker}")
     
-    async def _send_divergence_alert(self, ticker: str, signals: List[Signal], metrics: DiversityMetrics):
+    def _build_divergence_alert(self, ticker: str, signals: List[Signal], metrics: DiversityMetrics) -> MarketAlert:
         """Alert for cross-platform sentiment divergence."""
-        reason_lines = [
+        description = "\n".join([
             "Different platforms show different sentiments",
             f"Mainstream: {metrics.mainstream_sentiment.value if metrics.mainstream_sentiment else 'N/A'}",
             f"Contrarian: {metrics.contrarian_sentiment.value if metrics.contrarian_sentiment else 'N/A'}",
             "Insight: Smart money vs retail divergence.",
-            f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-        ]
-        msg = ReportBuilder.build_market_signal(
-            signal=f"PLATFORM DIVERGENCE: {ticker}",
-            reason="\n".join(reason_lines),
+        ])
+        return MarketAlert(
+            alert_type="CROSS_PLATFORM_DIVERGENCE", ticker=ticker, severity=self.ALERT_SEVERITY["CROSS_PLATFORM_DIVERGENCE"],
+            headline=f"PLATFORM DIVERGENCE: {ticker}", description=description,
+            diversity_metrics=metrics, related_signals=signals,
         )
-
-        await send_telegram_alert(msg)
-        logger.info(f"📊 Divergence alert sent for {ticker}")
     
-    async def _send_healthy_resonance_alert(self, ticker: str, signals: List[Signal], metrics: DiversityMetrics):
+    def _build_healthy_resonance_alert(self, ticker: str, signals: List[Signal], metrics: DiversityMetrics) -> MarketAlert:
         """Alert for healthy resonance (diverse sources agreeing)."""
-        reason_lines = [
+        description = "\n".join([
             "Diverse sources reaching consensus",
             f"Diversity Score: {metrics.diversity_score:.2f} (Good)",
             f"Consensus: {metrics.consensus_ratio*100:.0f}%",
-            f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-        ]
+        ])
+        return MarketAlert(
+            alert_type="HEALTHY_RESONANCE", ticker=ticker, severity=self.ALERT_SEVERITY["HEALTHY_RESONANCE"],
+            headline=f"HEALTHY RESONANCE: {ticker}", description=description,
+            diversity_metrics=metrics, related_signals=signals,
+            audit=self._source_audit(signals),
+        )
+
+    @staticmethod
+    def _source_audit(signals: List[Signal]) -> Optional[str]:
         audit_lines = []
         for s in signals[:3]:
             icon = "🟢" if s.signal_type.value == "BULLISH" else "🔴" if s.signal_type.value == "BEARISH" else "⚪️"
             audit_lines.append(f"{icon} {s.source_name}")
-        audit = "\n".join(audit_lines) if audit_lines else None
-        msg = ReportBuilder.build_market_signal(
-            signal=f"HEALTHY RESONANCE: {ticker}",
-            reason="\n".join(reason_lines),
-            audit=audit,
-        )
-
-        await send_telegram_alert(msg)
-        logger.info(f"✅ Healthy resonance alert sent for {ticker}")
+        return "\n".join(audit_lines) if audit_lines else None
     
-    async def _legacy_resonance_check(self, db) -> int:
+    async def _legacy_resonance_check(self, db, flush: bool = True) -> int:
         """Fallback to old logic if diversity analyzer unavailable."""
         recent_signals = await db.get_recent_signals(hours=24)
         ticker_counts: Dict[str, List[Signal]] = {}
@@ -314,24 +573,21 @@ class Engine:
             ticker_counts[sig.ticker].append(sig)
         
         alerts_sent = 0
+        suppressed = await db.get_recently_alerted(ticker_counts.keys())
         for ticker, sigs in ticker_counts.items():
-            is_alerted = await db.is_alerted_recently(ticker)
-            if is_alerted:
+            if ticker in suppressed:
                 continue
             
             sources_involved = set(s.source_name for s in sigs)
             if len(sources_involved) >= 2:
-                audit_lines = []
-                for s in sigs[:3]:
-                    icon = "🟢" if s.signal_type.value == "BULLISH" else "🔴"
-                    audit_lines.append(f"{icon} {s.source_name}")
-                msg = ReportBuilder.build_market_signal(
-                    signal=f"信号共振: {ticker}",
-                    reason="Legacy resonance check triggered with multiple sources.",
-                    audit="\n".join(audit_lines),
-                )
-                await send_telegram_alert(msg)
-                await db.record_alert(ticker)
+                await self._dispatch_alert(db, MarketAlert(
+                    alert_type="RESONANCE", ticker=ticker, severity="MEDIUM",
+                    headline=f"信号共振: {ticker}",
+                    description="Legacy resonance check triggered with multiple sources.",
+                    related_signals=sigs, audit=self._source_audit(sigs),
+                ))
                 alerts_sent += 1
         
+        if flush:
+            await self._flush_alert_digest(db)
         return alerts_sent
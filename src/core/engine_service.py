@@ -0,0 +1,85 @@
+"""
+Engine Service - One Long-Lived Engine Across Scheduled Cycles
+
+The scheduler used to build a new Engine and re-parse memory/bloggers.md on
+every trigger. That re-opened the database, the HTTP pool and the worker
+pools each time, and threw away the validator cache and the 24h signal
+window. EngineService keeps one Engine for the life of the process:
+
+- Sources are reloaded only when memory/bloggers.md changes
+  (Engine.load_sources_from_memory compares its mtime).
+- Full scans and per-source ticks (SourceScheduler) run on the same engine,
+  so connections and caches stay warm between cycles.
+- Only one cycle runs at a time; a tick that finds a scan in progress is
+  skipped.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from loguru import logger
+
+from src.core.config import config
+from src.core.engine import CycleStats, Engine
+from src.core.source_scheduler import SourceScheduler
+from src.models.schemas import Source
+
+
+class EngineService:
+    """Owns the process-wide Engine and its per-source schedule."""
+
+    def __init__(self, engine: Optional[Engine] = None, source_scheduler: Optional[SourceScheduler] = None):
+        self.engine = engine if engine is not None else Engine()
+        # An empty scheduler is falsy (__len__), so test for None explicitly
+        self.source_scheduler = (
+            source_scheduler if source_scheduler is not None else SourceScheduler.from_config(config.scheduler)
+        )
+        self.last_scan_time: Optional[datetime] = None
+        self.is_scanning = False
+
+    @property
+    def sources(self) -> List[Source]:
+        return self.engine.sources
+
+    def reload_sources(self, force: bool = False) -> bool:
+        """Re-read the source list if its file changed; returns True if it did."""
+        changed = self.engine.load_sources_from_memory(force=force)
+        if changed:
+            self.source_scheduler.sync(self.engine.sources)
+        return changed
+
+    async def scan_all(self) -> Optional[CycleStats]:
+        """Fetch every source now; returns None if a cycle is already running."""
+        if self.is_scanning:
+            return None
+        self.is_scanning = True
+        try:
+            self.reload_sources()
+            self.source_scheduler.sync(self.engine.sources)
+            stats = None
+            try:
+                stats = await self.engine.run_cycle()
+            finally:
+                # A full scan also resets every source's next-due time
+                self.source_scheduler.record_cycle(self.engine.sources, stats)
+            self.last_scan_time = datetime.now()
+            return stats
+        finally:
+            self.is_scanning = False
+
+    async def run_due(self) -> int:
+        """Fetch the sources that are due; returns how many ran (0 if busy)."""
+        if self.is_scanning:
+            logger.debug("⏳ Skipping scheduler tick, a scan is in progress")
+            return 0
+        self.is_scanning = True
+        try:
+            self.reload_sources()
+            fetched = await self.source_scheduler.run_due(self.engine)
+            if fetched:
+                self.last_scan_time = datetime.now()
+            return fetched
+        finally:
+            self.is_scanning = False
+
+    async def close(self) -> None:
+        await self.engine.close()
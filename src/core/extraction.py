@@ -0,0 +1,131 @@
+"""
+Extraction Pool - Off-Loop Signal Extraction
+
+SignalProcessor.process is synchronous regex work. Running it directly in a
+coroutine blocks every other fetch while a large page or long timeline is
+parsed. ExtractionPool moves that work to a thread or process pool, splitting
+large fetch results into item batches so they spread across workers.
+"""
+
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional
+from loguru import logger
+
+from src.models.schemas import Source, Signal
+from src.core.processor import SignalProcessor
+
+EXECUTOR_TYPES = ("process", "thread", "inline")
+
+
+class ExtractionPool:
+    """Runs SignalProcessor.process on a worker pool."""
+
+    def __init__(
+        self,
+        executor: str = "process",
+        max_workers: Optional[int] = None,
+        batch_size: int = 50,
+        inline_max_chars: int = 20000,
+    ):
+        """
+        Args:
+            executor: "process" (multi-core), "thread" or "inline" (no pool)
+            max_workers: Pool size, defaults to the CPU count
+            batch_size: Items per submitted batch
+            inline_max_chars: Fetch results (a whole stream, not one batch)
+                with less text than this run inline, since shipping them to a
+                worker costs more than parsing them
+        """
+        if executor not in EXECUTOR_TYPES:
+            raise ValueError(f"Unknown extraction executor: {executor}")
+        self.executor_type = executor
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_size = max(1, batch_size)
+        self.inline_max_chars = inline_max_chars
+        self._executor: Optional[Executor] = None
+
+    @classmethod
+    def from_config(cls, settings: Optional[Dict[str, Any]]) -> "ExtractionPool":
+        settings = settings or {}
+        return cls(
+            executor=settings.get('executor', 'process'),
+            max_workers=settings.get('max_workers'),
+            batch_size=settings.get('batch_size', 50),
+            inline_max_chars=settings.get('inline_max_chars', 20000),
+        )
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="extract"
+                )
+            logger.debug(f"Started {self.executor_type} extraction pool ({self.max_workers} workers)")
+        return self._executor
+
+    def _offload(self, text_size: int) -> bool:
+        """Whether a result with `text_size` characters goes to the pool."""
+        return self.executor_type != "inline" and text_size >= self.inline_max_chars
+
+    def _submit(self, source: Source, batch: List[dict]) -> "asyncio.Future[List[Signal]]":
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._get_executor(), SignalProcessor.process, source, batch)
+
+    async def process(self, source: Source, raw_data: List[dict]) -> List[Signal]:
+        """Extract signals from raw items without blocking the event loop."""
+        if not raw_data:
+            return []
+        if not self._offload(sum(_text_size(item) for item in raw_data)):
+            return SignalProcessor.process(source, raw_data)
+
+        batches = [raw_data[i:i + self.batch_size] for i in range(0, len(raw_data), self.batch_size)]
+        results = await asyncio.gather(*(self._submit(source, batch) for batch in batches))
+        return [signal for batch in results for signal in batch]
+
+    async def process_stream(self, source: Source, items: AsyncIterator[dict]) -> List[Signal]:
+        """
+        Extract signals from a streaming fetch.
+
+        The inline cutoff applies to the text received so far: items are
+        held until it is crossed, and from then on every batch_size items go
+        to the pool as soon as they arrive, so extraction overlaps with a
+        slow producer (e.g. a long bird timeline). A stream that stays below
+        the cutoff is extracted inline once it ends.
+        """
+        futures = []
+        pending: List[dict] = []
+        text_size = 0
+        offload = False
+        try:
+            async for item in items:
+                pending.append(item)
+                if not offload:
+                    text_size += _text_size(item)
+                    offload = self._offload(text_size)
+                while offload and len(pending) >= self.batch_size:
+                    batch, pending = pending[:self.batch_size], pending[self.batch_size:]
+                    futures.append(self._submit(source, batch))
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        if not offload:
+            return SignalProcessor.process(source, pending) if pending else []
+        if pending:
+            futures.append(self._submit(source, pending))
+        results = await asyncio.gather(*futures)
+        return [signal for batch_signals in results for signal in batch_signals]
+
+    def shutdown(self) -> None:
+        """Stop the worker pool (it is recreated on next use); blocks, so use asyncio.to_thread from a loop."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _text_size(item: dict) -> int:
+    return len(item.get("full_text") or item.get("text") or "")
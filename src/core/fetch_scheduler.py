@@ -0,0 +1,140 @@
+"""
+Fetch Scheduler - Bounded-Concurrency Source Fetching
+
+Engine.run_cycle starts every source at once. FetchScheduler gates each fetch
+behind three limits so a long source list queues instead of stampeding:
+
+1. Per-platform cap: at most N concurrent fetches per platform (e.g. a few
+   `bird` subprocesses, more plain web requests, very few Sogou/WeChat hits).
+2. Per-host token bucket: requests to one host are spaced to a steady rate
+   with a small burst allowance, which keeps us under remote rate limits.
+3. Global cap: total in-flight fetches across all platforms.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+from loguru import logger
+
+from src.models.schemas import Source, PlatformType
+
+DEFAULT_PLATFORM_LIMITS = {
+    PlatformType.TWITTER.value: 4,
+    PlatformType.WECHAT.value: 1,
+    PlatformType.SUBSTACK.value: 4,
+    PlatformType.GENERIC.value: 8,
+}
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, up to `burst` stored."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self.rate
+                await asyncio.sleep(wait)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            self._tokens -= 1
+
+
+class FetchScheduler:
+    """Applies global, per-platform and per-host limits to source fetches."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        platform_limits: Optional[Dict[str, int]] = None,
+        host_rate: float = 2.0,
+        host_burst: int = 2,
+        host_rates: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Args:
+            max_concurrency: Global cap on in-flight fetches
+            platform_limits: Platform value -> cap (missing platforms use the global cap)
+            host_rate: Default requests per second per host (0 disables)
+            host_burst: Requests a host may receive back-to-back
+            host_rates: Host -> requests per second overrides
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.platform_limits = {**DEFAULT_PLATFORM_LIMITS, **(platform_limits or {})}
+        self.host_rate = host_rate
+        self.host_burst = host_burst
+        self.host_rates = host_rates or {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._global: Optional[asyncio.Semaphore] = None
+        self._platforms: Dict[str, asyncio.Semaphore] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    @classmethod
+    def from_config(cls, settings: Optional[Dict[str, Any]]) -> "FetchScheduler":
+        settings = settings or {}
+        return cls(
+            max_concurrency=settings.get('max_concurrency', 16),
+            platform_limits=settings.get('platform_limits'),
+            host_rate=settings.get('host_rate', 2.0),
+            host_burst=settings.get('host_burst', 2),
+            host_rates=settings.get('host_rates'),
+        )
+
+    def _bind(self) -> None:
+        """(Re)create the asyncio primitives when used from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._global = asyncio.Semaphore(self.max_concurrency)
+            self._platforms.clear()
+            self._buckets.clear()
+
+    @staticmethod
+    def host_of(source: Source) -> str:
+        return (urlsplit(str(source.url)).hostname or "").lower()
+
+    def _platform_semaphore(self, platform: str) -> asyncio.Semaphore:
+        sem = self._platforms.get(platform)
+        if sem is None:
+            limit = min(self.platform_limits.get(platform, self.max_concurrency), self.max_concurrency)
+            sem = self._platforms[platform] = asyncio.Semaphore(max(1, limit))
+        return sem
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate = self.host_rates.get(host, self.host_rate)
+            bucket = self._buckets[host] = TokenBucket(rate, self.host_burst)
+        return bucket
+
+    @asynccontextmanager
+    async def slot(self, source: Source) -> AsyncIterator[None]:
+        """Hold a fetch slot for `source` for the duration of the block."""
+        self._bind()
+        platform = source.platform.value
+        host = self.host_of(source)
+        queued = time.monotonic()
+
+        # Platform first, then host pacing, then the global cap, so a source
+        # waiting on its own platform or host never holds a global slot.
+        async with self._platform_semaphore(platform):
+            await self._bucket(host).acquire()
+            async with self._global:
+                waited = time.monotonic() - queued
+                if waited > 1:
+                    logger.debug(f"⏳ {source.name} waited {waited:.1f}s for a fetch slot")
+                yield
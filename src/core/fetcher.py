@@ -1,90 +1,190 @@
-import json
-import asyncio
-import os
-import subprocess
+import re
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Set, Union
+import httpx
 from datetime import datetime
 from loguru import logger
-from src.models.schemas import Source, Signal
+from src.models.schemas import Source, Signal, SourceCursor
+from src.core.config import config
+from src.core.bird import BirdError, BirdWorkerPool
+from src.core.validator_cache import ValidatorCache
+
+if TYPE_CHECKING:
+    from src.core.database import Database
 
 class BaseAdapter(ABC):
     def __init__(self, source: Source):
         self.source = source
+        # Set when the last fetch failed (as opposed to finding nothing new)
+        self.failed = False
 
     @abstractmethod
     async def fetch(self) -> List[dict]:
         """Fetch raw data (posts/articles) from source"""
         pass
 
+    async def stream(self) -> AsyncIterator[dict]:
+        """Yield raw items as they become available (default: everything from fetch())."""
+        for item in await self.fetch():
+            yield item
+
+    async def commit(self) -> None:
+        """Record fetch progress (cursors, validators) once the fetched items are saved."""
+        pass
+
 class TwitterAdapter(BaseAdapter):
     """
     Adapter for Twitter/X using the 'bird' CLI tool.
     Prerequisite: 'bird' must be installed and authenticated.
+
+    With a cursor store (the Database), fetching is incremental: only tweets
+    newer than the source's last seen ID are returned, and the fetch depth
+    (-n) adapts to how fast the account posts. If every fetched tweet is new,
+    the timeline is re-fetched deeper in the same cycle so bursts are not lost.
+    The advanced cursor is only saved by commit(), after the caller has
+    stored the tweets' signals, so a failed save refetches them; a bird call
+    that fails part-way leaves it unchanged. Tweets without a parseable ID
+    can't be compared with the cursor and are always passed on, once per
+    fetch; save_signals' per-ticker/source dedupe absorbs the repeats.
+
+    bird calls go through a BirdWorkerPool, which reuses persistent workers
+    when configured (see src/core/bird.py).
     """
+    MIN_DEPTH = 5
+    MAX_DEPTH = 100
+
+    _STATUS_ID = re.compile(r"/status(?:es)?/(\d+)")
+
+    def __init__(self, source: Source, cursor_store: Optional["Database"] = None,
+                 min_depth: int = MIN_DEPTH, max_depth: int = MAX_DEPTH,
+                 bird: Optional[BirdWorkerPool] = None):
+        super().__init__(source)
+        self.cursor_store = cursor_store
+        # Without a shared pool, bird is spawned per call
+        self.bird = bird or BirdWorkerPool()
+        self.min_depth = max(1, min_depth)
+        self.max_depth = max(self.min_depth, max_depth)
+        self._pending_cursor: Optional[SourceCursor] = None
+
+    @classmethod
+    def tweet_id(cls, tweet: dict) -> Optional[int]:
+        """Numeric tweet ID from bird's id/id_str/rest_id fields or the status URL."""
+        for key in ("id_str", "id", "rest_id"):
+            value = tweet.get(key)
+            if value is not None and str(value).isdigit():
+                return int(value)
+        match = cls._STATUS_ID.search(str(tweet.get("url") or ""))
+        return int(match.group(1)) if match else None
+
     async def fetch(self) -> List[dict]:
+        return [tweet async for tweet in self.stream()]
+
+    async def stream(self) -> AsyncIterator[dict]:
+        """Yield new tweets as bird prints them; the advanced cursor waits for commit()."""
         username = str(self.source.url).split('/')[-1]
         logger.info(f"🐦 Fetching tweets for @{username}...")
-        
-        # Construct bird command: bird user-tweets @username -n 5 --json --plain
-        cmd = [
-            "/opt/homebrew/bin/bird", 
-            "user-tweets", 
-            f"@{username}", 
-            "-n", "5", 
-            "--json", 
-            "--plain"
-        ]
-        
-        # Prepare environment variables specifically for bird
-        env = os.environ.copy()
-        if os.getenv("BIRD_AUTH_TOKEN"):
-            env["AUTH_TOKEN"] = os.getenv("BIRD_AUTH_TOKEN")
-        if os.getenv("BIRD_CT0"):
-            env["CT0"] = os.getenv("BIRD_CT0")
-            
-        try:
-            # Run bird in a subprocess (blocking call wrapped in async)
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=env
-            )
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode != 0:
-                logger.error(f"Bird CLI failed: {stderr.decode()}")
-                return []
-                
-            output = stdout.decode()
-            if not output.strip():
-                return []
-
-            # Bird outputs JSON lines or a JSON array depending on version/flags.
-            # We assume --json returns a valid JSON structure or line-delimited JSON.
+
+        if self.cursor_store is None:
+            try:
+                async for tweet in self._stream_bird(username, self.min_depth):
+                    yield tweet
+            except BirdError:
+                self.failed = True
+            return
+
+        cursor = await self.cursor_store.get_source_cursor(self.source.name)
+        if cursor is None:
+            cursor = SourceCursor(self.source.name, fetch_depth=self.min_depth)
+        last_seen = int(cursor.last_seen_id) if cursor.last_seen_id and cursor.last_seen_id.isdigit() else None
+        depth = min(max(cursor.fetch_depth or self.min_depth, self.min_depth), self.max_depth)
+        newest = last_seen
+        # IDs, or URL/text for tweets without one
+        yielded: Set[Union[int, str]] = set()
+
+        while True:
+            seen = fresh = 0
             try:
-                data = json.loads(output)
-                # Ensure it's a list
-                if isinstance(data, dict):
-                    data = [data]
-                return data
-            except json.JSONDecodeError:
-                # Handle line-delimited JSON if necessary
-                logger.warning("JSON decode failed, attempting line-parsing fallback (not impl yet)")
-                return []
-                
-        except Exception as e:
-            logger.exception(f"Error running bird adapter: {e}")
-            return []
-
-from src.core.adapter_web import GenericAdapter
+                async for tweet in self._stream_bird(username, depth):
+                    seen += 1
+                    tid = self.tweet_id(tweet)
+                    if tid is not None:
+                        newest = max(newest or 0, tid)
+                        if last_seen is not None and tid <= last_seen:
+                            continue
+                        fresh += 1
+                        key = tid
+                    else:
+                        key = tweet.get("url") or tweet.get("full_text") or tweet.get("text")
+                    if key is not None:
+                        # A deeper refetch repeats the tweets already passed on
+                        if key in yielded:
+                            continue
+                        yielded.add(key)
+                    yield tweet
+            except BirdError:
+                # Keep the cursor: the tweets after the failure were never seen
+                self.failed = True
+                return
+            if not seen:
+                # Empty timeline: keep the cursor as is
+                return
+            # Every tweet in the page is new: there may be more we did not reach
+            saturated = last_seen is not None and fresh == seen and seen >= depth
+            if not saturated or depth >= self.max_depth:
+                break
+            depth = min(depth * 2, self.max_depth)
+            logger.debug(f"📈 @{username} posted more than the fetch depth, refetching with -n {depth}")
+
+        if last_seen is not None and fresh * 4 < depth:
+            # Quiet account: shrink slowly toward the minimum
+            depth = max(self.min_depth, depth // 2)
+        self._pending_cursor = SourceCursor(
+            self.source.name,
+            last_seen_id=str(newest) if newest is not None else cursor.last_seen_id,
+            fetch_depth=depth,
+            updated_at=datetime.now(),
+        )
+
+        if last_seen is not None:
+            logger.debug(f"@{username}: {fresh}/{seen} new tweets (next depth {depth})")
+
+    async def commit(self) -> None:
+        """Save the cursor advanced by the last stream()."""
+        cursor, self._pending_cursor = self._pending_cursor, None
+        if cursor is not None and self.cursor_store is not None:
+            await self.cursor_store.save_source_cursor(cursor)
+
+    async def _stream_bird(self, username: str, count: int) -> AsyncIterator[dict]:
+        # bird user-tweets @username -n <count> --json --plain
+        args = ["user-tweets", f"@{username}", "-n", str(count), "--json", "--plain"]
+        async for tweet in self.bird.run(args):
+            yield tweet
 
 class FetcherFactory:
     @staticmethod
-    def get_adapter(source: Source) -> BaseAdapter:
+    def get_adapter(source: Source, http_client: Optional[httpx.AsyncClient] = None,
+                    validator_cache: Optional[ValidatorCache] = None,
+                    cursor_store: Optional["Database"] = None,
+                    bird: Optional[BirdWorkerPool] = None) -> BaseAdapter:
+        """
+        Pick an adapter by URL.
+
+        Web adapters share `http_client` and `validator_cache`; Twitter
+        adapters fetch incrementally when given a `cursor_store` and share
+        the `bird` worker pool.
+        """
+        # Imported here: adapter_web subclasses BaseAdapter from this module
+        from src.core.adapter_web import GenericAdapter
+
         url_str = str(source.url).lower()
         if "x.com" in url_str or "twitter.com" in url_str:
-            return TwitterAdapter(source)
+            depth = config.advanced.get('twitter_fetch_depth') or {}
+            return TwitterAdapter(
+                source,
+                cursor_store=cursor_store,
+                min_depth=depth.get('min', TwitterAdapter.MIN_DEPTH),
+                max_depth=depth.get('max', TwitterAdapter.MAX_DEPTH),
+                bird=bird,
+            )
         else:
-            return GenericAdapter(source)
+            return GenericAdapter(source, client=http_client, cache=validator_cache)
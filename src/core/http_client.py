@@ -0,0 +1,36 @@
+"""
+Shared HTTP Client - One Pooled httpx.AsyncClient per Engine
+
+Creating an AsyncClient per fetch throws away keep-alive connections and TLS
+sessions. The engine builds one client from config.advanced and hands it to
+every web adapter. HTTP/2 is enabled when the optional `h2` package is
+installed (`pip install httpx[http2]`).
+"""
+
+import importlib.util
+from typing import Any, Dict, Optional
+import httpx
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def create_http_client(settings: Optional[Dict[str, Any]] = None) -> httpx.AsyncClient:
+    """
+    Build the shared client from the `advanced` config section.
+
+    Recognised keys: http_timeout, http_connect_timeout, http_max_connections,
+    http_max_keepalive, http_keepalive_expiry, http2.
+    """
+    settings = settings or {}
+    timeout = float(settings.get('http_timeout', 10))
+    limits = httpx.Limits(
+        max_connections=settings.get('http_max_connections', 100),
+        max_keepalive_connections=settings.get('http_max_keepalive', 20),
+        keepalive_expiry=settings.get('http_keepalive_expiry', 30.0),
+    )
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(timeout, connect=settings.get('http_connect_timeout', min(timeout, 5.0))),
+        limits=limits,
+        http2=bool(settings.get('http2', True)) and HTTP2_AVAILABLE,
+        follow_redirects=True,
+    )
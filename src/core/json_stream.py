@@ -0,0 +1,184 @@
+"""
+JSON Stream - Incremental Parsing of JSON Array / NDJSON Output
+
+Parses records from a byte stream (e.g. a subprocess stdout) as they arrive,
+instead of buffering the whole output. Two layouts are recognised from the
+first non-whitespace byte:
+
+- `[` : a JSON array (compact or pretty-printed); each element is yielded
+  as soon as it is complete.
+- otherwise: a sequence of values, usually NDJSON. A value starting with
+  `{` is decoded from the buffer, so a pretty-printed object (e.g. bird's
+  `{"tweets": [...]}` wrapper) is one record however many lines it spans;
+  any other value is parsed one line at a time. A malformed record is
+  skipped up to the next line starting with `{`.
+
+Memory is bounded by the largest single record (max_record_bytes) plus one
+read chunk, regardless of how much output the process produces.
+"""
+
+import codecs
+import json
+from typing import Any, AsyncIterator, Protocol
+from loguru import logger
+
+CHUNK_SIZE = 64 * 1024
+MAX_RECORD_BYTES = 4 * 1024 * 1024
+
+_WHITESPACE = " \t\r\n"
+
+
+class ByteReader(Protocol):
+    async def read(self, n: int = -1) -> bytes: ...
+
+
+class JSONStreamError(ValueError):
+    """Raised when a single record exceeds the size limit or the array is malformed."""
+
+
+async def _chunks(reader: ByteReader, chunk_size: int) -> AsyncIterator[str]:
+    """Decode UTF-8 text from the reader, safe across chunk boundaries."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        data = await reader.read(chunk_size)
+        if not data:
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+            return
+        text = decoder.decode(data)
+        if text:
+            yield text
+
+
+async def iter_json_records(
+    reader: ByteReader,
+    chunk_size: int = CHUNK_SIZE,
+    max_record_bytes: int = MAX_RECORD_BYTES,
+) -> AsyncIterator[Any]:
+    """Yield JSON records from a JSON array or NDJSON byte stream as they complete."""
+    chunks = _chunks(reader, chunk_size)
+    buffer = ""
+    async for text in chunks:
+        buffer += text
+        if buffer.lstrip(_WHITESPACE):
+            break
+    else:
+        return
+
+    buffer = buffer.lstrip(_WHITESPACE)
+    if buffer.startswith("["):
+        records = _iter_array(buffer[1:], chunks, max_record_bytes)
+    else:
+        records = _iter_values(buffer, chunks, max_record_bytes)
+    async for record in records:
+        yield record
+
+
+async def _iter_array(buffer: str, chunks: AsyncIterator[str], max_record_bytes: int) -> AsyncIterator[Any]:
+    decoder = json.JSONDecoder()
+    eof = False
+    expect_value = True  # False right after an element, until a ',' is seen
+
+    async def more() -> bool:
+        nonlocal buffer, eof
+        if eof:
+            return False
+        try:
+            buffer += await chunks.__anext__()
+            return True
+        except StopAsyncIteration:
+            eof = True
+            return False
+
+    while True:
+        buffer = buffer.lstrip(_WHITESPACE)
+        if not buffer:
+            if not await more():
+                logger.warning("JSON array ended without a closing ']'")
+                return
+            continue
+        if buffer[0] == "]":
+            return
+        if not expect_value:
+            if buffer[0] != ",":
+                raise JSONStreamError(f"Expected ',' between array elements, got {buffer[:20]!r}")
+            buffer = buffer[1:]
+            expect_value = True
+            continue
+
+        try:
+            record, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError:
+            # Element not complete yet (or malformed): read more and retry
+            if len(buffer) > max_record_bytes:
+                raise JSONStreamError(f"JSON record exceeds {max_record_bytes} bytes")
+            if not await more():
+                raise JSONStreamError("Truncated JSON array")
+            continue
+        if end == len(buffer) and not isinstance(record, (dict, list, str)) and await more():
+            # A bare number at the end of the buffer may continue in the next chunk
+            continue
+        buffer = buffer[end:]
+        expect_value = False
+        yield record
+
+
+async def _iter_values(buffer: str, chunks: AsyncIterator[str], max_record_bytes: int) -> AsyncIterator[Any]:
+    decoder = json.JSONDecoder()
+    eof = False
+    resync = False  # After a malformed object: skip lines until one starts with '{'
+
+    async def more() -> bool:
+        nonlocal buffer, eof
+        if eof:
+            return False
+        try:
+            buffer += await chunks.__anext__()
+            return True
+        except StopAsyncIteration:
+            eof = True
+            return False
+
+    while True:
+        buffer = buffer.lstrip(_WHITESPACE)
+        if not buffer:
+            if not await more():
+                return
+            continue
+
+        if buffer[0] == "{":
+            resync = False
+            try:
+                record, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError as e:
+                # An error on the last line may just be a record still arriving
+                if "\n" not in buffer[e.pos:] and not eof:
+                    if len(buffer) > max_record_bytes:
+                        raise JSONStreamError(f"JSON record exceeds {max_record_bytes} bytes")
+                    await more()
+                    continue
+                line, _, buffer = buffer.partition("\n")
+                logger.warning(f"Skipping malformed JSON record: {line[:80]!r}")
+                resync = True
+                continue
+            buffer = buffer[end:]
+            yield record
+            continue
+
+        newline = buffer.find("\n")
+        if newline < 0 and not eof:
+            if len(buffer) > max_record_bytes:
+                raise JSONStreamError(f"JSON line exceeds {max_record_bytes} bytes")
+            await more()
+            continue
+        if newline < 0:
+            line, buffer = buffer, ""
+        else:
+            line, buffer = buffer[:newline], buffer[newline + 1:]
+        if resync:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(f"Skipping malformed JSON line: {line[:80]!r}")
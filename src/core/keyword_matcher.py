@@ -0,0 +1,118 @@
+"""
+Keyword Matcher - Single-Pass Multi-Keyword Matching
+
+Compiles any number of keyword lists into one trie-shaped regex, so a text is
+scanned once instead of once per keyword. Works for Latin and CJK keywords
+alike; optional whole-word mode only applies word boundaries to ASCII
+letters/digits, so CJK keywords still match inside unsegmented text.
+
+Results are exact: every keyword that occurs in the text is reported, even
+when keywords overlap or contain one another.
+"""
+
+import re
+from typing import Dict, Iterable, Mapping, Set
+
+_ASCII_WORD = re.compile(r"[a-z0-9]")
+_BOUNDARY_BEFORE = r"(?<![a-z0-9])"
+_BOUNDARY_AFTER = r"(?![a-z0-9])"
+
+
+class KeywordMatcher:
+    """Matches several named keyword groups against text in one regex pass."""
+
+    def __init__(self, groups: Mapping[str, Iterable[str]], whole_word: bool = False):
+        """
+        Args:
+            groups: Group name -> keywords (literal strings, case-insensitive)
+            whole_word: Require ASCII word boundaries around Latin keywords
+        """
+        self.whole_word = whole_word
+        self.groups: Dict[str, Set[str]] = {}
+        self._keyword_groups: Dict[str, Set[str]] = {}
+        for group, keywords in groups.items():
+            members = self.groups.setdefault(group, set())
+            for keyword in keywords:
+                kw = keyword.strip().lower()
+                if not kw:
+                    continue
+                members.add(kw)
+                self._keyword_groups.setdefault(kw, set()).add(group)
+
+        self._pattern = re.compile(self._build_pattern(self._keyword_groups)) if self._keyword_groups else None
+        self._implied = self._build_implied(self._keyword_groups)
+
+    def find(self, text: str) -> Set[str]:
+        """Return every keyword (lower-cased) that occurs in text."""
+        if self._pattern is None or not text:
+            return set()
+        text = text.lower()
+        search = self._pattern.search
+        found: Set[str] = set()
+        match = search(text)
+        while match:
+            found |= self._implied[match.group()]
+            # Restart one character in so overlapping keywords are not skipped
+            match = search(text, match.start() + 1)
+        return found
+
+    def match(self, text: str) -> Dict[str, Set[str]]:
+        """Return group name -> keywords from that group found in text."""
+        hits: Dict[str, Set[str]] = {group: set() for group in self.groups}
+        for kw in self.find(text):
+            for group in self._keyword_groups[kw]:
+                hits[group].add(kw)
+        return hits
+
+    def _keyword_regex(self, kw: str) -> str:
+        body = re.escape(kw)
+        if self.whole_word:
+            if _ASCII_WORD.match(kw[0]):
+                body = _BOUNDARY_BEFORE + body
+            if _ASCII_WORD.match(kw[-1]):
+                body += _BOUNDARY_AFTER
+        return body
+
+    def _build_pattern(self, keywords: Iterable[str]) -> str:
+        """Build a trie-shaped alternation that prefers the longest keyword."""
+        trie: dict = {}
+        for kw in keywords:
+            node = trie
+            for char in kw:
+                node = node.setdefault(char, {})
+            node[""] = True  # terminal marker
+
+        def render(node: dict, last_char: str) -> str:
+            alternatives = [re.escape(char) + render(child, char)
+                            for char, child in sorted(node.items()) if char]
+            if "" in node:
+                # Terminal comes last so longer keywords win at the same start
+                end = _BOUNDARY_AFTER if self.whole_word and _ASCII_WORD.match(last_char) else ""
+                alternatives.append(end)
+            if len(alternatives) == 1:
+                return alternatives[0]
+            return "(?:" + "|".join(alternatives) + ")"
+
+        roots = []
+        for char, child in sorted(trie.items()):
+            start = _BOUNDARY_BEFORE if self.whole_word and _ASCII_WORD.match(char) else ""
+            roots.append(start + re.escape(char) + render(child, char))
+        return "|".join(roots)
+
+    def _build_implied(self, keywords: Iterable[str]) -> Dict[str, Set[str]]:
+        """
+        For each keyword, the keywords that must also be present when it matches.
+
+        The scanner reports only the longest keyword at each start position;
+        shorter keywords inside it are recovered from this table.
+        """
+        keywords = list(keywords)
+        compiled = {kw: re.compile(self._keyword_regex(kw)) for kw in keywords}
+        implied: Dict[str, Set[str]] = {}
+        for kw in keywords:
+            inside = {kw}
+            for other in keywords:
+                if other != kw and len(other) < len(kw) and other in kw and compiled[other].search(kw):
+                    inside.add(other)
+            implied[kw] = inside
+        return implied
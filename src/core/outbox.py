@@ -0,0 +1,192 @@
+"""
+Outbox - Durable At-Least-Once Alert Delivery
+
+Alerts used to be recorded only after the Telegram call returned, so a crash
+mid-cycle either lost the alert or sent it twice. Now the engine writes each
+alert message to the `outbox` table in the same transaction as the alert
+record (Database.record_alerts), and the OutboxDrainer delivers it later:
+
+1. A background task polls for due `pending` rows (and is woken right after
+   a cycle writes new ones) and hands them to the TelegramQueue.
+2. The queue's completion callback marks the row `sent`, or schedules a
+   retry with exponential backoff; after `max_attempts` it becomes `failed`.
+3. Rows are keyed by an idempotency key, so re-inserting the same message is
+   a no-op and a row in flight is never handed to the queue twice.
+
+Rows left `pending` by a crash are picked up on the next start, so every
+alert is delivered at least once; a crash between Telegram accepting a
+message and the row being marked can repeat that one message.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Set
+from loguru import logger
+
+from src.core.database import Database
+from src.core.validator_cache import content_hash
+from src.models.schemas import OutboxMessage
+from src.utils.telegram_queue import TelegramQueue
+
+
+def outbox_message(chat_id: str, text: str) -> OutboxMessage:
+    """Outbox row for `text`; identical text to the same chat shares one key."""
+    return OutboxMessage(idempotency_key=content_hash(f"{chat_id}\n{text}"), chat_id=chat_id, message=text)
+
+
+class OutboxDrainer:
+    """Background task moving due outbox rows onto the Telegram queue."""
+
+    def __init__(
+        self,
+        queue: TelegramQueue,
+        poll_interval: float = 30.0,
+        batch_size: int = 50,
+        max_attempts: int = 10,
+        retry_base: float = 60.0,
+        retry_max: float = 3600.0,
+        keep_days: int = 7,
+    ):
+        """
+        Args:
+            queue: Delivery queue (rate limits and short-term retries)
+            poll_interval: Seconds between checks for due rows
+            batch_size: Rows read per check
+            max_attempts: Failed queue deliveries before a row is marked failed
+            retry_base: Delay before the first outbox-level retry (seconds, doubles)
+            retry_max: Cap on the retry delay (seconds)
+            keep_days: Delivered rows older than this are deleted on start
+        """
+        self.queue = queue
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.keep_days = keep_days
+        self._db: Optional[Database] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._inflight: Set[str] = set()
+        self._idle: Optional[asyncio.Event] = None
+
+    @classmethod
+    def from_config(cls, queue: TelegramQueue, settings: Optional[Dict[str, Any]]) -> "OutboxDrainer":
+        settings = settings or {}
+        return cls(
+            queue,
+            poll_interval=settings.get('poll_interval', 30.0),
+            batch_size=settings.get('batch_size', 50),
+            max_attempts=settings.get('max_attempts', 10),
+            retry_base=settings.get('retry_base', 60.0),
+            retry_max=settings.get('retry_max', 3600.0),
+            keep_days=settings.get('keep_days', 7),
+        )
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    def start(self, db: Database) -> None:
+        """
+        Start the drain task on the running loop (no-op if already running).
+
+        `db` is the caller's connection holding the outbox, already migrated
+        (init_tables); the drainer uses it until stop() but never closes it.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._task is not None and not self._task.done():
+            return
+        self._loop = loop
+        self._db = db
+        self._wake = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._inflight.clear()
+        self._task = asyncio.create_task(self._run())
+
+    def notify(self) -> None:
+        """Wake the drain task now (new rows were written); rows wait for start() if it isn't running."""
+        if self._wake is not None and self._loop is asyncio.get_running_loop():
+            self._wake.set()
+
+    async def _run(self) -> None:
+        await self._db.prune_outbox(self.keep_days)
+        while True:
+            try:
+                await self.drain_once()
+            except Exception as e:
+                logger.error(f"❌ Outbox drain failed: {e}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def drain_once(self) -> int:
+        """Hand due rows to the queue; returns how many were enqueued."""
+        rows = await self._db.get_pending_outbox(self.batch_size)
+        enqueued = 0
+        for row in rows:
+            if row.idempotency_key in self._inflight:
+                continue
+            self._inflight.add(row.idempotency_key)
+            self._idle.clear()
+            if self.queue.enqueue(row.message, row.chat_id, on_done=self._on_done_callback(row)):
+                enqueued += 1
+            else:
+                # Queue full: leave the row pending for the next pass
+                self._finish(row.idempotency_key)
+                break
+        if enqueued:
+            logger.info(f"📤 Outbox: {enqueued} message(s) handed to the Telegram queue")
+        return enqueued
+
+    def _on_done_callback(self, row: OutboxMessage):
+        async def on_done(ok: bool) -> None:
+            db = self._db
+            try:
+                if db is None:
+                    return  # Stopped meanwhile: the row stays pending and is resent on restart
+                if ok:
+                    await db.mark_outbox_sent(row.idempotency_key)
+                elif row.attempts + 1 >= self.max_attempts:
+                    logger.error(f"❌ Outbox message {row.idempotency_key} failed {row.attempts + 1} times, giving up")
+                    await db.mark_outbox_failed(row.idempotency_key)
+                else:
+                    delay = min(self.retry_base * 2 ** row.attempts, self.retry_max)
+                    await db.mark_outbox_failed(row.idempotency_key, datetime.now() + timedelta(seconds=delay))
+            finally:
+                self._finish(row.idempotency_key)
+        return on_done
+
+    def _finish(self, key: str) -> None:
+        self._inflight.discard(key)
+        if not self._inflight:
+            self._idle.set()
+
+    async def stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send what is due, wait for in-flight rows to settle, then stop.
+
+        Returns False if `timeout` expired first; unsent rows stay pending in
+        the database and go out on the next start.
+        """
+        if self._task is None or self._loop is not asyncio.get_running_loop():
+            return True
+        settled = True
+        try:
+            await asyncio.wait_for(self._flush(), timeout)
+        except asyncio.TimeoutError:
+            settled = False
+            logger.warning(f"⚠️ Outbox stop timed out with {self.inflight} message(s) in flight")
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._db = None
+        return settled
+
+    async def _flush(self) -> None:
+        await self.drain_once()
+        await self._idle.wait()
@@ -1,70 +1,124 @@
 import re
-from typing import List
+from typing import List, Optional, Set
 from datetime import datetime
 from loguru import logger
 from src.models.schemas import Source, Signal, SignalType
+from src.core.config import config
+from src.core.keyword_matcher import KeywordMatcher
+from src.core.ticker_universe import TickerUniverse
+
+TICKER_UNIVERSE_PATH = "config/tickers.txt"
 
 class SignalProcessor:
     """
     Zero-Token Signal Extractor.
     Uses Regex and Keyword Matching to identify trading signals.
     """
-    
+
     # 基础词库 (扩充需谨慎，避免误报)
+    # Defaults; config.signal_processing.keywords overrides them when present.
     KEYWORDS_BULLISH = [
         r"buy", r"long", r"call", r"breakout", r"moon", r"bull",
         r"买入", r"看多", r"加仓", r"突破", r"目标价", r"起飞"
     ]
-    
+
     KEYWORDS_BEARISH = [
         r"sell", r"short", r"put", r"breakdown", r"dump", r"bear",
         r"卖出", r"看空", r"减仓", r"跌破", r"止损", r"崩盘"
     ]
-    
+
+    # Filter out common false positives (e.g. "THE", "AND" if regex is too loose)
+    # Augmented Blacklist based on test run; merged with config.signal_processing.blacklist
+    BLACKLIST = frozenset([
+        "THE", "AND", "FOR", "AI", "CPU", "GPU",
+        "API", "APP", "GUI", "CLI", "GPT", "LLM", "GLM", "UNIX", "PDF", "SDK", "URL", "HTTP", "WWW", "COM"
+    ])
+
     # 股票代码正则: $NVDA, AAPL, 600519
     # 1. $XYZ (US Crypto style)
     # 2. 6 digits (CN style)
     REGEX_TICKER = r"(\$[A-Z]{2,5})|(\b[A-Z]{2,5}\b)|(\b\d{6}\b)"
+    _TICKER_PATTERN = re.compile(REGEX_TICKER)
+
+    _sentiment_matcher: Optional[KeywordMatcher] = None
+    _blacklist: Optional[frozenset] = None
+    _universe: Optional[TickerUniverse] = None
+
+    @classmethod
+    def _get_sentiment_matcher(cls) -> KeywordMatcher:
+        """Build (once) the single-pass bullish/bearish matcher from config."""
+        if cls._sentiment_matcher is None:
+            keywords = config.signal_processing.get('keywords') or {}
+            cls._sentiment_matcher = KeywordMatcher({
+                'bullish': keywords.get('bullish') or cls.KEYWORDS_BULLISH,
+                'bearish': keywords.get('bearish') or cls.KEYWORDS_BEARISH,
+            })
+        return cls._sentiment_matcher
+
+    @classmethod
+    def _get_blacklist(cls) -> frozenset:
+        if cls._blacklist is None:
+            extra = config.signal_processing.get('blacklist') or []
+            cls._blacklist = cls.BLACKLIST | {w.upper() for w in extra}
+        return cls._blacklist
+
+    @classmethod
+    def _get_universe(cls) -> TickerUniverse:
+        if cls._universe is None:
+            path = config.signal_processing.get('ticker_universe', TICKER_UNIVERSE_PATH)
+            cls._universe = TickerUniverse(path)
+        return cls._universe
+
+    @classmethod
+    def _extract_tickers(cls, text: str) -> Set[str]:
+        """
+        Extract tickers from text.
+
+        Cashtags ($XYZ) are taken at face value; bare uppercase words and
+        6-digit codes must be in the ticker universe. Without a universe
+        file every non-blacklisted candidate is kept (legacy behaviour).
+        """
+        blacklist = cls._get_blacklist()
+        universe = cls._get_universe()
+        validate = universe.loaded
+        tickers = set()
+        for m in cls._TICKER_PATTERN.finditer(text):
+            is_cashtag = m.lastindex == 1
+            # Cleaning: remove $ if present
+            t = m.group(0).replace("$", "").upper()
+            if t in blacklist:
+                continue
+            if validate and not is_cashtag and not universe.is_known(t):
+                continue
+            tickers.add(t)
+        return tickers
+
+    @classmethod
+    def _calculate_sentiment(cls, text: str) -> int:
+        """Keyword score: +1 per distinct bullish keyword, -1 per bearish one."""
+        hits = cls._get_sentiment_matcher().match(text)
+        return len(hits['bullish']) - len(hits['bearish'])
 
     @staticmethod
     def process(source: Source, raw_data: List[dict]) -> List[Signal]:
         signals = []
-        
+        # Pick up edits to the ticker universe file without a restart
+        SignalProcessor._get_universe().maybe_reload()
+
         for item in raw_data:
             text = item.get("full_text", "") or item.get("text", "")
             if not text:
                 continue
-                
+
             # 1. Ticker Extraction
-            tickers = set()
-            matches = re.finditer(SignalProcessor.REGEX_TICKER, text)
-            for m in matches:
-                # Cleaning: remove $ if present
-                t = m.group(0).replace("$", "").upper()
-                # Filter out common false positives (e.g. "THE", "AND" if regex is too loose)
-                # Augmented Blacklist based on test run
-                blacklist = [
-                    "THE", "AND", "FOR", "AI", "CPU", "GPU", 
-                    "API", "APP", "GUI", "CLI", "GPT", "LLM", "GLM", "UNIX", "PDF", "SDK", "URL", "HTTP", "WWW", "COM"
-                ]
-                if t not in blacklist: 
-                    tickers.add(t)
-            
+            tickers = SignalProcessor._extract_tickers(text)
+
             if not tickers:
                 continue
 
-            # 2. Sentiment Analysis (Keyword Counting)
-            score = 0
-            text_lower = text.lower()
-            
-            for kw in SignalProcessor.KEYWORDS_BULLISH:
-                if re.search(kw, text_lower):
-                    score += 1
-            
-            for kw in SignalProcessor.KEYWORDS_BEARISH:
-                if re.search(kw, text_lower):
-                    score -= 1
-            
+            # 2. Sentiment Analysis (Keyword Counting, single pass)
+            score = SignalProcessor._calculate_sentiment(text)
+
             # 3. Determine Signal Type
             if score > 0:
                 sig_type = SignalType.BULLISH
@@ -72,14 +126,14 @@ class SignalProcessor:
                 sig_type = SignalType.BEARISH
             else:
                 sig_type = SignalType.NEUTRAL
-                
+
             # Only generate signals for detected tickers if sentiment is non-neutral
             # (Or maybe we want neutral for information? Let's keep neutral for now but maybe filter later)
-            
+
             for ticker in tickers:
                 # Context check: simple proximity check could be added here
                 # For now, if ticker and sentiment exist in same text, we assume linkage.
-                
+
                 signal = Signal(
                     ticker=ticker,
                     signal_type=sig_type,
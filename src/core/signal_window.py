@@ -0,0 +1,124 @@
+"""
+Signal Window - Incremental Sliding-Window Aggregation
+
+Keeps per-ticker sentiment tallies for the last N hours so that each cycle
+only pays for the signals it adds or expires, instead of reloading and
+regrouping the whole window from the database.
+
+The window mirrors what this process has written; it is seeded from the
+database once and then fed with every newly saved signal.
+"""
+
+import heapq
+import itertools
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.models.schemas import Signal, SignalType
+
+
+class TickerAggregate:
+    """Running sentiment tallies for one ticker inside the window."""
+
+    __slots__ = ("ticker", "counts", "source_counts", "source_confidence", "_signals")
+
+    def __init__(self, ticker: str):
+        self.ticker = ticker
+        self.counts: Dict[SignalType, int] = {t: 0 for t in SignalType}
+        # Per-source tallies; platform and category views are derived from these
+        self.source_counts: Dict[str, Dict[SignalType, int]] = {}
+        self.source_confidence: Dict[str, Dict[SignalType, float]] = {}
+        self._signals: Dict[int, Signal] = {}
+
+    @classmethod
+    def from_signals(cls, ticker: str, signals: Iterable[Signal]) -> "TickerAggregate":
+        agg = cls(ticker)
+        for seq, signal in enumerate(signals):
+            agg.add(seq, signal)
+        return agg
+
+    @property
+    def total(self) -> int:
+        return len(self._signals)
+
+    def add(self, seq: int, signal: Signal) -> None:
+        self._signals[seq] = signal
+        self.counts[signal.signal_type] += 1
+        counts = self.source_counts.setdefault(signal.source_name, {t: 0 for t in SignalType})
+        counts[signal.signal_type] += 1
+        confidence = self.source_confidence.setdefault(signal.source_name, {t: 0.0 for t in SignalType})
+        confidence[signal.signal_type] += signal.confidence
+
+    def remove(self, seq: int) -> None:
+        signal = self._signals.pop(seq, None)
+        if signal is None:
+            return
+        self.counts[signal.signal_type] -= 1
+        counts = self.source_counts[signal.source_name]
+        counts[signal.signal_type] -= 1
+        if not any(counts.values()):
+            del self.source_counts[signal.source_name]
+            del self.source_confidence[signal.source_name]
+        else:
+            self.source_confidence[signal.source_name][signal.signal_type] -= signal.confidence
+
+    def recent_signals(self) -> List[Signal]:
+        """Signals in the window, newest first (materialized on demand)."""
+        return sorted(self._signals.values(), key=lambda s: s.timestamp, reverse=True)
+
+
+class SignalWindow:
+    """Sliding time window of signals with per-ticker aggregates."""
+
+    def __init__(self, hours: int = 24):
+        self.window = timedelta(hours=hours)
+        self.tickers: Dict[str, TickerAggregate] = {}
+        self.seeded = False
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._seq = itertools.count()
+        self._dirty: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def get(self, ticker: str) -> Optional[TickerAggregate]:
+        return self.tickers.get(ticker)
+
+    def add(self, signal: Signal) -> None:
+        seq = next(self._seq)
+        agg = self.tickers.get(signal.ticker)
+        if agg is None:
+            agg = self.tickers[signal.ticker] = TickerAggregate(signal.ticker)
+        agg.add(seq, signal)
+        heapq.heappush(self._heap, (signal.timestamp, seq, signal.ticker))
+        self._dirty.add(signal.ticker)
+
+    def add_many(self, signals: Iterable[Signal]) -> None:
+        for signal in signals:
+            self.add(signal)
+
+    def expire(self, now: Optional[datetime] = None) -> int:
+        """Drop signals older than the window. Returns the number removed."""
+        cutoff = (now or datetime.now()) - self.window
+        removed = 0
+        while self._heap and self._heap[0][0] <= cutoff:
+            _, seq, ticker = heapq.heappop(self._heap)
+            agg = self.tickers[ticker]
+            agg.remove(seq)
+            if agg.total == 0:
+                del self.tickers[ticker]
+                self._dirty.discard(ticker)
+            else:
+                self._dirty.add(ticker)
+            removed += 1
+        return removed
+
+    def mark_dirty(self, ticker: str) -> None:
+        """Re-queue a ticker for analysis on the next pass."""
+        if ticker in self.tickers:
+            self._dirty.add(ticker)
+
+    def pop_dirty(self) -> Set[str]:
+        """Return and clear the tickers whose aggregates changed."""
+        dirty, self._dirty = self._dirty, set()
+        return dirty
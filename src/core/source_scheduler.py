@@ -0,0 +1,207 @@
+"""
+Source Scheduler - Adaptive Per-Source Fetch Scheduling
+
+The scheduler used to scan every source every `interval_minutes`. Busy
+accounts were sampled too rarely, quiet blogs were polled for nothing, and
+all fetches landed in one hourly spike. SourceScheduler gives each source
+its own next-due time instead, kept in a heap:
+
+- Post rate: an EWMA of new signals per hour. A source is revisited when
+  about `target_new_signals` new signals are expected, so busy sources run
+  often and quiet ones drift towards `max_interval`.
+- Weight: Source.weight divides the interval (weight 2 runs twice as often).
+- Errors: each consecutive failed fetch doubles the interval, up to
+  `max_interval`.
+
+Intervals are clamped to [min_interval, max_interval] and jittered. New
+sources are staggered over `min_interval`, so fetches spread out instead of
+arriving together.
+"""
+
+import heapq
+import itertools
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from loguru import logger
+
+from src.models.schemas import Source
+
+
+@dataclass(slots=True)
+class SourceSchedule:
+    """Scheduling state of one source (times are time.monotonic())."""
+    source: Source
+    next_due: Optional[float] = None  # None while the source is being fetched
+    interval: float = 0.0
+    rate: Optional[float] = None  # EWMA of new signals per hour
+    errors: int = 0
+    last_fetch: Optional[float] = None
+
+
+class SourceScheduler:
+    """Priority queue of sources keyed by their next-due time."""
+
+    def __init__(
+        self,
+        base_interval: float = 3600.0,
+        min_interval: float = 300.0,
+        max_interval: float = 6 * 3600.0,
+        target_new_signals: float = 1.0,
+        ewma_alpha: float = 0.3,
+        jitter: float = 0.1,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            base_interval: Interval of a weight-1 source before its rate is known (seconds)
+            min_interval: Shortest interval between fetches of one source (seconds)
+            max_interval: Longest interval, also the cap on error backoff (seconds)
+            target_new_signals: New signals a fetch should find on average
+            ewma_alpha: Weight of the latest observation in the post-rate EWMA
+            jitter: Random +/- fraction applied to every interval
+            seed: Seed for the jitter (tests)
+        """
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.target_new_signals = target_new_signals
+        self.ewma_alpha = ewma_alpha
+        self.jitter = jitter
+        self._rng = random.Random(seed)
+        self._states: Dict[str, SourceSchedule] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = itertools.count()
+
+    @classmethod
+    def from_config(cls, settings: Optional[Dict[str, Any]]) -> "SourceScheduler":
+        """Build from the `scheduler` config section."""
+        settings = settings or {}
+        adaptive = settings.get('adaptive') or {}
+        return cls(
+            base_interval=settings.get('interval_minutes', 60) * 60,
+            min_interval=adaptive.get('min_interval_minutes', 5) * 60,
+            max_interval=adaptive.get('max_interval_minutes', 360) * 60,
+            target_new_signals=adaptive.get('target_new_signals', 1.0),
+            ewma_alpha=adaptive.get('ewma_alpha', 0.3),
+            jitter=adaptive.get('jitter', 0.1),
+        )
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def get(self, name: str) -> Optional[SourceSchedule]:
+        return self._states.get(name)
+
+    def sync(self, sources: Iterable[Source], now: Optional[float] = None) -> None:
+        """Track exactly `sources` (by name); new ones are staggered over min_interval."""
+        now = time.monotonic() if now is None else now
+        current: Dict[str, Source] = {}
+        for source in sources:
+            current.setdefault(source.name, source)
+        for name in [n for n in self._states if n not in current]:
+            del self._states[name]  # Its heap entries are skipped as stale
+        added = []
+        for name, source in current.items():
+            state = self._states.get(name)
+            if state is None:
+                state = self._states[name] = SourceSchedule(source=source)
+                added.append(state)
+            state.source = source
+            state.interval = self._interval(state)
+        for i, state in enumerate(added):
+            self._push(state, now + self.min_interval * i / len(added))
+        if added:
+            logger.debug(f"🗓️ Scheduling {len(added)} new source(s), {len(self._states)} tracked")
+
+    def _push(self, state: SourceSchedule, due: float) -> None:
+        state.next_due = due
+        heapq.heappush(self._heap, (due, next(self._seq), state.source.name))
+
+    def _peek(self) -> Optional[Tuple[float, int, str]]:
+        """Top heap entry, discarding stale ones (removed or rescheduled sources)."""
+        while self._heap:
+            due, _, name = self._heap[0]
+            state = self._states.get(name)
+            if state is not None and state.next_due == due:
+                return self._heap[0]
+            heapq.heappop(self._heap)
+        return None
+
+    def due(self, now: Optional[float] = None) -> List[Source]:
+        """Pop every source due by `now`; each must be reported back with record()."""
+        now = time.monotonic() if now is None else now
+        sources = []
+        while (entry := self._peek()) is not None and entry[0] <= now:
+            heapq.heappop(self._heap)
+            state = self._states[entry[2]]
+            state.next_due = None
+            sources.append(state.source)
+        return sources
+
+    def next_due_in(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the next source is due (None if nothing is scheduled)."""
+        entry = self._peek()
+        if entry is None:
+            return None
+        now = time.monotonic() if now is None else now
+        return max(0.0, entry[0] - now)
+
+    def record(self, name: str, new_signals: int, error: bool = False, now: Optional[float] = None) -> None:
+        """Fold one fetch outcome into the source's rate and schedule its next fetch."""
+        state = self._states.get(name)
+        if state is None:
+            return
+        now = time.monotonic() if now is None else now
+        if error:
+            state.errors += 1
+        else:
+            state.errors = 0
+            # The first fetch returns a backlog, not a rate
+            if state.last_fetch is not None:
+                hours = max((now - state.last_fetch) / 3600, 1 / 60)
+                observed = new_signals / hours
+                state.rate = observed if state.rate is None else (
+                    self.ewma_alpha * observed + (1 - self.ewma_alpha) * state.rate
+                )
+            state.last_fetch = now
+        state.interval = self._interval(state)
+        self._push(state, now + state.interval * (1 + self._rng.uniform(-self.jitter, self.jitter)))
+
+    def record_cycle(self, sources: Iterable[Source], stats: Optional[Any]) -> None:
+        """Record every source of an Engine cycle from its CycleStats (None: the cycle failed)."""
+        for source in {source.name: source for source in sources}.values():
+            if stats is None:
+                self.record(source.name, 0, error=True)
+            else:
+                self.record(source.name, stats.new_by_source.get(source.name, 0),
+                            error=source.name in stats.failed_sources)
+
+    def _interval(self, state: SourceSchedule) -> float:
+        weight = max(state.source.weight, 0.1)
+        if state.rate is None:
+            interval = self.base_interval / weight
+        else:
+            interval = self.target_new_signals * 3600 / max(state.rate, 1e-6) / weight
+        interval = min(max(interval, self.min_interval), self.max_interval)
+        if state.errors:
+            interval = min(interval * 2 ** state.errors, self.max_interval)
+        return interval
+
+    async def run_due(self, engine, window: float = 0.0) -> int:
+        """
+        Run one engine cycle over the sources due within `window` seconds.
+
+        Returns how many sources were fetched.
+        """
+        self.sync(engine.sources)
+        sources = self.due(time.monotonic() + window)
+        if not sources:
+            return 0
+        stats = None
+        try:
+            stats = await engine.run_cycle(sources)
+        finally:
+            self.record_cycle(sources, stats)
+        return len(sources)
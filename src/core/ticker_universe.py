@@ -0,0 +1,88 @@
+"""
+Ticker Universe - Known-Symbol Index for Ticker Validation
+
+Loads the set of tradable symbols (US equities, crypto, CN A-share codes)
+from a local text file and answers membership in O(1). The file is re-read
+when its mtime changes, so the list can be edited without a restart.
+
+File format: whitespace-separated symbols, '#' starts a comment, '[section]'
+headers are informational only.
+"""
+
+import os
+import time
+from typing import FrozenSet, Optional
+from loguru import logger
+
+# Shanghai (60x, 688), Shenzhen (000-003, 300/301) and Beijing (43x, 83x, 87x, 92x)
+# A-share code prefixes; any 6-digit code with one of these is accepted.
+CN_CODE_PREFIXES = (
+    "600", "601", "603", "605", "688", "689",
+    "000", "001", "002", "003", "300", "301",
+    "430", "830", "831", "832", "833", "834", "835", "836", "837", "838", "839",
+    "870", "871", "872", "873", "920",
+)
+
+
+class TickerUniverse:
+    """Set of known symbols backed by a hot-reloadable file."""
+
+    def __init__(self, path: str, check_interval: float = 5.0):
+        """
+        Args:
+            path: Symbol file path
+            check_interval: Minimum seconds between mtime checks
+        """
+        self.path = path
+        self.check_interval = check_interval
+        self.symbols: FrozenSet[str] = frozenset()
+        self._mtime: Optional[float] = None
+        self._last_check = 0.0
+        self._warned_missing = False
+        self.maybe_reload(force=True)
+
+    @property
+    def loaded(self) -> bool:
+        """False when the file is missing or empty (validation is then skipped)."""
+        return bool(self.symbols)
+
+    def maybe_reload(self, force: bool = False) -> bool:
+        """Reload the file if its mtime changed. Returns True if reloaded."""
+        now = time.monotonic()
+        if not force and now - self._last_check < self.check_interval:
+            return False
+        self._last_check = now
+
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            if not self._warned_missing:
+                logger.warning(f"⚠️ Ticker universe {self.path} not found, ticker validation disabled")
+                self._warned_missing = True
+            self.symbols, self._mtime = frozenset(), None
+            return False
+
+        if mtime == self._mtime:
+            return False
+        self.symbols = self._read(self.path)
+        self._mtime = mtime
+        self._warned_missing = False
+        logger.info(f"📇 Loaded {len(self.symbols)} symbols from {self.path}")
+        return True
+
+    def is_known(self, symbol: str) -> bool:
+        """O(1) membership test; 6-digit codes also pass on a valid A-share prefix."""
+        if symbol in self.symbols:
+            return True
+        return len(symbol) == 6 and symbol.isdigit() and symbol.startswith(CN_CODE_PREFIXES)
+
+    @staticmethod
+    def _read(path: str) -> FrozenSet[str]:
+        symbols = set()
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                entry = line.split("#", 1)[0].strip()
+                if not entry or entry.startswith("["):
+                    continue
+                symbols.update(s.lstrip("$").upper() for s in entry.split())
+        return frozenset(symbols)
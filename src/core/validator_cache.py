@@ -0,0 +1,88 @@
+"""
+Validator Cache - Conditional GET and Change Detection for Web Sources
+
+Keeps, per source URL, the HTTP validators (ETag / Last-Modified) from the
+last 200 response plus two content fingerprints:
+
+- body hash: identical bytes -> skip HTML parsing
+- text hash: identical extracted text (e.g. only ads/timestamps changed)
+  -> skip signal extraction
+
+A changed page is only recorded with store() once its signals are saved
+(GenericAdapter.commit), so a failed save does not make the page look
+unchanged on the next fetch. In-memory only; the engine owns one instance
+for its lifetime.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, Optional, Union
+
+
+def content_hash(data: Union[bytes, str]) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    body_hash: Optional[str] = None
+    text_hash: Optional[str] = None
+
+
+class ValidatorCache:
+    """Per-URL validators and content fingerprints."""
+
+    def __init__(self):
+        self._entries: Dict[str, CacheEntry] = {}
+        self.stats = {"not_modified": 0, "body_unchanged": 0, "text_unchanged": 0, "changed": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        return self._entries.get(url)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Request headers that let the server answer 304 Not Modified."""
+        entry = self._entries.get(url)
+        headers: Dict[str, str] = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def body_unchanged(self, url: str, etag: Optional[str], last_modified: Optional[str], body: bytes) -> bool:
+        """True if a 200 body matches the stored hash (its new validators are kept)."""
+        entry = self._entries.get(url)
+        if entry is None or content_hash(body) != entry.body_hash:
+            return False
+        entry.etag, entry.last_modified = etag, last_modified
+        self.stats["body_unchanged"] += 1
+        return True
+
+    def text_unchanged(self, url: str, text: str) -> bool:
+        """True if the extracted text matches the stored hash."""
+        entry = self._entries.get(url)
+        if entry is not None and content_hash(text) == entry.text_hash:
+            self.stats["text_unchanged"] += 1
+            return True
+        self.stats["changed"] += 1
+        return False
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str],
+              body: bytes, text: Optional[str] = None) -> None:
+        """Record a processed 200 response: validators, body hash and text hash."""
+        entry = self._entries.setdefault(url, CacheEntry())
+        entry.etag, entry.last_modified = etag, last_modified
+        entry.body_hash = content_hash(body)
+        if text is not None:
+            entry.text_hash = content_hash(text)
+
+    def record_not_modified(self) -> None:
+        self.stats["not_modified"] += 1
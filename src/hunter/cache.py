@@ -0,0 +1,104 @@
+import json
+import logging
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Any, List, Optional
+
+logger = logging.getLogger("HunterCache")
+
+
+class QueryCache:
+    """
+    On-disk TTL cache for Scout results, keyed by (source type, query).
+
+    Results are stored as zlib-compressed JSON in a single SQLite file. Entries
+    older than `ttl_seconds` are ignored and removed; when the stored payloads
+    exceed `max_bytes`, the least recently used entries are evicted.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 1800, max_bytes: int = 50 * 1024 * 1024):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS query_cache (
+                source_type TEXT NOT NULL,
+                query TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL,
+                payload BLOB NOT NULL,
+                PRIMARY KEY (source_type, query)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_query_cache_access ON query_cache (last_access)")
+        self._conn.commit()
+
+    @classmethod
+    def from_settings(cls, settings: dict) -> "QueryCache":
+        return cls(
+            path=settings.get('path', 'memory/hunter_cache.db'),
+            ttl_seconds=settings.get('ttl_minutes', 30) * 60,
+            max_bytes=int(settings.get('max_mb', 50) * 1024 * 1024),
+        )
+
+    def get(self, source_type: str, query: str) -> Optional[List[Any]]:
+        """Cached results, or None if missing or expired."""
+        row = self._conn.execute(
+            "SELECT created_at, payload FROM query_cache WHERE source_type = ? AND query = ?",
+            (source_type, query),
+        ).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        created_at, payload = row
+        if now - created_at > self.ttl_seconds:
+            self._conn.execute(
+                "DELETE FROM query_cache WHERE source_type = ? AND query = ?", (source_type, query)
+            )
+            self._conn.commit()
+            return None
+        self._conn.execute(
+            "UPDATE query_cache SET last_access = ? WHERE source_type = ? AND query = ?",
+            (now, source_type, query),
+        )
+        self._conn.commit()
+        return json.loads(zlib.decompress(payload))
+
+    def put(self, source_type: str, query: str, results: List[Any]) -> None:
+        """Store results and evict least recently used entries over the size limit."""
+        payload = zlib.compress(json.dumps(results, ensure_ascii=False).encode("utf-8"))
+        now = time.time()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO query_cache (source_type, query, created_at, last_access, size, payload) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (source_type, query, now, now, len(payload), payload),
+        )
+        self._evict()
+        self._conn.commit()
+
+    def _evict(self) -> None:
+        self._conn.execute("DELETE FROM query_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM query_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for source_type, query, size in self._conn.execute(
+            "SELECT source_type, query, size FROM query_cache ORDER BY last_access"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute(
+                "DELETE FROM query_cache WHERE source_type = ? AND query = ?", (source_type, query)
+            )
+            total -= size
+            evicted += 1
+        logger.info(f"Evicted {evicted} cached queries to stay under {self.max_bytes} bytes.")
+
+    def close(self) -> None:
+        self._conn.close()
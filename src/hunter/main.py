@@ -8,6 +8,7 @@ def main():
     parser.add_argument("--config", default="config/hunter.yaml", help="Path to configuration file")
     parser.add_argument("--output", help="Path to save output JSON", default=None)
     parser.add_argument("--topic", help="Filter by specific topic name", default=None)
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the query cache")
     
     args = parser.parse_args()
 
@@ -21,7 +22,7 @@ def main():
             config.topics = [t for t in config.topics if t.get('name') == args.topic]
             print(f"Filtering topics: '{args.topic}' (Found {len(config.topics)}/{original_count})")
             
-        scout = Scout(config)
+        scout = Scout(config, use_cache=not args.no_cache)
         
         results = scout.hunt()
         
@@ -1,12 +1,15 @@
 import yaml
+import asyncio
 import logging
 import json
-import subprocess
-import shlex
-import requests
-from typing import List, Dict, Any, Optional
+import httpx
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
+from src.core.bird import BirdWorkerPool
+from src.core.keyword_matcher import KeywordMatcher
+from src.hunter.cache import QueryCache
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("HunterScout")
@@ -15,6 +18,7 @@ class HunterConfig:
     def __init__(self, config_path: str):
         self.config_path = Path(config_path)
         self.topics = []
+        self.settings: Dict[str, Any] = {}
         self._load_config()
 
     def _load_config(self):
@@ -24,48 +28,140 @@ class HunterConfig:
         with open(self.config_path, 'r') as f:
             data = yaml.safe_load(f)
             self.topics = data.get('topics', [])
+            self.settings = data.get('settings') or {}
             logger.info(f"Loaded {len(self.topics)} topics from config.")
 
 class Scout:
-    def __init__(self, config: HunterConfig, use_cli_tools: bool = True):
+    DEFAULT_CONCURRENCY = 8
+    MAX_ITEMS_PER_SOURCE = 5
+
+    def __init__(self, config: HunterConfig, use_cli_tools: bool = True,
+                 concurrency: Optional[int] = None, bird: Optional[BirdWorkerPool] = None,
+                 use_cache: bool = True, cache: Optional[QueryCache] = None):
         self.config = config
         self.use_cli_tools = use_cli_tools
+        self.concurrency = concurrency or config.settings.get('concurrency', self.DEFAULT_CONCURRENCY)
+        # bird from PATH, spawned per call unless a worker command is configured
+        self.bird = bird or BirdWorkerPool.from_config(config.settings.get('bird'), bin_path="bird")
+        self._client: Optional[httpx.AsyncClient] = None
+        self._matchers: Dict[Tuple[Tuple[str, ...], str], KeywordMatcher] = {}
+        # (source type, query) -> results, persisted across runs within the TTL
+        cache_settings = config.settings.get('cache') or {}
+        if cache is None and use_cache and cache_settings.get('enabled', False):
+            cache = QueryCache.from_settings(cache_settings)
+        self.cache = cache if use_cache else None
 
     def hunt(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Main execution loop for all topics."""
+        """Main execution loop for all topics (blocking wrapper around hunt_async)."""
+        async def run() -> Dict[str, List[Dict[str, Any]]]:
+            try:
+                return await self.hunt_async()
+            finally:
+                await self.close()
+        return asyncio.run(run())
+
+    async def close(self) -> None:
+        """Stop persistent bird workers and close the cache (only needed when calling hunt_async directly)."""
+        await self.bird.close()
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    async def hunt_async(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Scout every source of every topic concurrently.
+
+        All (topic, source) pairs share one HTTP client and one semaphore of
+        `concurrency` slots, so a hunt takes about as long as its slowest
+        sources rather than the sum of all of them. A query repeated across
+        topics is fetched once; cached queries are not fetched at all.
+        """
         logger.info("Starting hunt...")
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+        jobs: List[Tuple[int, Dict[str, Any], Dict[str, Any]]] = [
+            (index, topic, source)
+            for index, topic in enumerate(self.config.topics)
+            for source in topic.get('sources', [])
+        ]
+        unique: Dict[Tuple[Any, Any], Dict[str, Any]] = {}
+        for _, topic, source in jobs:
+            unique.setdefault((source.get('type'), source.get('query')), {"topic": topic, "source": source})
+
+        fetched: Dict[Tuple[Any, Any], List[Dict[str, Any]]] = {}
+        for key in unique:
+            cached = self._cache_get(*key)
+            if cached is not None:
+                fetched[key] = cached
+        pending = [key for key in unique if key not in fetched]
+        if fetched:
+            logger.info(f"Cache hits: {len(fetched)}/{len(unique)} queries.")
+
+        if pending:
+            async with httpx.AsyncClient(timeout=10.0) as client:
+                self._client = client
+                try:
+                    gathered = await asyncio.gather(*(
+                        self._scout_source(semaphore, unique[key]["topic"], unique[key]["source"])
+                        for key in pending
+                    ))
+                finally:
+                    self._client = None
+            for key, data in zip(pending, gathered):
+                fetched[key] = data
+                if data:  # Empty usually means a failed call; retry next run
+                    self._cache_put(*key, data)
+
+        # Keep per-topic results in config order, whatever order sources finished in
+        per_topic: Dict[int, List[Dict[str, Any]]] = {i: [] for i in range(len(self.config.topics))}
+        for index, _, source in jobs:
+            per_topic[index].extend(fetched[(source.get('type'), source.get('query'))])
+
         results = {}
-        
-        for topic in self.config.topics:
+        for index, topic in enumerate(self.config.topics):
             topic_name = topic.get('name')
-            logger.info(f"Scouting topic: {topic_name}")
-            topic_results = []
-            
-            for source in topic.get('sources', []):
-                source_type = source.get('type')
-                query = source.get('query')
-                
-                try:
-                    if source_type == 'web':
-                        data = self._search_web(query)
-                        topic_results.extend(data)
-                    elif source_type == 'twitter':
-                        data = self._search_twitter(query)
-                        topic_results.extend(data)
-                    elif source_type == 'twitter-user':
-                        data = self._search_twitter_user(query)
-                        topic_results.extend(data)
-                    else:
-                        logger.warning(f"Unknown source type: {source_type}")
-                except Exception as e:
-                    logger.error(f"Error scouting {source_type} for '{topic_name}': {e}")
-            
-            filtered_results = self._filter_results(topic_results, topic.get('keywords', []))
-            results[topic_name] = filtered_results
-            
+            results[topic_name] = self._filter_results(
+                per_topic[index], topic.get('keywords', []), topic.get('match', 'substring')
+            )
         return results
 
-    def _search_web(self, query: str) -> List[Dict[str, Any]]:
+    def _cache_get(self, source_type: Any, query: Any) -> Optional[List[Dict[str, Any]]]:
+        if self.cache is None or not isinstance(source_type, str) or not isinstance(query, str):
+            return None
+        try:
+            return self.cache.get(source_type, query)
+        except Exception as e:
+            logger.warning(f"Cache read failed for {source_type} '{query}': {e}")
+            return None
+
+    def _cache_put(self, source_type: Any, query: Any, results: List[Dict[str, Any]]) -> None:
+        if self.cache is None or not isinstance(source_type, str) or not isinstance(query, str):
+            return
+        try:
+            self.cache.put(source_type, query, results)
+        except Exception as e:
+            logger.warning(f"Cache write failed for {source_type} '{query}': {e}")
+
+    async def _scout_source(self, semaphore: asyncio.Semaphore, topic: Dict[str, Any],
+                            source: Dict[str, Any]) -> List[Dict[str, Any]]:
+        topic_name = topic.get('name')
+        source_type = source.get('type')
+        query = source.get('query')
+
+        async with semaphore:
+            try:
+                if source_type == 'web':
+                    return await self._search_web(query)
+                elif source_type == 'twitter':
+                    return await self._search_twitter(query)
+                elif source_type == 'twitter-user':
+                    return await self._search_twitter_user(query)
+                else:
+                    logger.warning(f"Unknown source type: {source_type}")
+            except Exception as e:
+                logger.error(f"Error scouting {source_type} for '{topic_name}': {e}")
+        return []
+
+    async def _search_web(self, query: str) -> List[Dict[str, Any]]:
         """
         Executes a web search using the Tavily API.
         """
@@ -81,7 +177,11 @@ class Scout:
                     "search_depth": "basic"
                 }
                 
-                response = requests.post(endpoint, json=payload, timeout=10)
+                if self._client is not None:
+                    response = await self._client.post(endpoint, json=payload)
+                else:
+                    async with httpx.AsyncClient(timeout=10.0) as client:
+                        response = await client.post(endpoint, json=payload)
                 response.raise_for_status()
                 data = response.json()
                 
@@ -101,7 +201,22 @@ class Scout:
 
         return []
 
-    def _search_twitter(self, query: str) -> List[Dict[str, Any]]:
+    async def _bird_items(self, args: List[str]) -> List[Dict[str, Any]]:
+        """Run bird and return up to MAX_ITEMS_PER_SOURCE tweets as they stream in."""
+        items: List[Dict[str, Any]] = []
+        records = self.bird.run(args)
+        try:
+            async for record in records:
+                # Some bird versions wrap results as {"tweets": [...]}
+                batch = record.get('tweets') if isinstance(record.get('tweets'), list) else [record]
+                items.extend(batch)
+                if len(items) >= self.MAX_ITEMS_PER_SOURCE:
+                    break
+        finally:
+            await records.aclose()
+        return items[:self.MAX_ITEMS_PER_SOURCE]
+
+    async def _search_twitter(self, query: str) -> List[Dict[str, Any]]:
         """
         Executes a Twitter search (Bird tool).
         """
@@ -110,19 +225,10 @@ class Scout:
         if self.use_cli_tools:
             try:
                 # bird search "{query}" --json
-                cmd = ["bird", "search", query, "--json"]
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                
-                try:
-                    data = json.loads(result.stdout)
-                except json.JSONDecodeError:
-                    logger.warning(f"Could not parse bird output as JSON: {result.stdout[:100]}...")
-                    return []
+                items = await self._bird_items(["search", query, "--json"])
 
                 formatted_results = []
-                items = data if isinstance(data, list) else data.get('tweets', [])
-                
-                for item in items[:5]:
+                for item in items:
                     formatted_results.append({
                         "text": item.get("text") or item.get("content", ""),
                         "author": item.get("author_username") or item.get("username", "unknown"),
@@ -130,14 +236,12 @@ class Scout:
                     })
                 return formatted_results
 
-            except subprocess.CalledProcessError as e:
-                logger.warning(f"Bird CLI failed (exit code {e.returncode}): {e.stderr}")
             except Exception as e:
                 logger.warning(f"Twitter search failed: {e}")
 
         return []
 
-    def _search_twitter_user(self, username: str) -> List[Dict[str, Any]]:
+    async def _search_twitter_user(self, username: str) -> List[Dict[str, Any]]:
         """
         Executes a Twitter user timeline fetch (Bird tool).
         """
@@ -147,21 +251,11 @@ class Scout:
         
         if self.use_cli_tools:
             try:
-                # Use bird user-tweets <username> --json
-                cmd = ["bird", "user-tweets", username, "--json"]
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                
-                try:
-                    data = json.loads(result.stdout)
-                except json.JSONDecodeError:
-                    logger.warning(f"Could not parse bird output as JSON: {result.stdout[:100]}...")
-                    return []
+                # Use bird user-tweets <username> --json (recent 5 tweets)
+                items = await self._bird_items(["user-tweets", username, "--json"])
 
                 formatted_results = []
-                items = data if isinstance(data, list) else data.get('tweets', [])
-                
-                # Limit to recent 5 tweets
-                for item in items[:5]:
+                for item in items:
                     formatted_results.append({
                         "text": item.get("text") or item.get("content", ""),
                         "author": item.get("author_username") or item.get("username", username),
@@ -169,29 +263,52 @@ class Scout:
                     })
                 return formatted_results
 
-            except subprocess.CalledProcessError as e:
-                logger.warning(f"Bird CLI failed (exit code {e.returncode}): {e.stderr}")
             except Exception as e:
                 logger.warning(f"Twitter user fetch failed: {e}")
 
         return []
 
-    def _filter_results(self, results: List[Dict[str, Any]], keywords: List[str]) -> List[Dict[str, Any]]:
+    MATCH_MODES = ("substring", "word")
+
+    def _get_matcher(self, keywords: List[str], match: str) -> KeywordMatcher:
+        """Compiled matcher for a topic's keyword list, built once and reused."""
+        key = (tuple(keywords), match)
+        matcher = self._matchers.get(key)
+        if matcher is None:
+            if match not in self.MATCH_MODES:
+                logger.warning(f"Unknown match mode '{match}', using substring matching.")
+            matcher = KeywordMatcher({"keywords": keywords}, whole_word=(match == "word"))
+            self._matchers[key] = matcher
+        return matcher
+
+    def _filter_results(self, results: List[Dict[str, Any]], keywords: List[str],
+                        match: str = "substring") -> List[Dict[str, Any]]:
         """
-        Simple keyword filtering logic.
+        Keep items that mention at least one keyword, best matches first.
+
+        Keywords are matched in a single pass per item (case-insensitive).
+        `match="word"` requires word boundaries around Latin keywords (so "AI"
+        no longer matches "said"); CJK keywords always match inside text.
+        Each kept item gets `matched_keywords` and items are ranked by how
+        many distinct keywords they matched (ties keep source order).
         """
         if not keywords:
             return results
-            
+
+        matcher = self._get_matcher(keywords, match)
+        spelling = {k.strip().lower(): k for k in keywords}
         filtered = []
         for item in results:
             # Combine all text fields for searching
-            text_content = " ".join([str(v) for v in item.values() if isinstance(v, str)]).lower()
-            
-            # Check if any keyword matches
-            if any(k.lower() in text_content for k in keywords):
-                filtered.append(item)
-        
+            text_content = " ".join(
+                v for k, v in item.items() if isinstance(v, str) and k != "matched_keywords"
+            )
+            found = matcher.find(text_content)
+            if found:
+                # Copy: the same cached item may be shared by several topics
+                filtered.append({**item, "matched_keywords": sorted(spelling.get(k, k) for k in found)})
+
+        filtered.sort(key=lambda item: len(item["matched_keywords"]), reverse=True)
         logger.info(f"  Filtered {len(results)} items down to {len(filtered)} relevant items.")
         return filtered
 
@@ -19,7 +19,14 @@ def run():
     logger.info(f"🚀 Signal Hunter v{VERSION} starting...")
     engine = Engine()
     engine.load_sources_from_memory()
-    asyncio.run(engine.run_cycle())
+
+    async def _run():
+        try:
+            await engine.run_cycle()
+        finally:
+            await engine.close()
+
+    asyncio.run(_run())
 
 @app.command()
 def test_bird(handle: str = "vista8"):
@@ -1,6 +1,7 @@
 from enum import Enum
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Union
 from pydantic import BaseModel, HttpUrl, Field
 
 class PlatformType(str, Enum):
@@ -46,6 +47,53 @@ class Signal(BaseModel):
     confidence: float = Field(default=0.5, ge=0.0, le=1.0)
     sentiment_score: float = Field(default=0.0, ge=-1.0, le=1.0)  # -1.0 to 1.0
 
+@dataclass(slots=True)
+class SignalRecord:
+    """
+    Lightweight, unvalidated view of a stored Signal.
+
+    Used for rows read back from our own database, which were validated on
+    write; exposes the same attributes as Signal at a fraction of the cost.
+    """
+    ticker: str
+    signal_type: SignalType
+    source_name: str
+    raw_text: str
+    url: str
+    timestamp: datetime
+    confidence: float = 0.5
+    sentiment_score: float = 0.0
+
+    def to_signal(self) -> Signal:
+        """Promote to a fully validated Signal."""
+        return Signal(
+            ticker=self.ticker,
+            signal_type=self.signal_type,
+            source_name=self.source_name,
+            raw_text=self.raw_text,
+            url=self.url,
+            timestamp=self.timestamp,
+            confidence=self.confidence,
+            sentiment_score=self.sentiment_score
+        )
+
+@dataclass(slots=True)
+class SourceCursor:
+    """Incremental fetch position for one source (see Database.source_cursors)."""
+    source_name: str
+    last_seen_id: Optional[str] = None
+    fetch_depth: int = 5
+    updated_at: Optional[datetime] = None
+
+@dataclass(slots=True)
+class OutboxMessage:
+    """A Telegram message waiting in the durable outbox (see Database.outbox)."""
+    idempotency_key: str
+    chat_id: str
+    message: str
+    attempts: int = 0
+    id: Optional[int] = None
+
 class DiversityMetrics(BaseModel):
     """Metrics for detecting echo chambers and contrarian opportunities."""
     ticker: str
@@ -74,11 +122,12 @@ class DiversityMetrics(BaseModel):
 
 class MarketAlert(BaseModel):
     """Enhanced alert with diversity context."""
-    alert_type: str  # "ECHO_CHAMBER", "CONTRARIAN_OPPORTUNITY", "EXTREME_CONSENSUS", "CROSS_PLATFORM_DIVERGENCE"
+    alert_type: str  # "ECHO_CHAMBER", "CONTRARIAN_OPPORTUNITY", "EXTREME_CONSENSUS", "CROSS_PLATFORM_DIVERGENCE", "HEALTHY_RESONANCE", "RESONANCE"
     ticker: str
     severity: str  # "LOW", "MEDIUM", "HIGH", "CRITICAL"
     headline: str
     description: str
-    diversity_metrics: DiversityMetrics
-    related_signals: List[Signal]
+    diversity_metrics: Optional[DiversityMetrics] = None  # None for legacy resonance alerts
+    related_signals: List[Union[Signal, SignalRecord]]  # window records are kept as-is
+    audit: Optional[str] = None  # Supporting lines (e.g. the sources involved)
     timestamp: datetime = Field(default_factory=datetime.now)
@@ -3,36 +3,56 @@ import os
 import signal
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from loguru import logger
-from src.core.engine import Engine
+from src.core.config import config
+from src.core.engine_service import EngineService
 
 # Configure Logger to write to file as well, since this is a daemon
 logger.add("logs/scheduler.log", rotation="10 MB", retention="7 days")
 
-async def scheduled_job():
+async def scheduled_job(service: EngineService):
     """The job wrapper to run the engine"""
     try:
         logger.info("⏰ Scheduler Trigger: Starting Scan Cycle...")
-        engine = Engine()
-        engine.load_sources_from_memory()
-        await engine.run_cycle()
+        if await service.scan_all() is None:
+            logger.warning("⚠️ Scheduler Trigger: previous cycle still running, skipped.")
+            return
         logger.info("✅ Scheduler Trigger: Cycle Finished.")
     except Exception as e:
         logger.exception(f"❌ Scheduler Cycle Failed: {e}")
 
+async def adaptive_job(service: EngineService):
+    """Fetch only the sources that are due (see SourceScheduler)"""
+    try:
+        fetched = await service.run_due()
+        if fetched:
+            logger.info(f"✅ Scheduler Tick: fetched {fetched}/{len(service.sources)} due sources.")
+    except Exception as e:
+        logger.exception(f"❌ Scheduler Tick Failed: {e}")
+
 async def main():
     logger.info("🤖 Signal Hunter Scheduler Initializing...")
     
     scheduler = AsyncIOScheduler()
+    # One engine for the whole process: connections and caches stay warm
+    service = EngineService()
     
-    # Schedule to run every 60 minutes
-    # You can change this to minutes=30 or hours=1
-    scheduler.add_job(scheduled_job, 'interval', minutes=60)
-    
-    scheduler.start()
-    logger.success("🚀 Scheduler Started! (Interval: 60 mins)")
-    
-    # Run once immediately upon start
-    await scheduled_job()
+    adaptive = config.scheduler.get('adaptive') or {}
+    if adaptive.get('enabled', True):
+        # Check for due sources every tick; each source keeps its own interval
+        tick_seconds = adaptive.get('tick_seconds', 60)
+        scheduler.add_job(adaptive_job, 'interval', seconds=tick_seconds, args=[service])
+        scheduler.start()
+        logger.success(f"🚀 Scheduler Started! (Adaptive, tick: {tick_seconds}s)")
+        await adaptive_job(service)
+    else:
+        # Scan every source every interval_minutes
+        interval_minutes = config.scheduler.get('interval_minutes', 60)
+        scheduler.add_job(scheduled_job, 'interval', minutes=interval_minutes, args=[service])
+        scheduler.start()
+        logger.success(f"🚀 Scheduler Started! (Interval: {interval_minutes} mins)")
+        
+        # Run once immediately upon start
+        await scheduled_job(service)
     
     # Keep the main thread alive to let the AsyncIOScheduler run
     # Handle graceful shutdown
@@ -47,6 +67,8 @@ async def main():
         loop.add_signal_handler(sig, signal_handler)
 
     await stop_event.wait()
+    scheduler.shutdown(wait=False)
+    await service.close()
 
 if __name__ == "__main__":
     try:
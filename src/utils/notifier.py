@@ -1,14 +1,14 @@
 import os
 from loguru import logger
+from typing import Optional
 from .teleporter import Teleporter
 
 # Initialize teleporter instance
 _teleporter = Teleporter()
 
-async def send_telegram_alert(message: str):
+def alert_chat_id() -> Optional[str]:
     """
-    Send a message to the configured Telegram Channel (for alerts/digests).
-    Uses Teleporter which has fallback to urllib if httpx fails.
+    Chat that alerts go to, or None (with a warning) if credentials are missing.
     """
     # Load environment variables if not already loaded
     if not os.getenv("TELEGRAM_BOT_TOKEN"):
@@ -34,6 +34,18 @@ async def send_telegram_alert(message: str):
     
     if not token or not chat_id:
         logger.warning("🚫 Telegram credentials missing. Skipping alert.")
+        return None
+    return chat_id
+
+async def send_telegram_alert(message: str):
+    """
+    Send a message to the configured Telegram Channel (for alerts/digests).
+    Uses Teleporter which has fallback to urllib if httpx fails.
+
+    Engine alerts go through the outbox instead (src/core/outbox.py).
+    """
+    chat_id = alert_chat_id()
+    if chat_id is None:
         return
 
     # Use Teleporter with retry logic
@@ -42,4 +54,4 @@ async def send_telegram_alert(message: str):
     if success:
         logger.info("📢 Telegram alert sent successfully.")
     else:
-        logger.error("❌ Failed to send Telegram alert after all retries.")
\ No newline at end of file
+        logger.error("❌ Failed to send Telegram alert after all retries.")
@@ -0,0 +1,234 @@
+"""
+Telegram Queue - Asynchronous Outbound Message Delivery
+
+Alerts are put on a bounded queue and delivered by a few worker tasks, so a
+slow or rate-limited Telegram API never holds up a scan cycle. All workers
+share one persistent httpx client and respect Telegram's limits:
+
+1. Global pacing: at most `global_rate` messages per second for the bot.
+2. Per-chat pacing: a token bucket per chat (groups/channels allow ~20/min).
+3. 429 responses: the chat is paused for `parameters.retry_after` seconds
+   before anything else is sent to it.
+
+Failed sends are retried with capped exponential backoff; when httpx is not
+installed the blocking urllib sender runs in a thread. `drain()` waits for
+queued messages to go out and stops the workers.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from loguru import logger
+
+from src.core.fetch_scheduler import TokenBucket
+from src.utils.teleporter import DeliveryResult, Teleporter
+
+
+@dataclass(slots=True)
+class OutboundMessage:
+    text: str
+    chat_id: str
+    attempts: int = 0
+    # Awaited with the final outcome (e.g. to mark a durable outbox row)
+    on_done: Optional[Callable[[bool], Awaitable[None]]] = None
+
+
+class TelegramQueue:
+    """Bounded outbound queue with worker tasks and Telegram rate limiting."""
+
+    def __init__(
+        self,
+        teleporter: Optional[Teleporter] = None,
+        workers: int = 2,
+        max_size: int = 1000,
+        global_rate: float = 25.0,
+        chat_rate: float = 0.33,
+        chat_burst: int = 3,
+        max_attempts: int = 5,
+        max_backoff: float = 60.0,
+        timeout: float = 30.0,
+    ):
+        """
+        Args:
+            teleporter: Transport used for each send (a new one by default)
+            workers: Number of delivery tasks
+            max_size: Queued messages beyond this are dropped (logged)
+            global_rate: Messages per second across all chats
+            chat_rate: Messages per second to a single chat
+            chat_burst: Messages a chat may receive back-to-back
+            max_attempts: Send attempts per message before giving up
+            max_backoff: Cap on the wait between attempts (seconds)
+            timeout: HTTP timeout for the shared client (seconds)
+        """
+        self.teleporter = teleporter or Teleporter()
+        self.workers = max(1, workers)
+        self.max_size = max_size
+        self.global_rate = global_rate
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+        self.max_attempts = max(1, max_attempts)
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._client: Any = None
+        self._no_httpx = False
+        self._global: Optional[TokenBucket] = None
+        self._chats: Dict[str, TokenBucket] = {}
+        self._paused_until: Dict[str, float] = {}
+
+    @classmethod
+    def from_config(cls, settings: Optional[Dict[str, Any]]) -> "TelegramQueue":
+        settings = settings or {}
+        return cls(
+            workers=settings.get('workers', 2),
+            max_size=settings.get('max_size', 1000),
+            global_rate=settings.get('global_rate', 25.0),
+            chat_rate=settings.get('chat_rate', 0.33),
+            chat_burst=settings.get('chat_burst', 3),
+            max_attempts=settings.get('max_attempts', 5),
+            max_backoff=settings.get('max_backoff', 60.0),
+            timeout=settings.get('timeout', 30.0),
+        )
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def _bind(self) -> None:
+        """Start workers on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._tasks:
+            return
+        if self._loop is not loop:
+            # Anything queued on a previous (closed) loop can't be delivered from here
+            if self._queue is not None and self._queue.qsize():
+                logger.warning(f"⚠️ Discarding {self._queue.qsize()} messages queued on a closed event loop")
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_size)
+            self._client = None
+            self._global = TokenBucket(self.global_rate, max(1, int(self.global_rate)))
+            self._chats.clear()
+            self._paused_until.clear()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    def enqueue(self, text: str, chat_id: str,
+                on_done: Optional[Callable[[bool], Awaitable[None]]] = None) -> bool:
+        """
+        Queue a message for delivery; False if the queue is full. Needs a running loop.
+
+        `on_done(ok)` is awaited once the message was delivered or given up on.
+        """
+        self._bind()
+        try:
+            self._queue.put_nowait(OutboundMessage(text=text, chat_id=str(chat_id), on_done=on_done))
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.error(f"❌ Telegram queue full ({self.max_size}), dropping message for {chat_id}")
+            return False
+
+    async def _worker(self) -> None:
+        while True:
+            message = await self._queue.get()
+            ok = False
+            try:
+                ok = await self._deliver(message)
+            except Exception as e:
+                logger.exception(f"💥 Telegram queue worker error: {e}")
+            try:
+                if ok:
+                    self.sent += 1
+                else:
+                    self.failed += 1
+                if message.on_done is not None:
+                    await message.on_done(ok)
+            except Exception as e:
+                logger.error(f"❌ Telegram delivery callback failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _chat_bucket(self, chat_id: str) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            bucket = self._chats[chat_id] = TokenBucket(self.chat_rate, self.chat_burst)
+        return bucket
+
+    def _get_client(self) -> Any:
+        """Shared httpx client, created on first send (None without httpx)."""
+        if self._client is None and not self._no_httpx:
+            try:
+                import httpx
+                self._client = httpx.AsyncClient(timeout=self.timeout)
+            except ImportError:
+                self._no_httpx = True
+                logger.warning("⚠️ httpx not available, Telegram queue will send via urllib")
+        return self._client
+
+    async def _send_once(self, message: OutboundMessage) -> DeliveryResult:
+        if self._get_client() is not None:
+            return await self.teleporter.deliver(self._client, message.text, message.chat_id)
+        ok = await asyncio.to_thread(self.teleporter._send_with_urllib, message.text, message.chat_id)
+        return DeliveryResult(ok=ok)
+
+    async def _deliver(self, message: OutboundMessage) -> bool:
+        while message.attempts < self.max_attempts:
+            pause = self._paused_until.get(message.chat_id, 0) - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+            await self._chat_bucket(message.chat_id).acquire()
+            await self._global.acquire()
+
+            message.attempts += 1
+            result = await self._send_once(message)
+            if result.ok:
+                return True
+            if result.permanent:
+                break
+
+            if result.retry_after is not None:
+                # Telegram told us exactly how long this chat is blocked
+                delay = result.retry_after
+                self._paused_until[message.chat_id] = time.monotonic() + delay
+            else:
+                delay = min(2 ** message.attempts, self.max_backoff)
+                if message.attempts < self.max_attempts:
+                    await asyncio.sleep(delay)
+            if message.attempts < self.max_attempts:
+                logger.info(f"🔄 Retrying message for {message.chat_id} ({message.attempts}/{self.max_attempts})")
+
+        logger.error(f"❌ Giving up on message for {message.chat_id} after {message.attempts} attempts")
+        return False
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued messages to be delivered, then stop the workers.
+
+        Returns False if `timeout` expired first; undelivered messages stay queued.
+        """
+        if self._loop is not asyncio.get_running_loop() or self._queue is None:
+            return True
+        drained = True
+        if self._tasks:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                drained = False
+                logger.warning(f"⚠️ Telegram queue drain timed out with {self._queue.qsize()} messages pending")
+        await self.close()
+        return drained
+
+    async def close(self) -> None:
+        """Stop workers and close the shared client without waiting for the queue."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        client, self._client = self._client, None
+        if client is not None and self._loop is asyncio.get_running_loop():
+            await client.aclose()
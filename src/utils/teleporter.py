@@ -7,7 +7,8 @@ Handles delivery mechanisms to Telegram with fallback strategies.
 import os
 import json
 import asyncio
-from typing import Optional
+from dataclasses import dataclass
+from typing import Optional, Tuple
 from loguru import logger
 
 
@@ -31,6 +32,14 @@ def load_env_file():
                         os.environ[key] = value
 
 
+@dataclass(slots=True)
+class DeliveryResult:
+    """Outcome of one send attempt."""
+    ok: bool
+    retry_after: Optional[float] = None  # seconds Telegram asked us to back off (429)
+    permanent: bool = False  # retrying the same message cannot succeed
+
+
 class Teleporter:
     """Handles the delivery mechanism to Telegram."""
     
@@ -59,18 +68,19 @@ class Teleporter:
         success = await self._send_with_httpx(message_text, chat_id)
         
         if not success:
-            # Fallback to urllib
-            success = self._send_with_urllib(message_text, chat_id)
+            # Fallback to urllib, off the event loop
+            success = await asyncio.to_thread(self._send_with_urllib, message_text, chat_id)
             
         return success
-    
-    async def _send_with_httpx(self, message_text: str, chat_id: str) -> bool:
-        """Primary method: Send message using httpx."""
+
+    @staticmethod
+    def _build_request(message_text: str, chat_id: str) -> Optional[Tuple[str, dict]]:
+        """sendMessage URL and payload, or None if the bot token is missing."""
         token = os.getenv("TELEGRAM_BOT_TOKEN")
         
         if not token:
             logger.error("❌ TELEGRAM_BOT_TOKEN not set")
-            return False
+            return None
 
         # Wrap the entire message in a code block to avoid Markdown parsing issues
         message_text_formatted = f"```{message_text}```"
@@ -81,18 +91,56 @@ class Teleporter:
             "text": message_text_formatted,
             "parse_mode": "MarkdownV2"
         }
-        
+        return url, payload
+
+    async def deliver(self, client, message_text: str, chat_id: str) -> DeliveryResult:
+        """
+        Send one message with an existing httpx.AsyncClient.
+
+        Unlike `_send_with_httpx`, the outcome says whether a retry can help
+        and how long Telegram asked us to wait (429 `parameters.retry_after`).
+        """
+        request = self._build_request(message_text, chat_id)
+        if request is None:
+            return DeliveryResult(ok=False, permanent=True)
+        url, payload = request
+
+        try:
+            resp = await client.post(url, json=payload)
+        except Exception as e:
+            logger.error(f"❌ Error sending via httpx: {e}")
+            return DeliveryResult(ok=False)
+
+        if resp.status_code == 200:
+            logger.info("✅ Message sent successfully via httpx")
+            return DeliveryResult(ok=True)
+
+        retry_after = None
+        if resp.status_code == 429:
+            try:
+                retry_after = float(resp.json().get("parameters", {}).get("retry_after"))
+            except (TypeError, ValueError, AttributeError):
+                retry_after = None
+            logger.warning(f"⏳ Telegram rate limit hit for {chat_id}, retry after {retry_after}s")
+        else:
+            logger.error(f"❌ Failed to send via httpx. Status: {resp.status_code}, Response: {resp.text}")
+        # Other 4xx (bad chat id, malformed text, bot blocked) won't succeed on retry
+        permanent = 400 <= resp.status_code < 500 and resp.status_code != 429
+        return DeliveryResult(ok=False, retry_after=retry_after, permanent=permanent)
+
+    async def _send_with_httpx(self, message_text: str, chat_id: str, client=None) -> bool:
+        """Primary method: Send message using httpx (a one-off client unless `client` is given)."""
+        if client is not None:
+            return (await self.deliver(client, message_text, chat_id)).ok
+
+        if not os.getenv("TELEGRAM_BOT_TOKEN"):
+            logger.error("❌ TELEGRAM_BOT_TOKEN not set")
+            return False
+
         try:
             import httpx
             async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(url, json=payload)
-                
-                if resp.status_code == 200:
-                    logger.info("✅ Message sent successfully via httpx")
-                    return True
-                else:
-                    logger.error(f"❌ Failed to send via httpx. Status: {resp.status_code}, Response: {resp.text}")
-                    return False
+                return (await self.deliver(client, message_text, chat_id)).ok
         except ImportError:
             logger.warning("⚠️ httpx not available, falling back to urllib")
             return False
@@ -101,24 +149,13 @@ class Teleporter:
             return False
 
     def _send_with_urllib(self, message_text: str, chat_id: str) -> bool:
-        """Fallback method: Send message using urllib."""
+        """Fallback method: Send message using urllib (blocking; run it in a thread from async code)."""
         import urllib.request
 
-        token = os.getenv("TELEGRAM_BOT_TOKEN")
-        
-        if not token:
-            logger.error("❌ TELEGRAM_BOT_TOKEN not set")
+        request = self._build_request(message_text, chat_id)
+        if request is None:
             return False
-
-        # Wrap the entire message in a code block to avoid Markdown parsing issues
-        message_text_formatted = f"```{message_text}```"
-
-        url = f"https://api.telegram.org/bot{token}/sendMessage"
-        payload = {
-            "chat_id": chat_id,
-            "text": message_text_formatted,
-            "parse_mode": "MarkdownV2"
-        }
+        url, payload = request
         
         data = json.dumps(payload).encode('utf-8')
         req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
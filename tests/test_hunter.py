@@ -1,14 +1,17 @@
 import unittest
+import asyncio
 import os
+import time
+import tempfile
 import yaml
 import sys
-import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 # Add src to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.hunter.scout import Scout, HunterConfig
+from src.hunter.cache import QueryCache
 
 class TestHunterConfig(unittest.TestCase):
     """Validation for the configuration file."""
@@ -60,8 +63,8 @@ class TestHunterScout(unittest.TestCase):
         if os.path.exists(self.config_path):
             os.remove(self.config_path)
 
-    @patch('src.hunter.scout.subprocess.run')
-    def test_twitter_user_source(self, mock_subprocess):
+    @patch('src.hunter.scout.BirdWorkerPool.run')
+    def test_twitter_user_source(self, mock_bird_run):
         """Verify twitter-user source calls bird user-tweets and parses output."""
         
         # Mock the bird command output
@@ -81,29 +84,29 @@ class TestHunterScout(unittest.TestCase):
                 }
             ]
         }
-        
-        mock_subprocess.return_value = MagicMock(
-            stdout=json.dumps(mock_output),
-            returncode=0
-        )
+
+        async def fake_run(args):
+            yield mock_output
+
+        mock_bird_run.side_effect = fake_run
         
         scout = Scout(self.config)
         results = scout.hunt()
         
-        # Verify subprocess was called correctly
+        # Verify bird was called correctly
         # We expect: bird user-tweets cobie --json
         # The code strips @, so expected arg is 'cobie'
-        expected_cmd = ["bird", "user-tweets", "cobie", "--json"]
+        expected_args = ["user-tweets", "cobie", "--json"]
         
         # Find the call with these args
         called = False
-        for call in mock_subprocess.call_args_list:
+        for call in mock_bird_run.call_args_list:
             args, _ = call
-            if args[0] == expected_cmd:
+            if args[0] == expected_args:
                 called = True
                 break
         
-        self.assertTrue(called, f"Expected command {expected_cmd} not found in calls: {mock_subprocess.call_args_list}")
+        self.assertTrue(called, f"Expected bird args {expected_args} not found in calls: {mock_bird_run.call_args_list}")
         
         # Verify results
         self.assertIn("test_twitter_user_topic", results)
@@ -115,5 +118,125 @@ class TestHunterScout(unittest.TestCase):
         self.assertEqual(topic_results[0]['text'], "Crypto is volatile today.")
         self.assertEqual(topic_results[0]['author'], "cobie")
 
+    def test_sources_scouted_concurrently(self):
+        """Verify a hunt takes about as long as its slowest source, not the sum."""
+        self.config.topics = [
+            {"name": f"topic{i}", "keywords": [], "sources": [{"type": "web", "query": f"q{i}-{j}"} for j in range(3)]}
+            for i in range(3)
+        ]
+
+        async def slow_search(query):
+            await asyncio.sleep(0.2)
+            return [{"title": query, "url": "https://example.com", "snippet": ""}]
+
+        scout = Scout(self.config, concurrency=9)
+        with patch.object(scout, '_search_web', side_effect=slow_search):
+            start = time.monotonic()
+            results = scout.hunt()
+            elapsed = time.monotonic() - start
+
+        # 9 sources x 0.2s would take 1.8s serially
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual([r['title'] for r in results["topic1"]], ["q1-0", "q1-1", "q1-2"])
+
+    def test_cached_queries_skip_network(self):
+        """Verify a repeated hunt is served from the cache and --no-cache bypasses it."""
+        self.config.topics = [
+            {"name": "a", "keywords": [], "sources": [{"type": "web", "query": "gold"}]},
+            {"name": "b", "keywords": [], "sources": [{"type": "web", "query": "gold"}]},
+        ]
+        calls = []
+
+        async def search(query):
+            calls.append(query)
+            return [{"title": query, "url": "https://example.com", "snippet": ""}]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = os.path.join(tmp, "cache.db")
+            for _ in range(2):
+                scout = Scout(self.config, cache=QueryCache(cache_path))
+                with patch.object(scout, '_search_web', side_effect=search):
+                    results = scout.hunt()
+            # Same query in two topics is fetched once; the second hunt is all hits
+            self.assertEqual(calls, ["gold"])
+            self.assertEqual(results["b"][0]["title"], "gold")
+
+            scout = Scout(self.config, use_cache=False, cache=QueryCache(cache_path))
+            self.assertIsNone(scout.cache)
+            with patch.object(scout, '_search_web', side_effect=search):
+                scout.hunt()
+            self.assertEqual(calls, ["gold", "gold"])
+
+
+class TestFilterResults(unittest.TestCase):
+    """Validation for compiled keyword filtering."""
+
+    def setUp(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".yaml", delete=False) as f:
+            yaml.dump({"topics": []}, f)
+        self.addCleanup(os.remove, f.name)
+        self.scout = Scout(HunterConfig(f.name), use_cache=False)
+        self.items = [
+            {"text": "He said gold is flat", "link": "1"},
+            {"text": "Gold and silver rally as the Federal Reserve pauses", "link": "2"},
+            {"text": "AI agents and 黄金 demand", "link": "3"},
+            {"text": "Nothing relevant", "link": "4"},
+        ]
+
+    def test_ranked_by_matched_keywords(self):
+        """Items are annotated with matches and ranked by match count."""
+        keywords = ["Gold", "Silver", "Federal Reserve", "黄金"]
+        filtered = self.scout._filter_results(self.items, keywords)
+        self.assertEqual([i["link"] for i in filtered], ["2", "1", "3"])
+        self.assertEqual(filtered[0]["matched_keywords"], ["Federal Reserve", "Gold", "Silver"])
+        self.assertEqual(filtered[2]["matched_keywords"], ["黄金"])
+        self.assertNotIn("matched_keywords", self.items[0])
+
+    def test_word_mode(self):
+        """Whole-word mode stops short Latin keywords matching inside words."""
+        substring = self.scout._filter_results(self.items, ["AI"])
+        word = self.scout._filter_results(self.items, ["AI"], match="word")
+        self.assertEqual([i["link"] for i in substring], ["1", "3"])  # "s-ai-d"
+        self.assertEqual([i["link"] for i in word], ["3"])
+
+
+class TestQueryCache(unittest.TestCase):
+    """Validation for the on-disk query cache."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "cache.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_and_ttl(self):
+        """Entries are returned until they expire."""
+        cache = QueryCache(self.path, ttl_seconds=60)
+        cache.put("web", "gold", [{"title": "金价"}])
+        self.assertEqual(cache.get("web", "gold"), [{"title": "金价"}])
+        self.assertIsNone(cache.get("twitter", "gold"))
+
+        cache.ttl_seconds = 0
+        time.sleep(0.01)
+        self.assertIsNone(cache.get("web", "gold"))
+        cache.close()
+
+    def test_size_eviction_drops_least_recently_used(self):
+        """The least recently read entries go first when over the size limit."""
+        cache = QueryCache(self.path, max_bytes=6_000)
+        blob = [{"text": os.urandom(1500).hex()}]  # ~1.7 KB compressed
+        cache.put("web", "q1", blob)
+        cache.put("web", "q2", blob)
+        cache.put("web", "q3", blob)
+        cache.get("web", "q1")  # q1 becomes most recently used
+        cache.put("web", "q4", blob)
+
+        self.assertIsNotNone(cache.get("web", "q1"))
+        self.assertIsNone(cache.get("web", "q2"))
+        self.assertIsNotNone(cache.get("web", "q4"))
+        cache.close()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,89 @@
+"""Unit tests for per-cycle alert digests."""
+from datetime import datetime
+from src.core.alert_aggregator import AlertAggregator, render_alert
+from src.models.schemas import MarketAlert
+
+NOW = datetime(2026, 1, 5, 9, 30)
+
+
+def make_alert(ticker: str, alert_type: str = "ECHO_CHAMBER", severity: str = "HIGH",
+               description: str = "Herd mentality detected (90% BULLISH)\nDiversity Score: 0.12 (Low)") -> MarketAlert:
+    return MarketAlert(
+        alert_type=alert_type,
+        ticker=ticker,
+        severity=severity,
+        headline=f"{alert_type.replace('_', ' ')}: {ticker}",
+        description=description,
+        related_signals=[],
+        timestamp=NOW,
+    )
+
+
+class TestAlertAggregator:
+    """Test cases for AlertAggregator."""
+
+    def test_small_cycle_is_one_message(self) -> None:
+        """Test that a few alerts become one digest grouped by severity and type."""
+        aggregator = AlertAggregator()
+        aggregator.add(make_alert("TSLA", "HEALTHY_RESONANCE", "LOW"))
+        aggregator.add(make_alert("NVDA"))
+        aggregator.add(make_alert("AAPL"))
+        messages = aggregator.flush(now=NOW)
+        assert len(messages) == 1
+        text = messages[0]
+        assert text.startswith("📊 **Signal Digest:** 3 alerts · 2026-01-05 09:30")
+        assert "🔴 HIGH · ECHO CHAMBER (2)" in text
+        assert "🟢 LOW · HEALTHY RESONANCE (1)" in text
+        # More severe groups come first
+        assert text.index("ECHO CHAMBER: NVDA") < text.index("HEALTHY RESONANCE: TSLA")
+        assert text.endswith("#OpenClaw #MarketSignal")
+        assert len(aggregator) == 0
+        assert aggregator.flush() == []
+
+    def test_noisy_cycle_is_packed_under_limit(self) -> None:
+        """Test that many alerts are split into numbered parts within max_length."""
+        aggregator = AlertAggregator(max_length=1000)
+        tickers = [f"T{i:02d}" for i in range(50)]
+        for ticker in tickers:
+            aggregator.add(make_alert(ticker))
+        messages = aggregator.flush(now=NOW)
+        assert 1 < len(messages) < len(tickers)
+        assert all(len(m) <= 1000 for m in messages)
+        assert f"(1/{len(messages)})" in messages[0]
+        assert "ECHO CHAMBER (50) (cont.)" in messages[1]
+        joined = "\n".join(messages)
+        for ticker in tickers:
+            assert joined.count(f"ECHO CHAMBER: {ticker}\n") == 1
+
+    def test_oversized_alert_is_truncated(self) -> None:
+        """Test that one alert longer than a message is cut rather than dropped."""
+        aggregator = AlertAggregator(max_length=500)
+        aggregator.add(make_alert("NVDA", description="x" * 5000))
+        messages = aggregator.flush(now=NOW)
+        assert len(messages) == 1
+        assert len(messages[0]) <= 500
+        assert "(truncated)" in messages[0]
+
+    def test_critical_alerts_are_immediate(self) -> None:
+        """Test that only the configured severities bypass the digest."""
+        aggregator = AlertAggregator.from_config({"immediate_severities": ["critical", "HIGH"]})
+        assert aggregator.is_immediate(make_alert("NVDA", severity="CRITICAL"))
+        assert aggregator.is_immediate(make_alert("NVDA", severity="HIGH"))
+        assert not aggregator.is_immediate(make_alert("NVDA", severity="MEDIUM"))
+
+    def test_render_alert_matches_market_signal_format(self) -> None:
+        """Test that a standalone alert keeps the Market Signal layout."""
+        text = render_alert(make_alert("NVDA", "EXTREME_CONSENSUS", "CRITICAL"))
+        assert text.startswith("📈 **Market Signal:** EXTREME CONSENSUS: NVDA")
+        assert "Time: 2026-01-05 09:30" in text
+        assert text.endswith("#OpenClaw #MarketSignal")
+
+    def test_one_alert_per_ticker(self) -> None:
+        """Test that a re-analyzed ticker replaces its held alert."""
+        aggregator = AlertAggregator()
+        aggregator.add(make_alert("NVDA", "HEALTHY_RESONANCE", "LOW"))
+        aggregator.add(make_alert("NVDA"))
+        assert aggregator.tickers() == ["NVDA"]
+        text = aggregator.flush(now=NOW)[0]
+        assert "ECHO CHAMBER: NVDA" in text
+        assert "HEALTHY RESONANCE" not in text
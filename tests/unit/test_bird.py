@@ -0,0 +1,143 @@
+"""Unit tests for the persistent bird worker pool (using a fake local worker)."""
+import asyncio
+import os
+import sys
+import textwrap
+import time
+import pytest
+from src.core.bird import BirdError, BirdWorkerPool
+
+FAKE_WORKER = textwrap.dedent("""
+    import json, os, sys, threading, time
+
+    lock = threading.Lock()
+    print(json.dumps({"event": "ready", "pid": os.getpid()}), flush=True)
+
+    def send(message):
+        with lock:
+            print(json.dumps(message), flush=True)
+
+    def handle(request):
+        rid, args = request["id"], request["args"]
+        if args[0] == "die":
+            os._exit(1)
+        if args[0] == "fail":
+            send({"id": rid, "error": "rate limited"})
+            return
+        if args[0] == "pid":
+            send({"id": rid, "item": {"pid": os.getpid()}})
+            send({"id": rid, "done": True})
+            return
+        count = int(args[args.index("-n") + 1])
+        delay = float(args[args.index("--delay") + 1]) if "--delay" in args else 0
+        for i in range(count):
+            time.sleep(delay)
+            send({"id": rid, "item": {"id_str": str(i), "user": args[1]}})
+        send({"id": rid, "done": True})
+
+    for line in sys.stdin:
+        threading.Thread(target=handle, args=(json.loads(line),), daemon=True).start()
+""")
+
+FAKE_BIRD_CLI = textwrap.dedent("""
+    import json, sys
+    n = int(sys.argv[sys.argv.index("-n") + 1])
+    print(json.dumps([{"id_str": str(i), "user": sys.argv[2]} for i in range(n)]))
+    if "--fail" in sys.argv:
+        sys.exit("not authenticated")
+""")
+
+
+@pytest.fixture
+def worker_command(tmp_path) -> list:
+    script = tmp_path / "fake_bird_worker.py"
+    script.write_text(FAKE_WORKER)
+    return [sys.executable, str(script)]
+
+
+@pytest.fixture
+def fake_bird_cli(tmp_path) -> str:
+    script = tmp_path / "bird"
+    script.write_text(f"#!{sys.executable}\n" + FAKE_BIRD_CLI)
+    os.chmod(script, 0o755)
+    return str(script)
+
+
+async def collect(pool: BirdWorkerPool, *args: str) -> list:
+    return [record async for record in pool.run(list(args))]
+
+
+class TestBirdWorkerPool:
+    """Test cases for BirdWorkerPool."""
+
+    async def test_requests_reuse_one_worker(self, worker_command: list) -> None:
+        """Test that sequential requests are served by the same long-lived process."""
+        pool = BirdWorkerPool(worker_command, workers=1)
+        try:
+            first = await collect(pool, "pid")
+            second = await collect(pool, "pid")
+            tweets = await collect(pool, "user-tweets", "@vista8", "-n", "3", "--json")
+        finally:
+            await pool.close()
+        assert first == second
+        assert [t["id_str"] for t in tweets] == ["0", "1", "2"]
+
+    async def test_concurrent_requests_are_multiplexed(self, worker_command: list) -> None:
+        """Test that interleaved responses are routed back to the right caller."""
+        pool = BirdWorkerPool(worker_command, workers=1)
+        try:
+            start = time.monotonic()
+            results = await asyncio.gather(*(
+                collect(pool, "user-tweets", f"@user{i}", "-n", "4", "--delay", "0.05")
+                for i in range(5)
+            ))
+            elapsed = time.monotonic() - start
+        finally:
+            await pool.close()
+        for i, tweets in enumerate(results):
+            assert [t["user"] for t in tweets] == [f"@user{i}"] * 4
+        # 5 requests x 4 items x 50 ms would take 1 s if served one at a time
+        assert elapsed < 0.8
+
+    async def test_worker_error_and_restart(self, worker_command: list) -> None:
+        """Test that errors end one request and a dead worker is restarted."""
+        pool = BirdWorkerPool(worker_command, workers=1)
+        try:
+            with pytest.raises(BirdError, match="rate limited"):
+                await collect(pool, "fail")
+            pid_before = (await collect(pool, "pid"))[0]["pid"]
+            with pytest.raises(BirdError):
+                await collect(pool, "die")
+            pid_after = (await collect(pool, "pid"))[0]["pid"]
+        finally:
+            await pool.close()
+        assert pid_before != pid_after
+
+    async def test_spawn_fallback_without_worker(self, fake_bird_cli: str) -> None:
+        """Test that without a worker command bird is spawned per call."""
+        pool = BirdWorkerPool(bin_path=fake_bird_cli)
+        assert not pool.persistent
+        tweets = await collect(pool, "user-tweets", "@vista8", "-n", "2", "--json")
+        assert [t["user"] for t in tweets] == ["@vista8", "@vista8"]
+
+    async def test_spawn_failure_raises_after_records(self, fake_bird_cli: str) -> None:
+        """Test that a non-zero bird exit is raised instead of looking like an empty timeline."""
+        pool = BirdWorkerPool(bin_path=fake_bird_cli)
+        records = []
+        with pytest.raises(BirdError, match="not authenticated"):
+            async for record in pool.run(["user-tweets", "@vista8", "-n", "2", "--fail"]):
+                records.append(record)
+        assert len(records) == 2
+
+    async def test_unstartable_worker_falls_back(self, fake_bird_cli: str) -> None:
+        """Test that a missing worker binary degrades to per-call spawning."""
+        pool = BirdWorkerPool(["/nonexistent/bird-worker"], bin_path=fake_bird_cli)
+        tweets = await collect(pool, "user-tweets", "@vista8", "-n", "1", "--json")
+        assert len(tweets) == 1
+        assert not pool.persistent
+
+    def test_from_config_splits_string_command(self) -> None:
+        """Test that a string worker_command is split into argv."""
+        pool = BirdWorkerPool.from_config({"worker_command": "node bird-worker.js", "workers": 3})
+        assert pool.worker_command == ["node", "bird-worker.js"]
+        assert len(pool._workers) == 3
@@ -89,3 +89,321 @@ class TestDatabase:
         assert db.is_alerted_recently("TSLA", hours=24) is False
         
         db.close()
+
+
+class TestDatabaseConnection:
+    """Test cases for the shared long-lived connection."""
+
+    async def test_connection_is_reused(self, temp_db_path: str) -> None:
+        """Test that all calls share one connection until close()."""
+        db = Database(temp_db_path)
+        await db.init_tables()
+        conn = db._conn
+        assert conn is not None
+
+        await db.record_alert("AAPL")
+        assert await db.is_alerted_recently("AAPL") is True
+        assert db._conn is conn
+
+        await db.close()
+        assert db._conn is None
+
+    async def test_wal_mode_enabled(self, temp_db_path: str) -> None:
+        """Test that the connection is opened in WAL mode."""
+        db = Database(temp_db_path)
+        await db.init_tables()
+        cursor = await db._conn.execute("PRAGMA journal_mode")
+        row = await cursor.fetchone()
+        assert row[0].lower() == "wal"
+        await db.close()
+
+    async def test_close_is_idempotent(self, temp_db_path: str) -> None:
+        """Test that close() can be called repeatedly and the db reopened."""
+        db = Database(temp_db_path)
+        await db.close()
+        await db.init_tables()
+        await db.close()
+        await db.close()
+
+        signal = Signal(
+            ticker="REOPEN",
+            signal_type=SignalType.BULLISH,
+            source_name="TestSource",
+            raw_text="Reopen test",
+            url="https://test.com",
+        )
+        assert await db.save_signal(signal) is True
+        assert len(await db.get_recent_signals(hours=24)) == 1
+        await db.close()
+
+
+class TestSaveSignals:
+    """Test cases for the batched ingestion path."""
+
+    @staticmethod
+    def _signal(ticker: str, source: str, timestamp: datetime) -> Signal:
+        return Signal(
+            ticker=ticker,
+            signal_type=SignalType.BULLISH,
+            source_name=source,
+            raw_text="Batch test",
+            url="https://test.com",
+            timestamp=timestamp,
+        )
+
+    async def test_batch_reports_new_rows(self, temp_db_path: str) -> None:
+        """Test that duplicates within the batch and against the db are flagged."""
+        from datetime import timedelta
+
+        db = Database(temp_db_path)
+        await db.init_tables()
+        now = datetime.now()
+
+        assert await db.save_signals([self._signal("AAA", "S1", now - timedelta(hours=3))]) == [True]
+
+        result = await db.save_signals([
+            self._signal("AAA", "S1", now - timedelta(hours=2, minutes=30)),  # within 1h of stored row
+            self._signal("AAA", "S2", now),                                    # different source
+            self._signal("BBB", "S1", now),
+            self._signal("BBB", "S1", now),                                    # repeated in batch
+            self._signal("AAA", "S1", now),                                    # outside 1h window
+        ])
+        assert result == [False, True, True, False, True]
+
+        signals = await db.get_recent_signals(hours=24)
+        assert len(signals) == 4
+        await db.close()
+
+    async def test_empty_batch(self, temp_db_path: str) -> None:
+        """Test that an empty batch is a no-op."""
+        db = Database(temp_db_path)
+        await db.init_tables()
+        assert await db.save_signals([]) == []
+        await db.close()
+
+
+class TestMigrations:
+    """Test cases for the PRAGMA user_version migration runner."""
+
+    async def test_fresh_database_is_fully_migrated(self, temp_db_path: str) -> None:
+        """Test that a new database ends at the latest schema version."""
+        from src.core.database import MIGRATIONS
+
+        db = Database(temp_db_path)
+        await db.init_tables()
+        cursor = await db._conn.execute("PRAGMA user_version")
+        assert (await cursor.fetchone())[0] == MIGRATIONS[-1][0]
+
+        cursor = await db._conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        indexes = {row[0] for row in await cursor.fetchall()}
+        assert "idx_signals_ticker_source_ts" in indexes
+        assert "idx_signals_timestamp" in indexes
+        assert "idx_alerts_ticker_ts" in indexes
+        await db.close()
+
+    async def test_legacy_database_upgrades_in_place(self, temp_db_path: str) -> None:
+        """Test that an unversioned database keeps its rows and gains indexes."""
+        import sqlite3
+
+        legacy = sqlite3.connect(temp_db_path)
+        legacy.execute(
+            "CREATE TABLE signals (id INTEGER PRIMARY KEY AUTOINCREMENT, ticker TEXT NOT NULL, "
+            "signal_type TEXT NOT NULL, source_name TEXT NOT NULL, raw_text TEXT, url TEXT, "
+            "timestamp DATETIME, confidence REAL)"
+        )
+        legacy.execute(
+            "CREATE TABLE alerts (id INTEGER PRIMARY KEY AUTOINCREMENT, ticker TEXT NOT NULL, "
+            "timestamp DATETIME DEFAULT CURRENT_TIMESTAMP)"
+        )
+        legacy.execute(
+            "INSERT INTO signals (ticker, signal_type, source_name, raw_text, url, timestamp, confidence) "
+            "VALUES ('OLD', 'BULLISH', 'Legacy', 'text', 'https://test.com', ?, 0.7)",
+            (datetime.now().isoformat(sep=" "),),
+        )
+        legacy.commit()
+        legacy.close()
+
+        db = Database(temp_db_path)
+        await db.init_tables()
+        await db.init_tables()  # Re-running is a no-op
+
+        signals = await db.get_recent_signals(hours=24)
+        assert [s.ticker for s in signals] == ["OLD"]
+
+        cursor = await db._conn.execute("EXPLAIN QUERY PLAN SELECT id FROM alerts WHERE ticker = ? AND timestamp > ?", ("X", 0))
+        plan = " ".join(str(row[-1]) for row in await cursor.fetchall())
+        assert "idx_alerts_ticker_ts" in plan
+        await db.close()
+
+
+class TestRecentlyAlerted:
+    """Test cases for the set-based alert suppression lookup."""
+
+    async def test_returns_only_alerted_tickers(self, temp_db_path: str) -> None:
+        """Test that one call returns the suppressed subset."""
+        db = Database(temp_db_path)
+        await db.init_tables()
+        await db.record_alert("AAPL")
+        await db.record_alert("NVDA")
+
+        alerted = await db.get_recently_alerted(["AAPL", "TSLA", "NVDA"], hours=24)
+        assert alerted == {"AAPL", "NVDA"}
+        assert await db.get_recently_alerted([]) == set()
+        await db.close()
+
+    async def test_respects_window(self, temp_db_path: str) -> None:
+        """Test that alerts older than the window are not suppressed."""
+        from datetime import timedelta
+
+        db = Database(temp_db_path)
+        await db.init_tables()
+        await db._conn.execute(
+            "INSERT INTO alerts (ticker, timestamp) VALUES (?, ?)",
+            ("OLD", datetime.now() - timedelta(hours=30)),
+        )
+        await db._conn.commit()
+
+        assert await db.get_recently_alerted(["OLD"], hours=24) == set()
+        assert await db.get_recently_alerted(["OLD"], hours=48) == {"OLD"}
+        await db.close()
+
+
+class TestSignalDecoding:
+    """Test cases for the trusted row decoding path."""
+
+    async def test_fast_path_matches_validated_path(self, temp_db_path: str) -> None:
+        """Test that fast-decoded signals carry the same values as validated ones."""
+        db = Database(temp_db_path)
+        await db.init_tables()
+        await db.save_signal(Signal(
+            ticker="FAST",
+            signal_type=SignalType.BEARISH,
+            source_name="TestSource",
+            raw_text="Decode test",
+            url="https://test.com/post",
+            confidence=0.8,
+        ))
+
+        fast = (await db.get_recent_signals(hours=24))[0]
+        full = (await db.get_recent_signals(hours=24, validate=True))[0]
+
+        assert fast.ticker == full.ticker == "FAST"
+        assert fast.signal_type is full.signal_type is SignalType.BEARISH
+        assert fast.timestamp == full.timestamp
+        assert isinstance(fast.timestamp, datetime)
+        assert str(fast.url) == str(full.url)
+        assert fast.confidence == full.confidence
+        assert fast.sentiment_score == full.sentiment_score == 0.0
+        assert isinstance(full, Signal)
+        assert fast.to_signal() == full
+        await db.close()
+
+
+class TestSignalStats:
+    """Test cases for SQL-side aggregate stats."""
+
+    async def test_stats_over_window(self, temp_db_path: str) -> None:
+        """Test totals, per-type counts and top lists."""
+        from datetime import timedelta
+
+        db = Database(temp_db_path)
+        await db.init_tables()
+        now = datetime.now()
+        rows = [
+            ("NVDA", SignalType.BULLISH, "A", now),
+            ("NVDA", SignalType.BULLISH, "B", now),
+            ("NVDA", SignalType.BEARISH, "C", now),
+            ("AAPL", SignalType.NEUTRAL, "A", now - timedelta(hours=2)),
+            ("OLD", SignalType.BEARISH, "A", now - timedelta(hours=30)),
+        ]
+        await db.save_signals([
+            Signal(ticker=t, signal_type=st, source_name=src, raw_text="x",
+                   url="https://test.com", timestamp=ts)
+            for t, st, src, ts in rows
+        ])
+
+        stats = await db.get_signal_stats(hours=24, top_n=1)
+        assert stats["total"] == 4
+        assert stats["tickers"] == 2
+        assert stats["sources"] == 3
+        assert stats["by_type"] == {"BULLISH": 2, "BEARISH": 1, "NEUTRAL": 1}
+        assert stats["top_tickers"] == [("NVDA", 3)]
+        assert stats["top_sources"] == [("A", 2)]
+        await db.close()
+
+    async def test_stats_empty(self, temp_db_path: str) -> None:
+        """Test stats on an empty database."""
+        db = Database(temp_db_path)
+        await db.init_tables()
+        stats = await db.get_signal_stats()
+        assert stats["total"] == 0
+        assert stats["top_tickers"] == []
+        await db.close()
+
+    async def test_stats_error_falls_back(self, temp_db_path: str) -> None:
+        """Test that a failing query is logged and returns zeroed stats."""
+        db = Database(temp_db_path)  # No tables: every query fails
+        stats = await db.get_signal_stats()
+        assert stats["total"] == 0
+        assert stats["by_type"] == {"BULLISH": 0, "BEARISH": 0, "NEUTRAL": 0}
+        assert stats["top_sources"] == []
+        await db.close()
+
+
+class TestSourceCursors:
+    """Test cases for persistent per-source fetch cursors."""
+
+    async def test_cursor_round_trip(self, temp_db_path: str) -> None:
+        """Test that cursors are inserted, updated and read back."""
+        from src.models.schemas import SourceCursor
+
+        db = Database(temp_db_path)
+        await db.init_tables()
+        assert await db.get_source_cursor("Vista") is None
+
+        await db.save_source_cursor(SourceCursor("Vista", "100", 5))
+        await db.save_source_cursor(SourceCursor("Vista", "250", 20))
+
+        cursor = await db.get_source_cursor("Vista")
+        assert cursor.last_seen_id == "250"
+        assert cursor.fetch_depth == 20
+        assert isinstance(cursor.updated_at, datetime)
+        await db.close()
+
+
+class TestOutbox:
+    """Test cases for the durable alert outbox."""
+
+    async def test_alerts_and_outbox_are_written_together(self, temp_db_path: str) -> None:
+        """Test that record_alerts stores alerts and messages, ignoring repeated keys."""
+        from src.models.schemas import OutboxMessage
+
+        db = Database(temp_db_path)
+        await db.init_tables()
+        message = OutboxMessage("key-1", "chat", "NVDA alert")
+        assert await db.record_alerts(["NVDA", "AAPL"], [message])
+        assert await db.record_alerts(["NVDA"], [message])
+
+        assert await db.get_recently_alerted(["NVDA", "AAPL", "TSLA"]) == {"NVDA", "AAPL"}
+        pending = await db.get_pending_outbox()
+        assert [(m.idempotency_key, m.message, m.attempts) for m in pending] == [("key-1", "NVDA alert", 0)]
+        await db.close()
+
+    async def test_outbox_status_transitions(self, temp_db_path: str) -> None:
+        """Test that failed rows wait for their retry time and sent rows leave the queue."""
+        from datetime import timedelta
+        from src.models.schemas import OutboxMessage
+
+        db = Database(temp_db_path)
+        await db.init_tables()
+        await db.record_alerts([], [OutboxMessage("a", "chat", "first"), OutboxMessage("b", "chat", "second")])
+
+        await db.mark_outbox_failed("a", datetime.now() + timedelta(minutes=5))
+        await db.mark_outbox_sent("b")
+        assert await db.get_pending_outbox() == []
+        retry = await db.get_pending_outbox(now=datetime.now() + timedelta(minutes=10))
+        assert [(m.idempotency_key, m.attempts) for m in retry] == [("a", 1)]
+
+        await db.mark_outbox_failed("a")  # give up
+        assert await db.get_pending_outbox(now=datetime.now() + timedelta(days=1)) == []
+        await db.close()
@@ -0,0 +1,153 @@
+"""Unit tests for the long-lived engine service and source reloading."""
+import os
+import pytest
+import src.core.database as database
+import src.core.engine as engine_module
+from src.core.engine import Engine
+from src.core.engine_service import EngineService
+from src.core.fetcher import BaseAdapter, FetcherFactory
+from src.core.source_scheduler import SourceScheduler
+from src.models.schemas import Signal, SignalType, Source
+from src.utils.teleporter import DeliveryResult, Teleporter
+
+TABLE = """| Name | URL | Platform | Category | Weight |
+|------|-----|----------|----------|--------|
+| Alpha | https://x.com/alpha | twitter | mainstream | 1.0 |
+| Beta | https://beta.substack.com | substack | contrarian | 2.0 |
+"""
+
+
+class FakeTeleporter(Teleporter):
+    """Accepts every message without network access."""
+
+    async def deliver(self, client, message_text: str, chat_id: str) -> DeliveryResult:
+        return DeliveryResult(ok=True)
+
+
+class StubAdapter(BaseAdapter):
+    """Returns nothing; `failing` mimics an adapter that logged and swallowed an error."""
+
+    def __init__(self, source: Source, failing: bool):
+        super().__init__(source)
+        self.failing = failing
+
+    async def fetch(self) -> list:
+        self.failed = self.failing
+        return []
+
+
+def write_sources(path: str, text: str) -> None:
+    with open(path, "w") as f:
+        f.write(text)
+
+
+@pytest.fixture
+def engine(tmp_path, temp_db_path, monkeypatch) -> Engine:
+    monkeypatch.setattr(database, "DB_PATH", temp_db_path)
+    engine = Engine()
+    engine.telegram_queue.teleporter = FakeTeleporter()
+    engine.sources_path = str(tmp_path / "bloggers.md")
+    write_sources(engine.sources_path, TABLE)
+
+    async def fake_process(source: Source, db=None) -> tuple:
+        return [Signal(ticker="NVDA", signal_type=SignalType.NEUTRAL, source_name=source.name,
+                       raw_text="watching NVDA", url=f"https://example.com/{source.name}")], None
+
+    engine._process_source = fake_process
+    return engine
+
+
+class TestLoadSources:
+    """Test cases for Engine.load_sources_from_memory."""
+
+    def test_reload_only_when_file_changes(self, engine: Engine) -> None:
+        """Test that an unchanged file is not re-parsed and repeated loads never duplicate."""
+        assert engine.load_sources_from_memory()
+        first = engine.sources
+        assert [s.name for s in first] == ["Alpha", "Beta"]
+        assert not engine.load_sources_from_memory()
+        assert engine.sources is first
+
+        write_sources(engine.sources_path, TABLE + "| Gamma | https://gamma.blog | generic | 1.0 |\n")
+        assert engine.load_sources_from_memory()
+        assert [s.name for s in engine.sources] == ["Alpha", "Beta", "Gamma"]
+
+    def test_duplicate_rows_keep_the_last(self, engine: Engine) -> None:
+        """Test that a re-added name replaces the earlier row instead of duplicating it."""
+        write_sources(engine.sources_path, TABLE + "| Alpha | https://x.com/alpha2 | twitter | 3.0 |\n")
+        engine.load_sources_from_memory()
+        assert [s.name for s in engine.sources] == ["Alpha", "Beta"]
+        assert str(engine.sources[0].url) == "https://x.com/alpha2"
+        assert engine.sources[0].weight == 3.0
+
+    def test_malformed_file_parsed_once(self, engine: Engine, monkeypatch) -> None:
+        """Test that a bad row keeps the last good sources and isn't re-parsed until the file changes."""
+        engine.load_sources_from_memory()
+        sources = engine.sources
+        write_sources(engine.sources_path, TABLE + "| Gamma | https://gamma.blog | generic | mainstream | lots |\n")
+        opened = []
+        monkeypatch.setattr(engine_module, "open", lambda *args: opened.append(args) or open(*args), raising=False)
+        assert not engine.load_sources_from_memory()
+        assert not engine.load_sources_from_memory()
+        assert len(opened) == 1
+        assert engine.sources is sources
+
+        write_sources(engine.sources_path, TABLE + "| Gamma | https://gamma.blog | generic | mainstream | 1.0 |\n")
+        assert engine.load_sources_from_memory()
+        assert len(engine.sources) == 3
+
+    def test_missing_file_keeps_sources(self, engine: Engine) -> None:
+        """Test that a failed reload leaves the loaded sources in place."""
+        engine.load_sources_from_memory()
+        os.remove(engine.sources_path)
+        assert not engine.load_sources_from_memory()
+        assert len(engine.sources) == 2
+
+
+class TestEngineService:
+    """Test cases for EngineService."""
+
+    async def test_cycles_reuse_engine_state(self, engine: Engine) -> None:
+        """Test that repeated scans share one engine, source list and database connection."""
+        service = EngineService(engine, SourceScheduler(min_interval=3600.0, jitter=0.0))
+        try:
+            stats = await service.scan_all()
+            assert stats.sources == 2 and stats.new_signals == 2
+            db = engine._db
+            sources = engine.sources
+
+            assert await service.scan_all() is not None
+            assert engine._db is db
+            assert engine.sources is sources
+            assert service.last_scan_time is not None
+            assert not service.is_scanning
+        finally:
+            await service.close()
+
+    async def test_run_due_skips_while_scanning(self, engine: Engine) -> None:
+        """Test that a tick does nothing while another cycle is running."""
+        service = EngineService(engine, SourceScheduler(jitter=0.0))
+        try:
+            service.is_scanning = True
+            assert await service.run_due() == 0
+            assert await service.scan_all() is None
+            service.is_scanning = False
+            assert await service.run_due() == 1  # New sources are staggered
+        finally:
+            await service.close()
+
+    async def test_failed_fetch_backs_off(self, engine: Engine, monkeypatch) -> None:
+        """Test that an adapter-reported failure doubles the source's interval."""
+        del engine._process_source  # Use the real fetch path
+        monkeypatch.setattr(FetcherFactory, "get_adapter",
+                            staticmethod(lambda source, **kwargs: StubAdapter(source, source.name == "Alpha")))
+        scheduler = SourceScheduler(base_interval=3600.0, min_interval=0.0, jitter=0.0)
+        service = EngineService(engine, scheduler)
+        try:
+            assert await service.run_due() == 2
+        finally:
+            await service.close()
+        assert scheduler.get("Alpha").errors == 1
+        assert scheduler.get("Alpha").interval == 2 * 3600.0
+        assert scheduler.get("Beta").errors == 0
+        assert scheduler.get("Beta").interval == 3600.0 / 2  # Weight 2, no backoff
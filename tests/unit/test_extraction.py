@@ -0,0 +1,81 @@
+"""Unit tests for the off-loop extraction pool."""
+import pytest
+from src.core.extraction import ExtractionPool
+from src.core.processor import SignalProcessor
+from src.models.schemas import Source, PlatformType
+
+
+@pytest.fixture
+def source() -> Source:
+    return Source(name="Test", url="https://x.com/test", platform=PlatformType.TWITTER)
+
+
+def make_items(count: int):
+    return [
+        {"full_text": f"Buy $NVDA now, breakout #{i}", "url": f"https://x.com/test/status/{i}"}
+        for i in range(count)
+    ]
+
+
+def summarize(signals):
+    return [(s.ticker, s.signal_type, str(s.url)) for s in signals]
+
+
+class TestExtractionPool:
+    """Test cases for ExtractionPool."""
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    async def test_pool_matches_inline_extraction(self, source: Source, executor: str) -> None:
+        """Test that batched pool extraction returns the same signals in order."""
+        items = make_items(120)
+        pool = ExtractionPool(executor=executor, max_workers=2, batch_size=25, inline_max_chars=0)
+        try:
+            signals = await pool.process(source, items)
+        finally:
+            pool.shutdown()
+
+        assert summarize(signals) == summarize(SignalProcessor.process(source, items))
+        assert len(signals) == 120
+
+    async def test_small_results_run_inline(self, source: Source) -> None:
+        """Test that small results never start a worker pool."""
+        pool = ExtractionPool(executor="process", inline_max_chars=10_000)
+        signals = await pool.process(source, make_items(3))
+        assert len(signals) == 3
+        assert pool._executor is None
+
+    async def test_stream_cutoff_is_cumulative(self, source: Source) -> None:
+        """Test that a long stream of small batches is sent to the pool once its text adds up."""
+        items = make_items(200)  # ~30 chars each, ~6k chars in total
+
+        async def stream(batch):
+            for item in batch:
+                yield item
+
+        pool = ExtractionPool(executor="thread", max_workers=2, batch_size=50, inline_max_chars=3000)
+        try:
+            small = await pool.process_stream(source, stream(items[:50]))
+            assert pool._executor is None  # Below the cutoff: inline
+            signals = await pool.process_stream(source, stream(items))
+            assert pool._executor is not None
+        finally:
+            pool.shutdown()
+        assert len(small) == 50
+        assert summarize(signals) == summarize(SignalProcessor.process(source, items))
+
+    async def test_empty_input(self, source: Source) -> None:
+        """Test that an empty fetch result yields no signals."""
+        pool = ExtractionPool(executor="thread", inline_max_chars=0)
+        assert await pool.process(source, []) == []
+
+    def test_unknown_executor_rejected(self) -> None:
+        """Test that an invalid executor type raises ValueError."""
+        with pytest.raises(ValueError):
+            ExtractionPool(executor="gpu")
+
+    def test_from_config(self) -> None:
+        """Test that settings are read from the advanced.extraction section."""
+        pool = ExtractionPool.from_config({"executor": "thread", "max_workers": 3, "batch_size": 10})
+        assert pool.executor_type == "thread"
+        assert pool.max_workers == 3
+        assert pool.batch_size == 10
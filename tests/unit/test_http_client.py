@@ -0,0 +1,58 @@
+"""Unit tests for the shared HTTP client and GenericAdapter reuse."""
+import httpx
+from src.core.adapter_web import GenericAdapter
+from src.core.fetcher import FetcherFactory, TwitterAdapter
+from src.core.http_client import create_http_client
+from src.models.schemas import Source, PlatformType
+
+PAGE = "<html><body><p>Buy $NVDA before the earnings breakout next week</p></body></html>"
+
+
+def make_source(i: int = 0) -> Source:
+    return Source(name=f"Blog{i}", url=f"https://blog.example.com/{i}", platform=PlatformType.GENERIC)
+
+
+class TestSharedHttpClient:
+    """Test cases for create_http_client and adapter wiring."""
+
+    async def test_settings_applied(self) -> None:
+        """Test that timeouts and pool limits come from the advanced config."""
+        client = create_http_client({"http_timeout": 7, "http_max_connections": 3, "http2": False})
+        try:
+            assert client.timeout.read == 7
+            assert client.timeout.connect == 5
+            assert client.follow_redirects is True
+        finally:
+            await client.aclose()
+
+    async def test_adapters_share_client(self) -> None:
+        """Test that web adapters from the factory issue requests on the shared client."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(str(request.url))
+            return httpx.Response(200, text=PAGE)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            for i in range(3):
+                adapter = FetcherFactory.get_adapter(make_source(i), http_client=client)
+                assert isinstance(adapter, GenericAdapter)
+                items = await adapter.fetch()
+                assert "NVDA" in items[0]["full_text"]
+        finally:
+            await client.aclose()
+        assert len(seen) == 3
+
+    async def test_http_error_returns_empty(self) -> None:
+        """Test that HTTP errors on the shared client are swallowed per source."""
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(503)))
+        try:
+            assert await GenericAdapter(make_source(), client=client).fetch() == []
+        finally:
+            await client.aclose()
+
+    def test_twitter_sources_ignore_client(self) -> None:
+        """Test that Twitter sources still get the bird adapter."""
+        source = Source(name="T", url="https://x.com/someone", platform=PlatformType.TWITTER)
+        assert isinstance(FetcherFactory.get_adapter(source, http_client=None), TwitterAdapter)
@@ -0,0 +1,109 @@
+"""Unit tests for incremental JSON array / NDJSON parsing."""
+import asyncio
+import json
+import sys
+import pytest
+from src.core.json_stream import JSONStreamError, iter_json_records
+from src.core.extraction import ExtractionPool
+from src.models.schemas import Source, PlatformType
+
+
+def reader_for(*chunks: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    reader.feed_eof()
+    return reader
+
+
+async def collect(reader, **kwargs):
+    return [record async for record in iter_json_records(reader, **kwargs)]
+
+
+TWEETS = [{"id_str": str(i), "full_text": f"Buy $NVDA 看多 #{i}"} for i in range(5)]
+
+
+class TestIterJsonRecords:
+    """Test cases for iter_json_records."""
+
+    async def test_json_array_split_across_chunks(self) -> None:
+        """Test that array elements are parsed across arbitrary chunk boundaries."""
+        payload = json.dumps(TWEETS, indent=2, ensure_ascii=False).encode()
+        chunks = [payload[i:i + 7] for i in range(0, len(payload), 7)]
+        assert await collect(reader_for(*chunks), chunk_size=7) == TWEETS
+
+    async def test_ndjson(self) -> None:
+        """Test that line-delimited records are parsed one per line."""
+        payload = "\n".join(json.dumps(t, ensure_ascii=False) for t in TWEETS).encode()
+        assert await collect(reader_for(payload), chunk_size=16) == TWEETS
+
+    async def test_ndjson_skips_malformed_line(self) -> None:
+        """Test that a corrupt line is dropped without losing its neighbours."""
+        payload = b'{"id_str": "1"}\n{"id_str": broken\n{"id_str": "2"}\n'
+        assert await collect(reader_for(payload)) == [{"id_str": "1"}, {"id_str": "2"}]
+
+    async def test_multiline_object_in_ndjson_mode(self) -> None:
+        """Test that a pretty-printed standalone object is still recovered."""
+        payload = b'{\n  "id_str": "1"\n}\n{"id_str": "2"}\n'
+        assert await collect(reader_for(payload)) == [{"id_str": "1"}, {"id_str": "2"}]
+
+    async def test_pretty_printed_wrapper_object(self) -> None:
+        """Test that an indented {"tweets": [...]} object is one record, even split into chunks."""
+        wrapper = {"tweets": [{"id_str": "1", "hashtags": ["ai", "llm"], "likes": 42, "pinned": True},
+                              {"id_str": "2", "hashtags": []}]}
+        payload = json.dumps(wrapper, indent=2).encode()
+        chunks = [payload[i:i + 5] for i in range(0, len(payload), 5)]
+        assert await collect(reader_for(*chunks), chunk_size=5) == [wrapper]
+        assert await collect(reader_for(payload + b"\n" + payload)) == [wrapper, wrapper]
+
+    async def test_malformed_pretty_printed_object_is_skipped(self) -> None:
+        """Test that the lines of a broken object are not yielded as records."""
+        payload = b'{\n  "tags": [\n    "llm"\n  ],\n  oops\n}\n{"id_str": "2"}\n'
+        assert await collect(reader_for(payload)) == [{"id_str": "2"}]
+
+    async def test_empty_output(self) -> None:
+        """Test that empty or whitespace-only output yields nothing."""
+        assert await collect(reader_for(b"  \n")) == []
+
+    async def test_record_size_limit(self) -> None:
+        """Test that a record above the size limit aborts the stream."""
+        payload = b'[{"full_text": "' + b"x" * 5000 + b'"}]'
+        with pytest.raises(JSONStreamError):
+            await collect(reader_for(payload), chunk_size=512, max_record_bytes=1024)
+
+    async def test_records_flow_before_process_exits(self) -> None:
+        """Test that records arrive while the producing subprocess is still running."""
+        script = (
+            "import json, sys, time\n"
+            "print(json.dumps({'id_str': '1'}), flush=True)\n"
+            "time.sleep(5)\n"
+            "print(json.dumps({'id_str': '2'}), flush=True)\n"
+        )
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", script, stdout=asyncio.subprocess.PIPE
+        )
+        try:
+            records = iter_json_records(process.stdout)
+            first = await asyncio.wait_for(records.__anext__(), timeout=3)
+            assert first == {"id_str": "1"}
+            assert process.returncode is None
+            await records.aclose()
+        finally:
+            process.kill()
+            await process.wait()
+
+
+class TestProcessStream:
+    """Test cases for batched extraction from a stream."""
+
+    async def test_process_stream_batches(self) -> None:
+        """Test that streamed items are extracted in batches and order is kept."""
+        source = Source(name="T", url="https://x.com/t", platform=PlatformType.TWITTER)
+
+        async def items():
+            for tweet in TWEETS:
+                yield tweet
+
+        pool = ExtractionPool(executor="inline", batch_size=2)
+        signals = await pool.process_stream(source, items())
+        assert [s.ticker for s in signals] == ["NVDA"] * 5
@@ -0,0 +1,59 @@
+"""Unit tests for the single-pass keyword matcher."""
+import re
+import pytest
+from src.core.keyword_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """Test cases for KeywordMatcher."""
+
+    def test_groups_and_case_insensitivity(self) -> None:
+        """Test that hits are reported per group, case-insensitively."""
+        matcher = KeywordMatcher({"bullish": ["buy", "moon"], "bearish": ["sell"]})
+        hits = matcher.match("BUY the dip, Moon soon")
+        assert hits == {"bullish": {"buy", "moon"}, "bearish": set()}
+
+    def test_overlapping_and_nested_keywords(self) -> None:
+        """Test that overlapping and contained keywords are all found."""
+        matcher = KeywordMatcher({"k": ["sell", "long", "bull", "bullish", "ish"]})
+        # "sell" and "long" overlap in "sellong"; "bull"/"ish" sit inside "bullish"
+        assert matcher.find("sellong bullish") == {"sell", "long", "bull", "bullish", "ish"}
+
+    def test_cjk_keywords(self) -> None:
+        """Test that CJK keywords match inside unsegmented text."""
+        matcher = KeywordMatcher({"bullish": ["买入", "目标价"], "bearish": ["止损"]})
+        hits = matcher.match("看好英伟达，买入并上调目标价")
+        assert hits["bullish"] == {"买入", "目标价"}
+        assert hits["bearish"] == set()
+
+    def test_whole_word_is_cjk_aware(self) -> None:
+        """Test that word boundaries apply to ASCII only."""
+        matcher = KeywordMatcher({"k": ["AI", "AI Agents", "LLM"]}, whole_word=True)
+        assert matcher.find("New AI Agents ship") == {"ai", "ai agents"}
+        assert matcher.find("LLMs and SAIL") == set()
+        assert matcher.find("用AI工具") == {"ai"}
+
+    def test_keyword_in_both_groups(self) -> None:
+        """Test that a keyword shared by two groups counts for both."""
+        matcher = KeywordMatcher({"a": ["call"], "b": ["call", "put"]})
+        assert matcher.match("call") == {"a": {"call"}, "b": {"call"}}
+
+    def test_regex_metacharacters_are_literal(self) -> None:
+        """Test that keywords are treated as literal text."""
+        matcher = KeywordMatcher({"k": ["c++", "a.b"]})
+        assert matcher.find("I like c++ not axb") == {"c++"}
+
+    def test_empty(self) -> None:
+        """Test matcher with no keywords or no text."""
+        assert KeywordMatcher({}).find("anything") == set()
+        assert KeywordMatcher({"k": ["x"]}).match("") == {"k": set()}
+
+    @pytest.mark.parametrize("text", [
+        "buy buy sell", "breakdown after breakout", "putcall", "看多看空", "moonbeam bearish dumpster",
+    ])
+    def test_agrees_with_per_keyword_search(self, text: str) -> None:
+        """Test equivalence with one re.search per keyword."""
+        keywords = ["buy", "long", "call", "breakout", "moon", "bull", "sell", "short", "put",
+                    "breakdown", "dump", "bear", "看多", "看空"]
+        expected = {kw for kw in keywords if re.search(kw, text.lower())}
+        assert KeywordMatcher({"k": keywords}).find(text) == expected
@@ -0,0 +1,101 @@
+"""Unit tests for durable outbox delivery."""
+import asyncio
+from src.core.database import Database
+from src.core.outbox import OutboxDrainer, outbox_message
+from src.utils.teleporter import DeliveryResult, Teleporter
+from src.utils.telegram_queue import TelegramQueue
+
+
+class FakeTeleporter(Teleporter):
+    """Records sends; fails while `failing` is set."""
+
+    def __init__(self, failing: bool = False, delay: float = 0.0):
+        super().__init__()
+        self.failing = failing
+        self.delay = delay
+        self.sent = []
+
+    async def deliver(self, client, message_text: str, chat_id: str) -> DeliveryResult:
+        await asyncio.sleep(self.delay)
+        if self.failing:
+            return DeliveryResult(ok=False, permanent=True)
+        self.sent.append(message_text)
+        return DeliveryResult(ok=True)
+
+
+async def outbox_status(db_path: str) -> dict:
+    db = Database(db_path)
+    conn = await db._get_conn()
+    cursor = await conn.execute("SELECT idempotency_key, status, attempts FROM outbox")
+    rows = {row['idempotency_key']: (row['status'], row['attempts']) for row in await cursor.fetchall()}
+    await db.close()
+    return rows
+
+
+async def write_alert(db_path: str, ticker: str, text: str) -> str:
+    db = Database(db_path)
+    await db.init_tables()
+    message = outbox_message("chat", text)
+    await db.record_alerts([ticker], [message])
+    await db.close()
+    return message.idempotency_key
+
+
+class TestOutboxDrainer:
+    """Test cases for OutboxDrainer."""
+
+    async def test_pending_rows_survive_restart(self, temp_db_path: str) -> None:
+        """Test that rows written before a crash are delivered by the next drainer."""
+        key = await write_alert(temp_db_path, "NVDA", "NVDA alert")
+
+        teleporter = FakeTeleporter()
+        drainer = OutboxDrainer(TelegramQueue(teleporter, chat_rate=0))
+        db = Database(temp_db_path)
+        try:
+            drainer.start(db)
+            assert await drainer.stop(timeout=5)
+        finally:
+            await db.close()
+
+        assert teleporter.sent == ["NVDA alert"]
+        assert (await outbox_status(temp_db_path))[key] == ("sent", 1)
+
+    async def test_failed_delivery_is_rescheduled(self, temp_db_path: str) -> None:
+        """Test that a failed send stays pending with a later retry, then gives up."""
+        key = await write_alert(temp_db_path, "NVDA", "NVDA alert")
+        queue = TelegramQueue(FakeTeleporter(failing=True), chat_rate=0)
+
+        drainer = OutboxDrainer(queue, max_attempts=2, retry_base=0.0)
+        db = Database(temp_db_path)
+        try:
+            drainer.start(db)
+            await drainer.stop(timeout=5)
+            assert (await outbox_status(temp_db_path))[key] == ("pending", 1)
+
+            drainer.start(db)
+            await drainer.stop(timeout=5)
+        finally:
+            await db.close()
+        assert (await outbox_status(temp_db_path))[key] == ("failed", 2)
+
+    async def test_inflight_rows_are_not_enqueued_twice(self, temp_db_path: str) -> None:
+        """Test that repeated drain passes don't resend a message still in flight."""
+        await write_alert(temp_db_path, "NVDA", "NVDA alert")
+        teleporter = FakeTeleporter(delay=0.2)
+        drainer = OutboxDrainer(TelegramQueue(teleporter, chat_rate=0))
+        db = Database(temp_db_path)
+        try:
+            drainer.start(db)
+            await asyncio.sleep(0.05)
+            for _ in range(3):
+                drainer.notify()
+                await drainer.drain_once()
+            assert await drainer.stop(timeout=5)
+        finally:
+            await db.close()
+        assert teleporter.sent == ["NVDA alert"]
+
+    def test_same_text_shares_idempotency_key(self) -> None:
+        """Test that keys depend on chat and text only."""
+        assert outbox_message("chat", "x").idempotency_key == outbox_message("chat", "x").idempotency_key
+        assert outbox_message("chat", "x").idempotency_key != outbox_message("other", "x").idempotency_key
@@ -0,0 +1,156 @@
+"""Unit tests for the streaming scan-cycle pipeline."""
+import asyncio
+from src.core.database import Database
+from src.core.diversity_analyzer import DiversityAnalyzer
+from src.core.engine import Engine, _drain_batches
+from src.core.fetcher import BaseAdapter
+from src.models.schemas import PlatformType, Signal, SignalType, Source
+
+
+def make_engine(latencies: dict, ticker: str = "NVDA") -> Engine:
+    engine = Engine()
+    engine.sources = [
+        Source(name=name, url=f"https://example.com/{name}", platform=PlatformType.GENERIC)
+        for name in latencies
+    ]
+    engine.diversity_analyzer = DiversityAnalyzer(engine.sources)
+
+    async def fake_process(source: Source, db=None) -> tuple:
+        await asyncio.sleep(latencies[source.name])
+        return [Signal(ticker=ticker, signal_type=SignalType.BULLISH, source_name=source.name,
+                       raw_text=f"{ticker} to the moon", url=f"https://example.com/{source.name}/1")], None
+
+    engine._process_source = fake_process
+    return engine
+
+
+class CommitCounter(BaseAdapter):
+    """Adapter stand-in that counts commit() calls."""
+
+    def __init__(self, source: Source):
+        super().__init__(source)
+        self.commits = 0
+
+    async def fetch(self) -> list:
+        return []
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+def record_dispatches(engine: Engine) -> list:
+    """Collect every alert the engine dispatches (still sending it on)."""
+    dispatched = []
+    dispatch = engine._dispatch_alert
+
+    async def record(db, alert) -> None:
+        dispatched.append(alert)
+        await dispatch(db, alert)
+
+    engine._dispatch_alert = record
+    return dispatched
+
+
+def hold_outbox(engine: Engine) -> None:
+    """Keep alert messages in the outbox table instead of sending them."""
+    engine.outbox.notify = lambda: None
+
+
+class TestDrainBatches:
+    """Test cases for merging queued batches."""
+
+    async def test_merges_waiting_batches_until_sentinel(self) -> None:
+        """Test that batches already waiting are yielded as one list."""
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in ([1, 2], [3], None):
+            queue.put_nowait(item)
+        assert [batch async for batch in _drain_batches(queue)] == [[1, 2, 3]]
+
+
+class TestPipeline:
+    """Test cases for Engine._run_pipeline."""
+
+    async def test_critical_alert_does_not_wait_for_slow_source(self, temp_db_path: str) -> None:
+        """Test that an immediate alert goes out before a slow source finishes, once per cycle."""
+        engine = make_engine({"a": 0.0, "b": 0.01, "c": 0.02, "slow": 0.3})
+        hold_outbox(engine)
+        dispatched = record_dispatches(engine)
+        db = Database(temp_db_path)
+        await db.init_tables()
+        try:
+            stats = await engine._run_pipeline(db)
+            assert await db.is_alerted_recently("NVDA")
+        finally:
+            await db.close()
+            await engine.close()
+
+        assert stats.signals == 4 and stats.new_signals == 4
+        assert stats.alerts == 1 and len(dispatched) == 1
+        assert dispatched[0].severity == "CRITICAL"
+        assert stats.first_alert_s is not None and stats.first_alert_s < 0.2
+        assert stats.duration_s >= 0.3
+
+    async def test_digest_alerts_wait_for_every_source(self, temp_db_path: str) -> None:
+        """Test that a non-immediate alert is built once, in the final pass, with every signal."""
+        engine = make_engine({"a": 0.0, "b": 0.01, "c": 0.02, "slow": 0.3})
+        engine.alert_aggregator.immediate_severities = set()
+        hold_outbox(engine)
+        dispatched = record_dispatches(engine)
+        db = Database(temp_db_path)
+        await db.init_tables()
+        try:
+            stats = await engine._run_pipeline(db)
+        finally:
+            await db.close()
+            await engine.close()
+
+        assert stats.alerts == 1 and len(dispatched) == 1
+        assert len(dispatched[0].related_signals) == 4
+        assert stats.first_alert_s >= 0.3
+
+    async def test_without_early_analysis_alerts_after_all_sources(self, temp_db_path: str) -> None:
+        """Test that early_analysis=False keeps the fetch-everything-first behavior."""
+        engine = make_engine({"a": 0.0, "b": 0.01, "c": 0.02, "slow": 0.3})
+        engine.pipeline_early_analysis = False
+        hold_outbox(engine)
+        db = Database(temp_db_path)
+        await db.init_tables()
+        try:
+            stats = await engine._run_pipeline(db)
+        finally:
+            await db.close()
+            await engine.close()
+
+        assert stats.alerts == 1
+        assert stats.first_alert_s >= 0.3
+
+    async def test_fetch_progress_commits_only_after_save(self, temp_db_path: str) -> None:
+        """Test that a failed save leaves cursors/validators uncommitted."""
+        engine = make_engine({"a": 0.0})
+        adapter = CommitCounter(engine.sources[0])
+        fetch = engine._process_source
+
+        async def with_adapter(source: Source, db=None) -> tuple:
+            signals, _ = await fetch(source, db)
+            return signals, adapter
+
+        engine._process_source = with_adapter
+        hold_outbox(engine)
+        db = Database(temp_db_path)
+        await db.init_tables()
+        try:
+            save = db.save_signals
+
+            async def failing_save(signals, strict=False):
+                raise RuntimeError("disk full")
+
+            db.save_signals = failing_save
+            stats = await engine._run_pipeline(db)
+            assert adapter.commits == 0 and stats.new_signals == 0
+
+            db.save_signals = save
+            stats = await engine._run_pipeline(db)
+            assert adapter.commits == 1 and stats.new_signals == 1
+        finally:
+            await db.close()
+            await engine.close()
@@ -71,3 +71,9 @@ class TestSignalProcessor:
         assert len(signals) > 0
         assert signals[0].ticker == "TSLA"
         assert signals[0].source_name == "Test"
+
+    def test_unknown_uppercase_words_filtered(self) -> None:
+        """Test that bare uppercase words outside the ticker universe are dropped."""
+        text = "WOW THIS IS HUGE for NVDA and $ZZZZ"
+        tickers = SignalProcessor._extract_tickers(text)
+        assert tickers == {"NVDA", "ZZZZ"}
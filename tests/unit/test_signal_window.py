@@ -0,0 +1,107 @@
+"""Unit tests for the incremental signal window."""
+import pytest
+from datetime import datetime, timedelta
+from src.core.diversity_analyzer import DiversityAnalyzer
+from src.core.signal_window import SignalWindow, TickerAggregate
+from src.models.schemas import Signal, SignalType, Source, SourceCategory, PlatformType
+
+
+def make_signal(ticker: str, source: str, signal_type: SignalType, age_hours: float = 0.0,
+                confidence: float = 0.7) -> Signal:
+    return Signal(
+        ticker=ticker,
+        signal_type=signal_type,
+        source_name=source,
+        raw_text=f"{ticker} from {source}",
+        url="https://test.com",
+        timestamp=datetime.now() - timedelta(hours=age_hours),
+        confidence=confidence,
+    )
+
+
+class TestSignalWindow:
+    """Test cases for SignalWindow bookkeeping."""
+
+    def test_add_updates_tallies_and_dirty_set(self) -> None:
+        """Test that added signals update per-ticker and per-source counts."""
+        window = SignalWindow(hours=24)
+        window.add_many([
+            make_signal("NVDA", "A", SignalType.BULLISH),
+            make_signal("NVDA", "B", SignalType.BEARISH),
+            make_signal("AAPL", "A", SignalType.NEUTRAL),
+        ])
+
+        agg = window.get("NVDA")
+        assert agg.total == 2
+        assert agg.counts[SignalType.BULLISH] == 1
+        assert agg.counts[SignalType.BEARISH] == 1
+        assert set(agg.source_counts) == {"A", "B"}
+        assert window.pop_dirty() == {"NVDA", "AAPL"}
+        assert window.pop_dirty() == set()
+
+    def test_expire_drops_old_signals(self) -> None:
+        """Test that expiry removes old signals and empty tickers."""
+        window = SignalWindow(hours=24)
+        window.add_many([
+            make_signal("NVDA", "A", SignalType.BULLISH, age_hours=30),
+            make_signal("NVDA", "B", SignalType.BEARISH, age_hours=1),
+            make_signal("OLD", "A", SignalType.BULLISH, age_hours=25),
+        ])
+        window.pop_dirty()
+
+        assert window.expire() == 2
+        assert len(window) == 1
+        assert window.get("OLD") is None
+        agg = window.get("NVDA")
+        assert agg.total == 1
+        assert set(agg.source_counts) == {"B"}
+        assert window.pop_dirty() == {"NVDA"}
+
+    def test_recent_signals_newest_first(self) -> None:
+        """Test that materialized signals are ordered newest first."""
+        window = SignalWindow(hours=24)
+        window.add_many([
+            make_signal("NVDA", "old", SignalType.BULLISH, age_hours=5),
+            make_signal("NVDA", "new", SignalType.BULLISH, age_hours=1),
+        ])
+        assert [s.source_name for s in window.get("NVDA").recent_signals()] == ["new", "old"]
+
+
+class TestAnalyzeAggregate:
+    """Test that window-based analysis matches list-based analysis."""
+
+    def test_matches_list_analysis_after_expiry(self) -> None:
+        """Test that an aggregate maintained incrementally gives the same metrics."""
+        sources = [
+            Source(name="A", url="https://x.com/a", platform=PlatformType.TWITTER,
+                   category=SourceCategory.MAINSTREAM),
+            Source(name="B", url="https://b.com", platform=PlatformType.GENERIC,
+                   category=SourceCategory.CONTRARIAN),
+        ]
+        analyzer = DiversityAnalyzer(sources)
+        signals = [
+            make_signal("NVDA", "A", SignalType.BULLISH, age_hours=2),
+            make_signal("NVDA", "A", SignalType.BULLISH, age_hours=3),
+            make_signal("NVDA", "B", SignalType.BEARISH, age_hours=4, confidence=0.9),
+            make_signal("NVDA", "B", SignalType.BULLISH, age_hours=40),
+        ]
+        window = SignalWindow(hours=24)
+        window.add_many(signals)
+        window.expire()
+
+        live = [s for s in signals if s.timestamp > datetime.now() - timedelta(hours=24)]
+        expected = analyzer.analyze("NVDA", live)
+        actual = analyzer.analyze_aggregate(window.get("NVDA"))
+
+        fields = {"timestamp"}
+        assert actual.model_dump(exclude=fields) == expected.model_dump(exclude=fields)
+        assert actual.total_signals == 3
+        assert actual.contrarian_index == pytest.approx(-1.0)
+        assert actual.cross_platform_divergence is True
+
+    def test_empty_aggregate(self) -> None:
+        """Test that an empty aggregate yields empty metrics."""
+        analyzer = DiversityAnalyzer([])
+        metrics = analyzer.analyze_aggregate(TickerAggregate("NONE"))
+        assert metrics.total_signals == 0
+        assert metrics.is_echo_chamber is False
@@ -0,0 +1,104 @@
+"""Unit tests for adaptive per-source scheduling."""
+from typing import List, Optional
+from src.core.engine import CycleStats
+from src.core.source_scheduler import SourceScheduler
+from src.models.schemas import Source
+
+HOUR = 3600.0
+
+
+def make_source(name: str, weight: float = 1.0) -> Source:
+    return Source(name=name, url=f"https://example.com/{name}", weight=weight)
+
+
+def make_scheduler(**kwargs) -> SourceScheduler:
+    params = dict(base_interval=HOUR, min_interval=300.0, max_interval=6 * HOUR, jitter=0.0, seed=1)
+    params.update(kwargs)
+    return SourceScheduler(**params)
+
+
+class FakeEngine:
+    """Collects the source lists it is asked to run."""
+
+    def __init__(self, sources: List[Source], stats: Optional[CycleStats] = None):
+        self.sources = sources
+        self.stats = stats or CycleStats()
+        self.cycles: List[List[str]] = []
+
+    async def run_cycle(self, sources: Optional[List[Source]] = None) -> CycleStats:
+        self.cycles.append([s.name for s in sources])
+        return self.stats
+
+
+class TestSourceScheduler:
+    """Test cases for SourceScheduler."""
+
+    def test_new_sources_are_staggered(self) -> None:
+        """Test that new sources are spread over min_interval instead of all due at once."""
+        scheduler = make_scheduler()
+        scheduler.sync([make_source(f"s{i}") for i in range(4)], now=0.0)
+        assert [s.name for s in scheduler.due(now=0.0)] == ["s0"]
+        assert [s.name for s in scheduler.due(now=150.0)] == ["s1", "s2"]
+        assert scheduler.next_due_in(now=150.0) == 75.0
+
+    def test_weight_shortens_interval(self) -> None:
+        """Test that a heavier source is fetched more often before its rate is known."""
+        scheduler = make_scheduler()
+        scheduler.sync([make_source("light"), make_source("heavy", weight=4.0)], now=0.0)
+        assert scheduler.get("light").interval == HOUR
+        assert scheduler.get("heavy").interval == HOUR / 4
+
+    def test_interval_follows_post_rate(self) -> None:
+        """Test that busy sources speed up and quiet ones back off to max_interval."""
+        scheduler = make_scheduler(ewma_alpha=1.0)
+        scheduler.sync([make_source("busy"), make_source("quiet")], now=0.0)
+        for name in ("busy", "quiet"):
+            scheduler.record(name, 50, now=0.0)  # First fetch: backlog only
+        assert scheduler.get("busy").rate is None
+
+        scheduler.record("busy", 6, now=HOUR)     # 6 signals/hour -> every 10 min
+        scheduler.record("quiet", 0, now=HOUR)
+        assert scheduler.get("busy").interval == HOUR / 6
+        assert scheduler.get("quiet").interval == 6 * HOUR
+        assert scheduler.get("busy").next_due == HOUR + HOUR / 6
+
+        scheduler.record("busy", 100, now=HOUR + 60)  # Never faster than min_interval
+        assert scheduler.get("busy").interval == 300.0
+
+    def test_errors_back_off(self) -> None:
+        """Test that consecutive errors double the interval and a success resets it."""
+        scheduler = make_scheduler()
+        scheduler.sync([make_source("flaky")], now=0.0)
+        scheduler.record("flaky", 0, error=True, now=0.0)
+        assert scheduler.get("flaky").interval == 2 * HOUR
+        scheduler.record("flaky", 0, error=True, now=0.0)
+        scheduler.record("flaky", 0, error=True, now=0.0)
+        assert scheduler.get("flaky").interval == 6 * HOUR  # Capped
+        scheduler.record("flaky", 0, now=0.0)
+        assert scheduler.get("flaky").errors == 0
+        assert scheduler.get("flaky").interval == HOUR
+
+    def test_sync_drops_removed_sources(self) -> None:
+        """Test that removed sources leave the queue and duplicates are tracked once."""
+        scheduler = make_scheduler()
+        scheduler.sync([make_source("a"), make_source("b"), make_source("a")], now=0.0)
+        assert len(scheduler) == 2
+        scheduler.sync([make_source("b")], now=0.0)
+        assert [s.name for s in scheduler.due(now=HOUR)] == ["b"]
+        assert scheduler.next_due_in() is None
+
+    async def test_run_due_runs_only_due_sources(self) -> None:
+        """Test that run_due fetches the due subset and records its outcome."""
+        sources = [make_source("a"), make_source("b")]
+        stats = CycleStats(new_by_source={"a": 3}, failed_sources={"b"})
+        engine = FakeEngine(sources, stats)
+        scheduler = make_scheduler(min_interval=HOUR)
+
+        assert await scheduler.run_due(engine) == 1
+        assert engine.cycles == [["a"]]
+        assert scheduler.get("a").last_fetch is not None
+        assert scheduler.get("b").errors == 0
+
+        assert await scheduler.run_due(engine, window=HOUR / 2) == 1
+        assert engine.cycles[-1] == ["b"]
+        assert scheduler.get("b").errors == 1
@@ -0,0 +1,96 @@
+"""Unit tests for the asynchronous Telegram outbound queue."""
+import asyncio
+import time
+import httpx
+import pytest
+from src.utils.teleporter import DeliveryResult, Teleporter
+from src.utils.telegram_queue import TelegramQueue
+
+
+class ScriptedTeleporter(Teleporter):
+    """Teleporter whose sends return queued results (ok once the script runs out)."""
+
+    def __init__(self, results=None, delay: float = 0.0):
+        super().__init__()
+        self.results = list(results or [])
+        self.delay = delay
+        self.calls = []
+
+    async def deliver(self, client, message_text: str, chat_id: str) -> DeliveryResult:
+        self.calls.append((time.monotonic(), message_text, chat_id))
+        await asyncio.sleep(self.delay)
+        return self.results.pop(0) if self.results else DeliveryResult(ok=True)
+
+
+@pytest.fixture(autouse=True)
+def telegram_env(monkeypatch):
+    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_token")
+    monkeypatch.setenv("TELEGRAM_CHANNEL_ID", "test_channel")
+
+
+class TestTelegramQueue:
+    """Test cases for TelegramQueue."""
+
+    async def test_enqueue_does_not_wait_for_delivery(self) -> None:
+        """Test that enqueueing returns at once and drain waits for the sends."""
+        teleporter = ScriptedTeleporter(delay=0.1)
+        queue = TelegramQueue(teleporter, workers=2, chat_rate=0)
+        start = time.monotonic()
+        for i in range(4):
+            assert queue.enqueue(f"alert {i}", "chat")
+        assert time.monotonic() - start < 0.05
+        assert await queue.drain(timeout=5)
+        assert queue.sent == 4
+        assert sorted(text for _, text, _ in teleporter.calls) == [f"alert {i}" for i in range(4)]
+
+    async def test_retry_after_is_honored(self) -> None:
+        """Test that a 429 pauses the chat for retry_after before the retry."""
+        teleporter = ScriptedTeleporter([DeliveryResult(ok=False, retry_after=0.3)])
+        queue = TelegramQueue(teleporter, workers=1, chat_rate=0)
+        queue.enqueue("alert", "chat")
+        assert await queue.drain(timeout=5)
+        assert queue.sent == 1
+        first, second = teleporter.calls[0][0], teleporter.calls[1][0]
+        assert second - first >= 0.3
+
+    async def test_permanent_failure_is_not_retried(self) -> None:
+        """Test that a non-429 client error gives up after one attempt."""
+        teleporter = ScriptedTeleporter([DeliveryResult(ok=False, permanent=True)])
+        queue = TelegramQueue(teleporter, workers=1, chat_rate=0)
+        queue.enqueue("alert", "chat")
+        assert await queue.drain(timeout=5)
+        assert len(teleporter.calls) == 1
+        assert queue.failed == 1
+
+    async def test_per_chat_rate_limit(self) -> None:
+        """Test that one chat is paced while another chat is not held up."""
+        teleporter = ScriptedTeleporter()
+        queue = TelegramQueue(teleporter, workers=4, chat_rate=10, chat_burst=1)
+        for _ in range(3):
+            queue.enqueue("slow", "busy_chat")
+        queue.enqueue("fast", "quiet_chat")
+        assert await queue.drain(timeout=5)
+        busy = sorted(t for t, _, chat in teleporter.calls if chat == "busy_chat")
+        quiet = [t for t, _, chat in teleporter.calls if chat == "quiet_chat"]
+        # 10/s with no burst: sends to the busy chat are ~0.1 s apart
+        assert busy[2] - busy[1] >= 0.08
+        assert quiet[0] - busy[0] < 0.05
+
+    async def test_full_queue_drops(self) -> None:
+        """Test that messages beyond max_size are dropped, not blocked on."""
+        queue = TelegramQueue(ScriptedTeleporter(delay=0.05), workers=1, max_size=1, chat_rate=0)
+        results = [queue.enqueue(f"alert {i}", "chat") for i in range(3)]
+        assert results.count(False) >= 1
+        await queue.drain(timeout=5)
+        assert queue.dropped == results.count(False)
+
+    async def test_deliver_reads_retry_after(self) -> None:
+        """Test that Teleporter.deliver surfaces retry_after from a 429 response."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(429, json={"ok": False, "parameters": {"retry_after": 7}})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            result = await Teleporter().deliver(client, "alert", "chat")
+        assert not result.ok
+        assert result.retry_after == 7
+        assert not result.permanent
@@ -0,0 +1,57 @@
+"""Unit tests for the ticker universe index."""
+import os
+import pytest
+from src.core.ticker_universe import TickerUniverse
+
+
+@pytest.fixture
+def universe_file(tmp_path) -> str:
+    path = tmp_path / "tickers.txt"
+    path.write_text("# comment\n[us]\nAAPL NVDA  # inline comment\n[crypto]\n$BTC\n")
+    return str(path)
+
+
+class TestTickerUniverse:
+    """Test cases for TickerUniverse."""
+
+    def test_load_and_lookup(self, universe_file: str) -> None:
+        """Test parsing of sections, comments and cashtag-prefixed entries."""
+        universe = TickerUniverse(universe_file)
+        assert universe.loaded
+        assert universe.symbols == {"AAPL", "NVDA", "BTC"}
+        assert universe.is_known("NVDA")
+        assert not universe.is_known("WOW")
+
+    def test_cn_codes_by_exchange_prefix(self, universe_file: str) -> None:
+        """Test that A-share codes are accepted by prefix, other numbers are not."""
+        universe = TickerUniverse(universe_file)
+        assert universe.is_known("600519")
+        assert universe.is_known("300750")
+        assert not universe.is_known("123456")
+        assert not universe.is_known("202601")
+
+    def test_hot_reload_on_mtime_change(self, universe_file: str) -> None:
+        """Test that edits are picked up without recreating the object."""
+        universe = TickerUniverse(universe_file, check_interval=0)
+        assert not universe.maybe_reload()
+
+        with open(universe_file, "a") as f:
+            f.write("TSLA\n")
+        stat = os.stat(universe_file)
+        os.utime(universe_file, (stat.st_atime, stat.st_mtime + 10))
+
+        assert universe.maybe_reload()
+        assert universe.is_known("TSLA")
+
+    def test_reload_is_throttled(self, universe_file: str) -> None:
+        """Test that mtime is not checked more often than check_interval."""
+        universe = TickerUniverse(universe_file, check_interval=3600)
+        stat = os.stat(universe_file)
+        os.utime(universe_file, (stat.st_atime, stat.st_mtime + 10))
+        assert not universe.maybe_reload()
+        assert universe.maybe_reload(force=True)
+
+    def test_missing_file(self, tmp_path) -> None:
+        """Test that a missing file disables validation instead of failing."""
+        universe = TickerUniverse(str(tmp_path / "missing.txt"))
+        assert not universe.loaded
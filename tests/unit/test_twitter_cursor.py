@@ -0,0 +1,142 @@
+"""Unit tests for incremental TwitterAdapter fetching."""
+from typing import AsyncIterator, Dict, List, Optional
+from src.core.bird import BirdError
+from src.core.fetcher import TwitterAdapter
+from src.models.schemas import Source, SourceCursor, PlatformType
+
+
+class MemoryCursorStore:
+    """In-memory stand-in for the Database cursor methods."""
+
+    def __init__(self):
+        self.cursors: Dict[str, SourceCursor] = {}
+
+    async def get_source_cursor(self, source_name: str) -> Optional[SourceCursor]:
+        return self.cursors.get(source_name)
+
+    async def save_source_cursor(self, cursor: SourceCursor) -> None:
+        self.cursors[cursor.source_name] = cursor
+
+
+class FakeTimeline(TwitterAdapter):
+    """TwitterAdapter whose bird call serves the newest `n` tweets of a list."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tweets: List[dict] = []
+        self.calls: List[int] = []
+
+    def post(self, count: int) -> None:
+        start = len(self.tweets) + 1
+        for i in range(start, start + count):
+            self.tweets.insert(0, {"id_str": str(1000 + i), "full_text": f"tweet {i}"})
+
+    async def _stream_bird(self, username: str, count: int) -> AsyncIterator[dict]:
+        self.calls.append(count)
+        for tweet in self.tweets[:count]:
+            yield tweet
+
+
+def make_adapter(store: MemoryCursorStore) -> FakeTimeline:
+    source = Source(name="Vista", url="https://x.com/vista8", platform=PlatformType.TWITTER)
+    return FakeTimeline(source, cursor_store=store, min_depth=5, max_depth=40)
+
+
+async def fetch(adapter: TwitterAdapter) -> List[dict]:
+    """Fetch, then commit the cursor as the engine does once signals are saved."""
+    tweets = await adapter.fetch()
+    await adapter.commit()
+    return tweets
+
+
+class TestTwitterCursor:
+    """Test cases for since-id cursors and adaptive depth."""
+
+    async def test_only_new_tweets_returned(self) -> None:
+        """Test that a second fetch only returns tweets newer than the cursor."""
+        store = MemoryCursorStore()
+        adapter = make_adapter(store)
+        adapter.post(3)
+        assert len(await fetch(adapter)) == 3
+        assert store.cursors["Vista"].last_seen_id == "1003"
+
+        assert await fetch(adapter) == []
+        adapter.post(2)
+        fresh = await fetch(adapter)
+        assert [t["id_str"] for t in fresh] == ["1005", "1004"]
+
+    async def test_burst_is_refetched_deeper(self) -> None:
+        """Test that a burst larger than the depth is fetched in full."""
+        store = MemoryCursorStore()
+        adapter = make_adapter(store)
+        adapter.post(5)
+        await fetch(adapter)
+
+        adapter.post(12)
+        fresh = await fetch(adapter)
+        assert len(fresh) == 12
+        assert adapter.calls[-2:] == [10, 20]
+        assert store.cursors["Vista"].fetch_depth == 20
+
+    async def test_quiet_account_shrinks_depth(self) -> None:
+        """Test that depth decays back toward the minimum when little is posted."""
+        store = MemoryCursorStore()
+        store.cursors["Vista"] = SourceCursor("Vista", "1000", 40)
+        adapter = make_adapter(store)
+        adapter.post(1)
+        await fetch(adapter)
+        assert store.cursors["Vista"].fetch_depth == 20
+
+    async def test_failed_fetch_keeps_cursor(self) -> None:
+        """Test that an empty bird result leaves the cursor untouched."""
+        store = MemoryCursorStore()
+        store.cursors["Vista"] = SourceCursor("Vista", "1003", 10)
+        adapter = make_adapter(store)
+        assert await fetch(adapter) == []
+        assert store.cursors["Vista"].fetch_depth == 10
+
+    async def test_tweets_without_id_pass_through(self) -> None:
+        """Test that tweets the cursor can't order are passed on once, not dropped."""
+        store = MemoryCursorStore()
+        store.cursors["Vista"] = SourceCursor("Vista", "1003", 5)
+        adapter = make_adapter(store)
+        adapter.tweets = [{"full_text": "no id"}, {"full_text": "no id"}, {"id_str": "1001", "full_text": "old"}]
+        assert [t["full_text"] for t in await fetch(adapter)] == ["no id"]
+        assert store.cursors["Vista"].last_seen_id == "1003"
+
+    async def test_partial_bird_run_keeps_cursor(self) -> None:
+        """Test that tweets printed before bird failed are passed on but the cursor stays."""
+        store = MemoryCursorStore()
+        store.cursors["Vista"] = SourceCursor("Vista", "1000", 5)
+        adapter = make_adapter(store)
+        adapter.post(3)
+        stream = adapter._stream_bird
+
+        async def failing(username: str, count: int) -> AsyncIterator[dict]:
+            async for tweet in stream(username, count):
+                yield tweet
+                raise BirdError("connection reset")
+
+        adapter._stream_bird = failing
+        assert [t["id_str"] for t in await fetch(adapter)] == ["1003"]
+        assert adapter.failed
+        assert store.cursors["Vista"].last_seen_id == "1000"
+
+    def test_tweet_id_sources(self) -> None:
+        """Test that IDs are read from id fields or the status URL."""
+        assert TwitterAdapter.tweet_id({"id": 42}) == 42
+        assert TwitterAdapter.tweet_id({"rest_id": "77"}) == 77
+        assert TwitterAdapter.tweet_id({"url": "https://x.com/a/status/1234"}) == 1234
+        assert TwitterAdapter.tweet_id({"full_text": "no id"}) is None
+
+    async def test_cursor_waits_for_commit(self) -> None:
+        """Test that an uncommitted fetch (e.g. the save failed) refetches the same tweets."""
+        store = MemoryCursorStore()
+        store.cursors["Vista"] = SourceCursor("Vista", "1000", 5)
+        adapter = make_adapter(store)
+        adapter.post(3)
+        assert len(await adapter.fetch()) == 3
+        assert store.cursors["Vista"].last_seen_id == "1000"
+
+        assert len(await fetch(adapter)) == 3
+        assert store.cursors["Vista"].last_seen_id == "1003"
@@ -0,0 +1,102 @@
+"""Unit tests for conditional GET and content-hash change detection."""
+import httpx
+from src.core.adapter_web import GenericAdapter
+from src.core.validator_cache import ValidatorCache
+from src.models.schemas import Source, PlatformType
+
+URL = "https://blog.example.com/post"
+
+
+def page(body: str, footer: str = "") -> str:
+    return f"<html><body><p>{body}</p><span>{footer}</span></body></html>"
+
+
+class FakeSite:
+    """Serves one page, honouring If-None-Match like a real server."""
+
+    def __init__(self, html: str, etag: str = None):
+        self.html = html
+        self.etag = etag
+        self.requests = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.etag and request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304)
+        headers = {"ETag": self.etag} if self.etag else {}
+        return httpx.Response(200, text=self.html, headers=headers)
+
+
+async def fetch(site: FakeSite, cache: ValidatorCache, commit: bool = True):
+    """Fetch once; commit() as the engine does after the signals are saved."""
+    source = Source(name="Blog", url=URL, platform=PlatformType.GENERIC)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(site.handler)) as client:
+        adapter = GenericAdapter(source, client=client, cache=cache)
+        items = await adapter.fetch()
+        if commit:
+            await adapter.commit()
+        return items
+
+
+class TestValidatorCache:
+    """Test cases for ValidatorCache with GenericAdapter."""
+
+    async def test_etag_not_modified(self) -> None:
+        """Test that the stored ETag is sent and a 304 yields no items."""
+        site = FakeSite(page("Buy $NVDA before the earnings breakout next week"), etag='"v1"')
+        cache = ValidatorCache()
+
+        assert len(await fetch(site, cache)) == 1
+        assert await fetch(site, cache) == []
+        assert site.requests[1].headers["If-None-Match"] == '"v1"'
+        assert cache.stats["not_modified"] == 1
+
+    async def test_identical_body_skips_parsing(self) -> None:
+        """Test that a server without validators still short-circuits on identical bytes."""
+        site = FakeSite(page("Buy $NVDA before the earnings breakout next week"))
+        cache = ValidatorCache()
+
+        assert len(await fetch(site, cache)) == 1
+        assert await fetch(site, cache) == []
+        assert cache.stats["body_unchanged"] == 1
+
+    async def test_same_text_different_markup(self) -> None:
+        """Test that noise outside the extracted text does not re-trigger extraction."""
+        site = FakeSite(page("Buy $NVDA before the earnings breakout next week", footer="t=1"))
+        cache = ValidatorCache()
+        assert len(await fetch(site, cache)) == 1
+
+        site.html = page("Buy $NVDA before the earnings breakout next week", footer="t=2")
+        assert await fetch(site, cache) == []
+        assert cache.stats["text_unchanged"] == 1
+
+    async def test_changed_content_is_returned(self) -> None:
+        """Test that a real content change is fetched and parsed again."""
+        site = FakeSite(page("Buy $NVDA before the earnings breakout next week"))
+        cache = ValidatorCache()
+        await fetch(site, cache)
+
+        site.html = page("Sell $TSLA, the breakdown below support is confirmed")
+        items = await fetch(site, cache)
+        assert "TSLA" in items[0]["full_text"]
+        assert cache.stats["changed"] == 2
+
+    def test_conditional_headers(self) -> None:
+        """Test that both validators are turned into request headers."""
+        cache = ValidatorCache()
+        assert cache.conditional_headers(URL) == {}
+        cache.store(URL, '"abc"', "Wed, 01 Jan 2025 00:00:00 GMT", b"x")
+        assert cache.conditional_headers(URL) == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+
+    async def test_uncommitted_page_is_fetched_again(self) -> None:
+        """Test that a page whose signals were not saved is not treated as unchanged."""
+        site = FakeSite(page("Buy $NVDA before the earnings breakout next week"), etag='"v1"')
+        cache = ValidatorCache()
+
+        assert len(await fetch(site, cache, commit=False)) == 1
+        assert "If-None-Match" not in site.requests[0].headers
+        assert len(await fetch(site, cache)) == 1
+        assert await fetch(site, cache) == []